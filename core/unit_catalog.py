@@ -6,7 +6,8 @@ UI에서 콤보박스로 선택할 수 있도록, 고정된 분류표를 제공
 
 from __future__ import annotations
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 # NOTE: Python dict는 삽입 순서를 보존하므로, 아래 순서가 UI 표시 순서가 됩니다.
@@ -84,14 +85,17 @@ UNIT_CATALOG: Dict[str, Dict[str, List[str]]] = {
 }
 
 
-def list_subjects() -> List[str]:
-    return list(UNIT_CATALOG.keys())
+# 분류표는 실행 중 바뀌지 않으므로 조회 결과를 캐시(불변 tuple로 반환)
+@lru_cache(maxsize=None)
+def list_subjects() -> Tuple[str, ...]:
+    return tuple(UNIT_CATALOG.keys())
 
 
-def list_major_units(subject: str) -> List[str]:
-    return list(UNIT_CATALOG.get(subject, {}).keys())
+@lru_cache(maxsize=None)
+def list_major_units(subject: str) -> Tuple[str, ...]:
+    return tuple(UNIT_CATALOG.get(subject, {}).keys())
 
 
-def list_sub_units(subject: str, major_unit: str) -> List[str]:
-    return list(UNIT_CATALOG.get(subject, {}).get(major_unit, []))
-
+@lru_cache(maxsize=None)
+def list_sub_units(subject: str, major_unit: str) -> Tuple[str, ...]:
+    return tuple(UNIT_CATALOG.get(subject, {}).get(major_unit, []))
@@ -12,6 +12,17 @@ from core.models import Exam
 from database.sqlite_connection import SQLiteConnection, row_to_dict
 
 
+# list_all 전용: Exam 필드 순서대로 컬럼을 골라 튜플 행을 위치 인자로 바로 생성
+_LIST_ALL_SQL = (
+    "SELECT id, grade, semester, exam_type, school_name, year,"
+    " created_at, parsed_at, is_parsed, problem_count"
+    " FROM exams ORDER BY created_at DESC"
+)
+
+# SQLite 바인드 변수 상한(구버전 999)을 넘지 않도록 IN (...) 목록을 나눠서 실행
+_IN_CHUNK = 500
+
+
 class ExamRepository:
     def __init__(self, db_connection: SQLiteConnection):
         self._db = db_connection
@@ -73,10 +84,20 @@ class ExamRepository:
 
     def list_all(self) -> List[Exam]:
         try:
-            rows = self._db.get_conn().execute(
-                "SELECT * FROM exams ORDER BY created_at DESC"
-            ).fetchall()
-            return [Exam.from_dict(_exam_row_to_dict(r)) for r in rows]
+            # sqlite3.Row → dict → from_dict 변환을 거치지 않도록 튜플 커서 사용
+            cur = self._db.get_conn().cursor()
+            cur.row_factory = None
+            rows = cur.execute(_LIST_ALL_SQL).fetchall()
+            return [
+                Exam(
+                    str(eid), grade or "", semester or "", exam_type or "", school_name or "", year or "",
+                    _parse_dt(created_at), _parse_dt(parsed_at), bool(is_parsed), problem_count or 0,
+                )
+                for (
+                    eid, grade, semester, exam_type, school_name, year,
+                    created_at, parsed_at, is_parsed, problem_count,
+                ) in rows
+            ]
         except Exception:
             return []
 
@@ -135,6 +156,35 @@ class ExamRepository:
         except Exception:
             return False
 
+    def delete_many(self, exam_ids: List[str]) -> List[str]:
+        """
+        여러 기출을 IN (...) 문으로 한 번에 삭제하고 커밋.
+
+        앞서 commit=False로 실행한 연결 문제 삭제도 같은 트랜잭션으로 함께 커밋된다.
+
+        Returns:
+            실제로 삭제된 기출 id 목록 (실패 시 롤백 후 빈 목록)
+        """
+        ids = [int(x) for x in exam_ids if x]
+        if not ids:
+            return []
+        conn = self._db.get_conn()
+        deleted: List[str] = []
+        try:
+            for i in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[i:i + _IN_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT id FROM exams WHERE id IN ({marks})", chunk
+                ).fetchall()
+                conn.execute(f"DELETE FROM exams WHERE id IN ({marks})", chunk)
+                deleted.extend(str(r[0]) for r in rows)
+            conn.commit()
+            return deleted
+        except Exception:
+            conn.rollback()
+            return []
+
 
 def _exam_row_to_dict(row) -> dict:
     d = row_to_dict(row)
@@ -13,6 +13,10 @@ from core.models import Problem, SourceType
 from database.sqlite_connection import SQLiteConnection, row_to_dict, json_col
 
 
+# SQLite 바인드 변수 상한(구버전 999)을 넘지 않도록 IN (...) 목록을 나눠서 실행
+_IN_CHUNK = 500
+
+
 def _parse_json(s, default):
     if not s:
         return default
@@ -98,6 +102,29 @@ class ProblemRepository:
         except Exception:
             return []
 
+    def find_by_source_for_list(self, source_id: str, source_type: SourceType) -> List[tuple]:
+        """
+        목록 화면용 경량 조회: Problem 객체를 만들지 않고 필요한 컬럼만 튜플로 반환.
+
+        Returns:
+            [(id, problem_index, content_raw_file_id, content_text, tags_json, created_at, original_hwp_path), ...]
+            problem_index, id 순 정렬
+        """
+        if not self._db.is_connected():
+            raise ConnectionError("DB에 연결되지 않았습니다.")
+        try:
+            cur = self._db.get_conn().cursor()
+            cur.row_factory = None
+            return cur.execute(
+                "SELECT id, problem_index, content_raw_file_id, content_text, tags_json,"
+                " created_at, original_hwp_path"
+                " FROM problems WHERE source_id = ? AND source_type = ?"
+                " ORDER BY problem_index, id",
+                (source_id, source_type.value),
+            ).fetchall()
+        except Exception:
+            return []
+
     def search_by_text(self, keyword: str) -> List[Problem]:
         try:
             rows = self._db.get_conn().execute(
@@ -140,6 +167,42 @@ class ProblemRepository:
         except Exception:
             return False
 
+    def update_tags_many(self, problems: List[Problem]) -> int:
+        """
+        여러 Problem의 tags_json을 UPDATE ... CASE id WHEN ? THEN ? ... END 한 문장으로 저장.
+
+        Returns:
+            갱신된 행 수
+        """
+        rows = [p for p in problems if p.id]
+        if not rows:
+            return 0
+        conn = self._db.get_conn()
+        updated = 0
+        try:
+            # CASE 절은 행마다 바인드 변수 2개를 쓰므로 IN 목록의 절반 크기로 나눔
+            step = _IN_CHUNK // 2
+            for i in range(0, len(rows), step):
+                chunk = rows[i:i + step]
+                case_params: list = []
+                for p in chunk:
+                    case_params.append(int(p.id))
+                    case_params.append(json_col([t.to_dict() for t in (p.tags or [])]))
+                id_params = [int(p.id) for p in chunk]
+                cur = conn.execute(
+                    "UPDATE problems SET tags_json = CASE id "
+                    + " ".join("WHEN ? THEN ?" for _ in chunk)
+                    + " ELSE tags_json END"
+                    + f" WHERE id IN ({','.join('?' * len(chunk))})",
+                    case_params + id_params,
+                )
+                updated += max(cur.rowcount, 0)
+            conn.commit()
+            return updated
+        except Exception:
+            conn.rollback()
+            return 0
+
     def delete(self, problem_id: str) -> bool:
         if not self._db.is_connected():
             raise ConnectionError("DB에 연결되지 않았습니다.")
@@ -153,6 +216,49 @@ class ProblemRepository:
         except Exception:
             return False
 
+    def delete_by_sources(
+        self, source_ids: List[str], source_type: SourceType, commit: bool = True
+    ) -> int:
+        """
+        여러 출처에 연결된 Problem과 HWP 원본(file_store)을 IN (...) 문으로 한 번에 삭제.
+
+        commit=False면 호출자가 같은 트랜잭션에서 다른 삭제와 묶어 커밋한다.
+        실패하면 롤백 후 예외를 그대로 올려, 호출자가 이어지는 삭제를 중단할 수 있게 한다.
+
+        Returns:
+            삭제된 Problem 개수
+        """
+        if not self._db.is_connected():
+            raise ConnectionError("DB에 연결되지 않았습니다.")
+        ids = [int(x) for x in source_ids if x]
+        if not ids:
+            return 0
+        conn = self._db.get_conn()
+        deleted = 0
+        try:
+            for i in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[i:i + _IN_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                params = (*chunk, source_type.value)
+                conn.execute(
+                    "DELETE FROM file_store WHERE id IN ("
+                    " SELECT content_raw_file_id FROM problems"
+                    f" WHERE source_id IN ({marks}) AND source_type = ?"
+                    " AND content_raw_file_id IS NOT NULL)",
+                    params,
+                )
+                cur = conn.execute(
+                    f"DELETE FROM problems WHERE source_id IN ({marks}) AND source_type = ?",
+                    params,
+                )
+                deleted += max(cur.rowcount, 0)
+            if commit:
+                conn.commit()
+            return deleted
+        except Exception:
+            conn.rollback()
+            raise
+
     def batch_create(self, problems: List[tuple]) -> List[str]:
         ids = []
         for problem, hwp_bytes in problems:
@@ -164,22 +270,26 @@ class ProblemRepository:
         return ids
 
     def list_by_ids(self, problem_ids: List[str]) -> List[Problem]:
+        """
+        여러 Problem을 IN (...) 문으로 조회(요청 순서 유지).
+
+        일괄 저장의 조회 단계로 쓰이므로 오류는 빈 목록으로 삼키지 않고 그대로 올린다.
+        """
         ids = [str(x).strip() for x in (problem_ids or []) if str(x).strip()]
         if not ids:
             return []
-        try:
-            placeholders = ",".join("?" * len(ids))
-            int_ids = [int(x) for x in ids]
-            rows = self._db.get_conn().execute(
-                f"SELECT * FROM problems WHERE id IN ({placeholders})",
-                int_ids,
+        int_ids = [int(x) for x in ids]
+        conn = self._db.get_conn()
+        by_id = {}
+        for i in range(0, len(int_ids), _IN_CHUNK):
+            chunk = int_ids[i:i + _IN_CHUNK]
+            rows = conn.execute(
+                f"SELECT * FROM problems WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
             ).fetchall()
-            by_id = {}
             for row in rows:
                 d = row_to_dict(row)
                 d["content_raw_file_id"] = str(d["content_raw_file_id"]) if d.get("content_raw_file_id") else None
                 d["tags"] = _parse_json(d.get("tags_json"), [])
                 by_id[str(d["_id"])] = Problem.from_dict(d)
-            return [by_id[pid] for pid in ids if pid in by_id]
-        except Exception:
-            return []
+        return [by_id[pid] for pid in ids if pid in by_id]
@@ -179,6 +179,34 @@ CREATE INDEX IF NOT EXISTS ix_saved_reports_student_created ON saved_reports(stu
 """
 
 
+# WAL: 쓰기(파싱/재파싱) 중에도 다른 연결의 읽기가 막히지 않음. 나머지는 캐시/임시저장 튜닝
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+# 워커 전용 연결의 잠금 대기 시간(초). WAL 쓰기 잠금을 메인 연결과 다투므로 기본 5초보다 길게
+_WORKER_BUSY_TIMEOUT_S = 30.0
+
+
+def _open(
+    path: str, *, check_same_thread: bool = True, timeout: float = 5.0
+) -> sqlite3.Connection:
+    # 메인 연결은 기본 검사를 유지(다른 스레드에서 쓰면 ProgrammingError로 바로 드러나도록)
+    conn = sqlite3.connect(path, timeout=timeout, check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.DatabaseError:
+            pass
+    return conn
+
+
 class SQLiteConnection:
     """SQLite 단일 파일 연결. is_connected / get_conn / get_file_store 만 노출."""
 
@@ -193,8 +221,7 @@ class SQLiteConnection:
             parent = os.path.dirname(self._path)
             if parent:
                 os.makedirs(parent, exist_ok=True)
-            self._conn = sqlite3.connect(self._path)
-            self._conn.row_factory = sqlite3.Row
+            self._conn = _open(self._path)
             self._conn.executescript(_schema_sql())
             self._conn.commit()
             self._file_store = FileStore(self._conn)
@@ -202,6 +229,29 @@ class SQLiteConnection:
         except Exception:
             return False
 
+    def _open_separate(self) -> "SQLiteConnection":
+        # 스키마 초기화는 메인 연결(connect)에서 이미 끝났으므로 생략
+        other = SQLiteConnection(self._path)
+        # 워커 스레드 한 곳에서만 쓰고 닫는 전용 연결이므로 검사 해제
+        other._conn = _open(self._path, check_same_thread=False, timeout=_WORKER_BUSY_TIMEOUT_S)
+        other._file_store = FileStore(other._conn)
+        return other
+
+    def open_reader(self) -> "SQLiteConnection":
+        """
+        같은 DB 파일에 대한 별도 연결(워커 스레드 조회용, 사용 후 disconnect).
+        WAL 모드라 메인 연결의 쓰기와 동시에 읽을 수 있음.
+        """
+        return self._open_separate()
+
+    def open_writer(self) -> "SQLiteConnection":
+        """
+        같은 DB 파일에 대한 별도 쓰기 연결(워커 스레드의 파싱·재파싱·미리보기 저장용, 사용 후 disconnect).
+        메인 연결과 트랜잭션을 공유하지 않으므로 워커의 삭제·재삽입은 commit 전까지 다른 연결에 보이지 않고,
+        실패해 commit 없이 닫히면 통째로 롤백됨.
+        """
+        return self._open_separate()
+
     def disconnect(self) -> None:
         if self._conn:
             try:
@@ -7,6 +7,7 @@ Problem 데이터 조회, 검증, 요약 정보 제공을 담당합니다.
 - UI 연동을 고려한 데이터 구조 반환
 """
 from typing import List, Optional, Dict, Any, Callable
+import json
 import re
 import os
 import tempfile
@@ -15,6 +16,17 @@ from database.sqlite_connection import SQLiteConnection
 from core.models import Problem, SourceType, Tag
 
 
+def _load_tags(tags_json) -> list:
+    """problems.tags_json 문자열 → 태그 dict 리스트(손상 시 빈 리스트)"""
+    if not tags_json:
+        return []
+    try:
+        data = json.loads(tags_json)
+    except Exception:
+        return []
+    return data if isinstance(data, list) else []
+
+
 class ProblemService:
     """Problem 조회 및 관리 서비스"""
 
@@ -119,7 +131,7 @@ class ProblemService:
                 {
                     'problem_id': str,
                     'problem_index': int,
-                    'content_text_preview': str,  # 앞 200자
+                    'content_text_preview': str,  # 앞 200자(공백 압축, 항상 str)
                     'has_content_raw': bool,
                     'tags': List[Dict] or None,
                     'created_at': str or None,
@@ -136,15 +148,15 @@ class ProblemService:
                 "DB에 연결되지 않았습니다. 데이터를 조회할 수 없습니다."
             )
         
-        # Problem 목록 조회
-        problems = self.problem_repo.find_by_source(source_id, source_type)
+        # Problem 목록 조회(목록에 필요한 컬럼만, problem_index 순)
+        rows = self.problem_repo.find_by_source_for_list(source_id, source_type)
         
         # UI 연동용 구조로 변환
         result: List[Dict[str, Any]] = []
-        for problem in problems:
+        for pid, problem_index, raw_file_id, content_text, tags_json, created_at, hwp_path in rows:
             # content_text 미리보기 (앞 200자)
             # ✅ 조회 단계에서만 프리뷰 텍스트를 "문제처럼 보이는 구간"으로 보정
-            raw_text_for_preview = self._extract_best_preview_text(problem.content_text or "")
+            raw_text_for_preview = self._extract_best_preview_text(content_text or "")
 
             # - 목록에서 개행/공백만 있으면 "빈칸처럼" 보일 수 있어 공백을 압축한 값을 사용
             compact_text = " ".join(raw_text_for_preview.split())  # 모든 공백/개행을 단일 공백으로 정규화
@@ -155,22 +167,21 @@ class ProblemService:
                     preview += "..."
             else:
                 # 텍스트가 없더라도 "미리보기 없음"을 표시해 UI가 비어 보이지 않게 함
-                if problem.content_raw_file_id is not None:
+                if raw_file_id:
                     preview = "(텍스트 미리보기 없음: 수식/그림/표 위주)"
                 else:
                     preview = "(텍스트 미리보기 없음)"
             
-            # tags 정보 변환
-            tags_data = None
-            if problem.tags:
-                tags_data = [tag.to_dict() for tag in problem.tags]
+            # tags 정보 변환 (레거시 unit 복원은 Tag.from_dict 규칙 그대로)
+            tags = [Tag.from_dict(t) for t in (_load_tags(tags_json) or [])]
+            tags_data = [tag.to_dict() for tag in tags] if tags else None
 
             # difficulty 추출 (UI 편의용): 대표 태그 우선, 없으면 fallback
             difficulty = None
-            if problem.tags and len(problem.tags) > 0:
-                difficulty = problem.tags[0].difficulty or None
+            if tags:
+                difficulty = tags[0].difficulty or None
                 if not difficulty:
-                    for t in problem.tags:
+                    for t in tags:
                         if t.difficulty:
                             difficulty = t.difficulty
                             break
@@ -179,8 +190,8 @@ class ProblemService:
             subject = None
             major_unit = None
             sub_unit = None
-            if problem.tags and len(problem.tags) > 0:
-                primary = problem.tags[0]
+            if tags:
+                primary = tags[0]
                 subject = primary.subject or None
                 major_unit = getattr(primary, "major_unit", None) or None
                 sub_unit = getattr(primary, "sub_unit", None) or None
@@ -195,23 +206,20 @@ class ProblemService:
                 unit_display = str(major_unit)
             
             result.append({
-                'problem_id': problem.id,
-                'problem_index': problem.problem_index,
+                'problem_id': str(pid),  # 목록 조회는 SQLite 정수 id → 기존 계약대로 str
+                'problem_index': problem_index,
                 'content_text_preview': preview,
-                'has_content_raw': problem.content_raw_file_id is not None,
+                'has_content_raw': bool(raw_file_id),
                 'tags': tags_data,
                 'difficulty': difficulty,
                 'subject': subject,
                 'major_unit': major_unit,
                 'sub_unit': sub_unit,
                 'unit_display': unit_display,
-                'created_at': problem.created_at.isoformat() if problem.created_at else None,
-                'original_hwp_path': problem.original_hwp_path
+                'created_at': created_at or None,
+                'original_hwp_path': hwp_path
             })
         
-        # problem_index 기준 정렬
-        result.sort(key=lambda x: x['problem_index'])
-        
         return result
 
     def generate_previews_for_source(
@@ -374,6 +382,34 @@ class ProblemService:
                 t.difficulty = None
         return self.problem_repo.update(problem)
 
+    def set_problem_difficulties(self, changes: Dict[str, Optional[str]]) -> int:
+        """
+        여러 Problem의 난이도를 한 번에 저장합니다(조회 1회 + UPDATE 1회).
+
+        규칙은 set_problem_difficulty와 같습니다(대표 태그 1곳에만 난이도 유지).
+
+        Args:
+            changes: {problem_id: '킬' | '상' | '중' | '하' | None}
+
+        Returns:
+            저장된 Problem 개수
+        """
+        if not self.db_connection.is_connected():
+            raise ConnectionError(
+                "DB에 연결되지 않았습니다. 데이터를 수정할 수 없습니다."
+            )
+        if not changes:
+            return 0
+
+        problems = self.problem_repo.list_by_ids(list(changes.keys()))
+        for problem in problems:
+            tag = self._get_or_create_primary_tag(problem)
+            tag.difficulty = changes.get(str(problem.id)) or None
+            if problem.tags and len(problem.tags) > 1:
+                for t in problem.tags[1:]:
+                    t.difficulty = None
+        return self.problem_repo.update_tags_many(problems)
+
     def set_problem_unit(
         self,
         problem_id: str,
@@ -399,6 +435,46 @@ class ProblemService:
         if not problem:
             return False
 
+        self._apply_unit(problem, subject, major_unit, sub_unit, grade)
+        return self.problem_repo.update(problem)
+
+    def set_problem_units(
+        self,
+        problem_ids: List[str],
+        subject: str,
+        major_unit: str,
+        sub_unit: Optional[str] = None,
+        grade: Optional[str] = None
+    ) -> int:
+        """
+        여러 Problem에 같은 과목/단원을 한 번에 저장합니다(조회 1회 + UPDATE 1회).
+
+        규칙은 set_problem_unit과 같습니다.
+
+        Returns:
+            저장된 Problem 개수
+        """
+        if not self.db_connection.is_connected():
+            raise ConnectionError(
+                "DB에 연결되지 않았습니다. 데이터를 수정할 수 없습니다."
+            )
+        if not problem_ids:
+            return 0
+
+        problems = self.problem_repo.list_by_ids(problem_ids)
+        for problem in problems:
+            self._apply_unit(problem, subject, major_unit, sub_unit, grade)
+        return self.problem_repo.update_tags_many(problems)
+
+    def _apply_unit(
+        self,
+        problem: Problem,
+        subject: str,
+        major_unit: str,
+        sub_unit: Optional[str],
+        grade: Optional[str]
+    ) -> None:
+        """대표 태그에 과목/학년/대단원/소단원(+레거시 unit)을 채움"""
         tag = self._get_or_create_primary_tag(problem)
         tag.subject = subject or ""
         tag.grade = grade or tag.grade or ""
@@ -415,8 +491,6 @@ class ProblemService:
             tag.unit = tag.major_unit
         else:
             tag.unit = None
-
-        return self.problem_repo.update(problem)
     
     def get_parsing_summary(
         self,
@@ -573,6 +647,24 @@ class ProblemService:
                 deleted += 1
         return deleted
 
+    def delete_problems_by_sources(
+        self, source_ids: List[str], source_type: SourceType, commit: bool = True
+    ) -> int:
+        """
+        여러 출처에 연결된 Problem들을 한 번의 일괄 삭제로 지웁니다.
+
+        - commit=False면 출처 삭제(예: ExamRepository.delete_many)와 같은 트랜잭션으로 묶입니다.
+        - 삭제 중 오류가 나면 롤백 후 예외를 그대로 올립니다(0개로 뭉개지 않음).
+
+        Returns:
+            삭제된 Problem 개수
+        """
+        if not self.db_connection.is_connected():
+            raise ConnectionError(
+                "DB에 연결되지 않았습니다. 데이터를 삭제할 수 없습니다."
+            )
+        return self.problem_repo.delete_by_sources(source_ids, source_type, commit=commit)
+
     def delete_problems_by_ids(self, problem_ids: List[str]) -> int:
         """
         Problem ID 리스트를 받아 일괄 삭제합니다.
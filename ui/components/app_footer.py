@@ -0,0 +1,65 @@
+"""
+공용 푸터 (저작권 · 개발자 정보)
+
+- 로그인 화면 / 메인 페이지 하단에 같은 모양으로 사용
+- 라벨 스타일시트는 모듈 상수, 폰트는 공용 글꼴 캐시(ui.components.fonts)를 사용
+"""
+
+from __future__ import annotations
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from ui.components.fonts import app_font
+
+
+_COPYRIGHT_TEXT = "© 2026 HanQ. All rights reserved."
+_DEV_BY_TEXT = "Developed by "
+_DEV_NAME_TEXT = "이창현수학"
+
+_COPYRIGHT_QSS = "color: #777777; font-size: 10pt; font-weight: 400; background: transparent; border: none;"
+_DEV_BY_QSS = "color: #666666; font-size: 10pt; background: transparent; border: none;"
+_DEV_NAME_QSS = "color: #333333; font-size: 10pt; font-weight: bold; background: transparent; border: none;"
+
+
+def _plain_label(text: str, qss: str, weight: int) -> QLabel:
+    lbl = QLabel(text)
+    lbl.setTextFormat(Qt.PlainText)
+    lbl.setStyleSheet(qss)
+    lbl.setFont(app_font(10, weight))
+    return lbl
+
+
+def create_app_footer(bottom_margin: int = 0, spacing: int = 2, bold_dev_by: bool = False) -> QWidget:
+    """
+    저작권 한 줄 + "Developed by 이름" 한 줄로 된 푸터 위젯을 만든다.
+
+    Args:
+        bottom_margin: 푸터 아래 여백(px)
+        spacing: 두 줄 사이 간격(px)
+        bold_dev_by: True면 "Developed by"도 이름과 같은 색·굵기(로그인 화면 모양)
+    """
+    footer = QWidget()
+    layout = QVBoxLayout(footer)
+    layout.setContentsMargins(0, 0, 0, bottom_margin)
+    layout.setSpacing(spacing)
+
+    copyright_lbl = _plain_label(_COPYRIGHT_TEXT, _COPYRIGHT_QSS, QFont.Normal)
+    copyright_lbl.setAlignment(Qt.AlignCenter)
+
+    # "Developed by" + 굵은 이름: RichText <span> 대신 PlainText 라벨 두 개를 나란히
+    dev_row = QHBoxLayout()
+    dev_row.setContentsMargins(0, 0, 0, 0)
+    dev_row.setSpacing(0)
+    dev_row.addStretch(1)
+    if bold_dev_by:
+        dev_row.addWidget(_plain_label(_DEV_BY_TEXT, _DEV_NAME_QSS, QFont.Bold))
+    else:
+        dev_row.addWidget(_plain_label(_DEV_BY_TEXT, _DEV_BY_QSS, QFont.Normal))
+    dev_row.addWidget(_plain_label(_DEV_NAME_TEXT, _DEV_NAME_QSS, QFont.Bold))
+    dev_row.addStretch(1)
+
+    layout.addWidget(copyright_lbl)
+    layout.addLayout(dev_row)
+    return footer
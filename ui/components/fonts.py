@@ -0,0 +1,49 @@
+"""
+공용 글꼴 헬퍼
+
+- 설치된 글꼴 조회(exactMatch)는 family 후보별로 최초 1회만
+- (family, 크기, 굵기)별 QFont를 캐시하고, 호출부에는 복사본을 돌려준다
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+from PyQt5.QtGui import QFont
+
+
+_DEFAULT_FAMILIES: Tuple[str, ...] = ("Pretendard",)
+_FALLBACK_FAMILY = "맑은 고딕"
+
+
+@lru_cache(maxsize=None)
+def font_family(families: Tuple[str, ...] = _DEFAULT_FAMILIES) -> str:
+    """후보 중 설치된 첫 family, 없으면 맑은 고딕"""
+    for family in families:
+        if QFont(family).exactMatch():
+            return family
+    return _FALLBACK_FAMILY
+
+
+@lru_cache(maxsize=128)
+def _cached_font(family: str, size_pt: int, weight: int) -> QFont:
+    f = QFont(family)
+    f.setPointSize(int(size_pt))
+    f.setWeight(int(weight))
+    return f
+
+
+def app_font(
+    size_pt: int, weight: int = QFont.Normal, *, families: Tuple[str, ...] = _DEFAULT_FAMILIES
+) -> QFont:
+    """
+    앱 공용 글꼴.
+
+    Args:
+        size_pt: 글자 크기(pt)
+        weight: QFont.Weight 값
+        families: 우선 사용할 family 후보(앞에서부터 확인)
+    """
+    # 캐시 원본이 호출부에서 변경되지 않도록 복사본 반환(QFont는 암시적 공유라 복사 비용이 작음)
+    return QFont(_cached_font(font_family(tuple(families)), int(size_pt), int(weight)))
@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Optional
 
 from PyQt5.QtCore import Qt, pyqtSignal
@@ -41,8 +42,9 @@ def _qta_pixmap(icon_name: str, color: str, size: int) -> Optional[QPixmap]:
         return None
 
 
+@lru_cache(maxsize=None)
 def _fallback_logo_pixmap(color_hex: str = "#2563EB", size: int = 24) -> QPixmap:
-    """qtawesome 미설치/실패 시에도 항상 보이는 로고 아이콘."""
+    """qtawesome 미설치/실패 시에도 항상 보이는 로고 아이콘. (색, 크기)당 한 번만 그리고 재사용."""
     from PyQt5.QtCore import QRectF
     from PyQt5.QtGui import QPainter, QPen
 
@@ -76,8 +78,9 @@ def _fallback_logo_pixmap(color_hex: str = "#2563EB", size: int = 24) -> QPixmap
     return pm
 
 
+@lru_cache(maxsize=None)
 def _fallback_user_pixmap(color_hex: str = "#64748B", size: int = 18) -> QPixmap:
-    """qtawesome 미설치/실패 시에도 항상 보이는 유저 아이콘."""
+    """qtawesome 미설치/실패 시에도 항상 보이는 유저 아이콘. (색, 크기)당 한 번만 그리고 재사용."""
     from PyQt5.QtGui import QPainter, QPen, QBrush
 
     pm = QPixmap(size, size)
@@ -13,12 +13,18 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import operator
+import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QColor, QFont, QPalette
 from PyQt5.QtWidgets import (
+    QApplication,
     QWidget,
     QHBoxLayout,
     QVBoxLayout,
@@ -33,36 +39,130 @@ from PyQt5.QtWidgets import (
 from core.models import Student
 from database.repositories.student_repository import StudentRepository
 from database.repositories.class_repository import ClassRepository
+from ui.components.fonts import app_font
 from ui.screens.student_page import StudentPage
 
 
 def _font(size_pt: int, *, bold: bool = False, extra_bold: bool = False) -> QFont:
-    f = QFont("Pretendard")
-    if not f.exactMatch():
-        f = QFont("맑은 고딕")
-    f.setPointSize(int(size_pt))
-    if extra_bold:
-        f.setWeight(QFont.ExtraBold)
-    elif bold:
-        f.setBold(True)
-    else:
-        try:
-            f.setWeight(QFont.Medium)
-        except Exception:
-            pass
-    return f
+    weight = QFont.ExtraBold if extra_bold else (QFont.Bold if bold else QFont.Medium)
+    return app_font(size_pt, weight)
 
 
 CLASS_ORDER: List[str] = ["초1", "초2", "초3", "초4", "초5", "초6", "중1", "중2", "중3", "고1", "고2", "고3"]
+_CLASS_ORDER_IDX: Dict[str, int] = {g: i for i, g in enumerate(CLASS_ORDER)}
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentItem:
     name: str
     grade: str  # "초4", "중3" 등
     id: Optional[str] = None
 
 
+# 수업 탭 QSS(앱 스타일시트에 1회만 병합). 선택자는 objectName으로 이 화면에 한정
+_QSS_APPLIED = False
+_QSS = """
+    QWidget#ClassWorksheetRoot {
+        background-color: #F8FAFC;
+    }
+
+    QFrame#InnerSidebar {
+        background-color: #FFFFFF;
+        border: 1px solid #E2E8F0;
+        border-radius: 14px;
+    }
+
+    QFrame#InnerSidebar * {
+        outline: none;
+    }
+
+    QFrame#InnerSidebar QFrame#SegmentWrap {
+        background: #F1F5F9;
+        border: 1px solid #F1F5F9;
+        border-radius: 12px;
+    }
+    QFrame#InnerSidebar QPushButton#SegmentBtnLeft, QFrame#InnerSidebar QPushButton#SegmentBtnRight {
+        border: none;
+        border-radius: 12px;
+        padding: 10px 0px;
+        color: #334155;
+        background: transparent;
+        font-weight: 800;
+    }
+    QFrame#InnerSidebar QPushButton#SegmentBtnLeft:checked, QFrame#InnerSidebar QPushButton#SegmentBtnRight:checked {
+        background: #2563EB;
+        color: #FFFFFF;
+        font-weight: 900;
+    }
+
+    QFrame#InnerSidebar QLineEdit#StudentSearch {
+        background-color: #FFFFFF;
+        border: 1px solid #475569; /* 더 진한 테두리 */
+        border-radius: 12px;
+        padding: 10px 12px;
+        color: #0F172A; /* 더 진한 글씨 */
+        font-weight: 800;
+    }
+    QFrame#InnerSidebar QLineEdit#StudentSearch:focus {
+        border: 2px solid #2563EB;
+    }
+    QFrame#InnerSidebar QLineEdit#StudentSearch::placeholder {
+        color: #64748B;
+    }
+
+    QTreeWidget#RosterTree {
+        background: transparent;
+        border: none;
+    }
+    /* 1. 아이템 스타일 (::branch는 건드리지 않아 Qt 기본 ▶/▼ 화살표가 그려지도록 함) */
+    QTreeWidget#RosterTree::item {
+        padding: 8px 5px;
+        border: none;
+        border-radius: 10px;
+        color: #0F172A;
+    }
+    QTreeWidget#RosterTree::item:hover {
+        background-color: #E8F0FE;
+    }
+    QTreeWidget#RosterTree::item:selected {
+        background-color: #E8F0FE;
+        color: #007BFF;
+        font-weight: bold;
+    }
+
+    QFrame#RightCard {
+        background-color: #FFFFFF;
+        border: 1px solid #F1F5F9;
+        border-radius: 14px;
+    }
+    /* 우측 본문 영역(학생 페이지 등): 전역 QWidget #F8FAFC 충돌 방지 → 흰색 고정 */
+    QWidget#RightBody {
+        background-color: #FFFFFF;
+    }
+    /* ✅ 전역 테마에서 QWidget 배경(#F8FAFC)이 QLabel에 적용되어 "연회색 바"처럼 보일 수 있어,
+       우측 텍스트 영역은 항상 투명 배경을 강제합니다. */
+    QFrame#RightCard QLabel {
+        background: transparent;
+    }
+    QLabel#RightTitle {
+        color: #0F172A;
+    }
+    QLabel#RightHint {
+        color: #64748B;
+    }
+"""
+
+# 트리 브랜치 화살표(▶/▼) 색상. 팔레트는 최초 생성 시 1회만 구성해 재사용
+_DARK_TEXT = QColor(0x47, 0x56, 0x69)
+_ROSTER_PALETTE: Optional[QPalette] = None
+
+_BY_NAME = operator.attrgetter("name")
+
+_NAME_SEP = "\x1f"
+_DIGITS_RE = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=64)
 def _grade_rank(grade: str) -> int:
     """
     저학년이 위로 오도록 정렬 키를 반환합니다.
@@ -79,17 +179,53 @@ def _grade_rank(grade: str) -> int:
         base = 100
     elif g.startswith("고"):
         base = 200
-    # 숫자 추출
-    n = ""
-    for ch in g:
-        if ch.isdigit():
-            n += ch
+    # 숫자 추출(학년 값은 초1~고3 고정 집합이라 결과는 캐시됨)
+    m = _DIGITS_RE.search(g)
+    n = m.group(0) if m else ""
     try:
         return base + int(n or 99)
     except Exception:
         return base + 99
 
 
+class _RosterLoaderSignals(QObject):
+    finished = pyqtSignal(int, list, list)  # (token, students, classes)
+
+
+class _RosterLoader(QRunnable):
+    """학생/반 목록을 워커 스레드에서 조회합니다(MongoDB 왕복으로 UI가 멈추지 않도록)."""
+
+    def __init__(self, token: int, db_connection, with_classes: bool):
+        super().__init__()
+        self.token = token
+        self.db_connection = db_connection
+        self.with_classes = with_classes
+        self.signals = _RosterLoaderSignals()
+
+    def run(self) -> None:
+        students: list = []
+        classes: list = []
+        reader = None
+        try:
+            # sqlite3 연결은 만든 스레드에서만 사용 가능 → 이 스레드 전용 연결로 조회
+            reader = self.db_connection.open_reader()
+            try:
+                students = list(StudentRepository(reader).list_all() or [])
+            except Exception:
+                students = []
+            if self.with_classes:
+                try:
+                    classes = list(ClassRepository(reader).list_all() or [])
+                except Exception:
+                    classes = []
+        except Exception:
+            pass
+        finally:
+            if reader is not None:
+                reader.disconnect()
+        self.signals.finished.emit(self.token, students, classes)
+
+
 class ClassWorksheetScreen(QWidget):
     """수업 탭 메인 화면(탭 내부 사이드바 + 콘텐츠)."""
 
@@ -107,13 +243,34 @@ class ClassWorksheetScreen(QWidget):
             self._class_repo = None
 
         self._mode: str = "grade"  # "grade" | "class"
-        self._students: List[StudentItem] = []
+        self._students: Tuple[StudentItem, ...] = ()  # 로드 후 불변
+        self._classes: list = []
+        self._loading: bool = False
+        self._load_token: int = 0
+        self._loader: Optional[_RosterLoader] = None
+        # 이름 검색 인덱스: casefold 이름을 구분자로 이어 붙인 문자열 + 각 이름의 시작 오프셋
+        self._names_joined: str = ""
+        self._name_offsets: List[int] = []
         self._selected_key: str = ""  # grade or class key
+        # 데이터 변경 시에만 True. (mode, 검색어)가 같고 데이터도 그대로면 트리 재구성을 생략
+        self._sidebar_dirty: bool = True
+        self._sidebar_sig: Optional[tuple] = None
+        # 트리 항목의 UserRole에는 이 리스트의 인덱스(int)만 저장
+        self._item_meta: List[tuple] = []
+        # 학년 그룹 key → 최상위 항목(_expand_group에서 선형 탐색 없이 조회)
+        self._group_items: Dict[str, QTreeWidgetItem] = {}
+        # 사이드바 재구성 루프에서 반복 사용하는 폰트(화면마다 1회 생성)
+        self._font_group = _font(10, extra_bold=True)
+        self._font_item = _font(10, bold=True)
+        self._font_title = _font(14, extra_bold=True)
 
         self._tree: Optional[QTreeWidget] = None
         self._search: Optional[QLineEdit] = None
         self._right_title: Optional[QLabel] = None
         self._right_hint: Optional[QLabel] = None
+        # 우측 라벨에 마지막으로 설정한 텍스트(동일 문자열 setText에 따른 재그리기 방지)
+        self._right_title_text: str = ""
+        self._right_hint_text: str = ""
         self._student_page: Optional[StudentPage] = None
         self._right_body = None
         self._right_body_lay = None
@@ -125,17 +282,36 @@ class ClassWorksheetScreen(QWidget):
 
     def _load_students_from_db(self) -> None:
         """
-        관리 > 학생관리에서 등록된 학생을 로드합니다.
-        - MongoDB 연결 시: students 컬렉션에서 로드
+        관리 > 학생관리에서 등록된 학생/반을 로드합니다.
+        - MongoDB 연결 시: 워커 스레드에서 students/classes 컬렉션 조회 → 완료 시 사이드바 갱신
         - 오프라인/미연결 시: 빈 목록(안내만 표시)
         """
-        self._students = []
+        self._load_token += 1
         if self.repo is None:
+            self._loading = False
+            self._apply_roster([], [])
             return
-        try:
-            items = self.repo.list_all()
-        except Exception:
-            items = []
+        self._loading = True
+        loader = _RosterLoader(self._load_token, self.db_connection, self._class_repo is not None)
+        loader.signals.finished.connect(self._on_roster_loaded)
+        self._loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_roster_loaded(self, token: int, students: list, classes: list) -> None:
+        # 더 최근 요청이 있으면 이전 결과는 버림
+        if token != self._load_token:
+            return
+        self._loading = False
+        self._loader = None
+        self._apply_roster(students, classes)
+        self._reload_sidebar()
+
+    def _apply_roster(self, items: list, classes: list) -> None:
+        students: List[StudentItem] = []
+        self._classes = list(classes or [])
+        self._names_joined = ""
+        self._name_offsets = []
+        self._sidebar_dirty = True
         for s in (items or []):
             if not s:
                 continue
@@ -143,107 +319,39 @@ class ClassWorksheetScreen(QWidget):
             grade = (s.grade or "").strip()
             if not name or not grade:
                 continue
-            self._students.append(StudentItem(name=name, grade=grade, id=(s.id or None)))
+            students.append(StudentItem(name=name, grade=grade, id=(s.id or None)))
+        # 이름순으로 1회 정렬해 두면 그룹핑 후 그룹별 정렬이 필요 없음
+        students.sort(key=_BY_NAME)
+        self._students = tuple(students)
+        self._build_name_index()
+
+    def _build_name_index(self) -> None:
+        """검색용 이름 인덱스(_names_joined/_name_offsets)를 현재 학생 목록 기준으로 다시 만듭니다."""
+        names_lc = [st.name.casefold() for st in self._students]
+        offsets: List[int] = []
+        pos = 0
+        for n in names_lc:
+            offsets.append(pos)
+            pos += len(n) + 1
+        self._name_offsets = offsets
+        self._names_joined = _NAME_SEP.join(names_lc)
 
     def refresh_from_db(self) -> None:
         """DB에서 학생/반 목록을 다시 읽어 사이드바를 갱신. (관리에서 등록 후 수업 탭에서 바로 반영용)"""
         self._load_students_from_db()
-        self._reload_sidebar()
+        # 조회 중이면 완료 시그널에서 갱신됨
+        if not self._loading:
+            self._reload_sidebar()
 
     def _build_ui(self) -> None:
+        global _ROSTER_PALETTE, _QSS_APPLIED
         self.setObjectName("ClassWorksheetRoot")
-        self.setStyleSheet(
-            """
-            QWidget#ClassWorksheetRoot {
-                background-color: #F8FAFC;
-            }
-
-            QFrame#InnerSidebar {
-                background-color: #FFFFFF;
-                border: 1px solid #E2E8F0;
-                border-radius: 14px;
-            }
-
-            QFrame#InnerSidebar * {
-                outline: none;
-            }
-
-            QFrame#SegmentWrap {
-                background: #F1F5F9;
-                border: 1px solid #F1F5F9;
-                border-radius: 12px;
-            }
-            QPushButton#SegmentBtnLeft, QPushButton#SegmentBtnRight {
-                border: none;
-                border-radius: 12px;
-                padding: 10px 0px;
-                color: #334155;
-                background: transparent;
-                font-weight: 800;
-            }
-            QPushButton#SegmentBtnLeft:checked, QPushButton#SegmentBtnRight:checked {
-                background: #2563EB;
-                color: #FFFFFF;
-                font-weight: 900;
-            }
-
-            QLineEdit#StudentSearch {
-                background-color: #FFFFFF;
-                border: 1px solid #475569; /* 더 진한 테두리 */
-                border-radius: 12px;
-                padding: 10px 12px;
-                color: #0F172A; /* 더 진한 글씨 */
-                font-weight: 800;
-            }
-            QLineEdit#StudentSearch:focus {
-                border: 2px solid #2563EB;
-            }
-            QLineEdit#StudentSearch::placeholder {
-                color: #64748B;
-            }
-
-            QTreeWidget#RosterTree {
-                background: transparent;
-                border: none;
-            }
-            /* 1. 아이템 스타일 (::branch는 건드리지 않아 Qt 기본 ▶/▼ 화살표가 그려지도록 함) */
-            QTreeWidget#RosterTree::item {
-                padding: 8px 5px;
-                border: none;
-                border-radius: 10px;
-                color: #0F172A;
-            }
-            QTreeWidget#RosterTree::item:hover {
-                background-color: #E8F0FE;
-            }
-            QTreeWidget#RosterTree::item:selected {
-                background-color: #E8F0FE;
-                color: #007BFF;
-                font-weight: bold;
-            }
-
-            QFrame#RightCard {
-                background-color: #FFFFFF;
-                border: 1px solid #F1F5F9;
-                border-radius: 14px;
-            }
-            /* 우측 본문 영역(학생 페이지 등): 전역 QWidget #F8FAFC 충돌 방지 → 흰색 고정 */
-            QWidget#RightBody {
-                background-color: #FFFFFF;
-            }
-            /* ✅ 전역 테마에서 QWidget 배경(#F8FAFC)이 QLabel에 적용되어 "연회색 바"처럼 보일 수 있어,
-               우측 텍스트 영역은 항상 투명 배경을 강제합니다. */
-            QFrame#RightCard QLabel {
-                background: transparent;
-            }
-            QLabel#RightTitle {
-                color: #0F172A;
-            }
-            QLabel#RightHint {
-                color: #64748B;
-            }
-            """
-        )
+        # 화면 QSS는 인스턴스마다 다시 파싱하지 않도록 앱 전역 스타일시트에 1회만 병합
+        if not _QSS_APPLIED:
+            app = QApplication.instance()
+            if app is not None:
+                app.setStyleSheet((app.styleSheet() or "") + _QSS)
+                _QSS_APPLIED = True
 
         outer = QHBoxLayout(self)
         outer.setContentsMargins(24, 16, 24, 24)
@@ -311,12 +419,11 @@ class ClassWorksheetScreen(QWidget):
         tree.itemClicked.connect(self._on_tree_item_clicked)
         tree.viewport().installEventFilter(self)
         # Qt 기본 브랜치 화살표(▶/▼)가 잘 보이도록 팔레트 색상 설정
-        pal = tree.palette()
-        dark = QColor(0x47, 0x56, 0x69)
-        pal.setColor(QPalette.Text, dark)
-        pal.setColor(QPalette.WindowText, dark)
-        pal.setColor(QPalette.ButtonText, dark)
-        tree.setPalette(pal)
+        if _ROSTER_PALETTE is None:
+            _ROSTER_PALETTE = QPalette(tree.palette())
+            for role in (QPalette.Text, QPalette.WindowText, QPalette.ButtonText):
+                _ROSTER_PALETTE.setColor(role, _DARK_TEXT)
+        tree.setPalette(_ROSTER_PALETTE)
         s_lay.addWidget(tree, 1)
 
         outer.addWidget(sidebar, 0)
@@ -328,14 +435,16 @@ class ClassWorksheetScreen(QWidget):
         r_lay.setContentsMargins(20, 18, 20, 18)
         r_lay.setSpacing(10)
 
-        self._right_title = QLabel("수업")
+        self._right_title_text = "수업"
+        self._right_title = QLabel(self._right_title_text)
         self._right_title.setObjectName("RightTitle")
-        self._right_title.setFont(_font(14, extra_bold=True))
+        self._right_title.setFont(self._font_title)
         r_lay.addWidget(self._right_title)
 
-        self._right_hint = QLabel("좌측에서 학생을 선택하면 학생별 관리 페이지가 열립니다.")
+        self._right_hint_text = "좌측에서 학생을 선택하면 학생별 관리 페이지가 열립니다."
+        self._right_hint = QLabel(self._right_hint_text)
         self._right_hint.setObjectName("RightHint")
-        self._right_hint.setFont(_font(10, bold=True))
+        self._right_hint.setFont(self._font_item)
         self._right_hint.setWordWrap(True)
         r_lay.addWidget(self._right_hint)
 
@@ -360,54 +469,80 @@ class ClassWorksheetScreen(QWidget):
         self.btn_class.setChecked(m == "class")
         self._selected_key = ""
         self._reload_sidebar()
-        self._render_right_panel()
+        # 학생 페이지가 열려 있으면 우측 패널은 갱신할 내용이 없음
+        if self._student_page is None:
+            self._render_right_panel()
 
-    def _filtered_students(self) -> List[StudentItem]:
+    def _filtered_students(self) -> Sequence[StudentItem]:
         q = ""
         if self._search is not None:
             q = (self._search.text() or "").strip()
         if not q:
-            return list(self._students)
-        q2 = q.lower()
-        return [s for s in self._students if q2 in (s.name or "").lower()]
+            return self._students  # 불변 튜플이므로 복사 없이 반환
+        q2 = q.casefold()
+        if _NAME_SEP in q2:
+            return []
+        # 이름별 파이썬 루프 대신 결합 문자열에서 str.find 한 번의 스캔으로 매칭 인덱스를 찾음
+        hay = self._names_joined
+        offsets = self._name_offsets
+        out: List[StudentItem] = []
+        pos = hay.find(q2)
+        while pos >= 0:
+            i = bisect.bisect_right(offsets, pos) - 1
+            out.append(self._students[i])
+            if i + 1 >= len(offsets):
+                break
+            pos = hay.find(q2, offsets[i + 1])
+        return out
 
     def _reload_sidebar(self) -> None:
         t = self._tree
         if t is None:
             return
+        sig = (self._mode, self._search.text() if self._search is not None else "")
+        if not self._sidebar_dirty and sig == self._sidebar_sig:
+            return
+        self._sidebar_dirty = False
+        self._sidebar_sig = sig
         t.clear()
+        self._item_meta = []
+        self._group_items = {}
+
+        # 최초 로드 전에만 안내 표시(재조회 중에는 기존 목록 유지)
+        if self._loading and not self._students:
+            info = QTreeWidgetItem(t)
+            info.setText(0, "로딩 중...")
+            info.setFont(0, self._font_group)
+            return
 
         # 반 탭: 반관리에서 등록한 반 로드 → 반별 학생 표시
         if self._mode == "class":
             if self._class_repo is None:
                 info = QTreeWidgetItem(t)
                 info.setText(0, "DB 연결 후 반 목록이 표시됩니다.")
-                info.setFont(0, _font(10, extra_bold=True))
+                info.setFont(0, self._font_group)
                 return
-            try:
-                classes = self._class_repo.list_all()
-            except Exception:
-                classes = []
+            classes = self._classes
             id_to_student: Dict[str, StudentItem] = {str(s.id): s for s in self._students if s.id}
-            q = (self._search.text() or "").strip().lower() if self._search else ""
-            for c in sorted(classes, key=lambda x: (CLASS_ORDER.index(x.grade) if x.grade in CLASS_ORDER else 999, x.name or "")):
+            q = (self._search.text() or "").strip().casefold() if self._search else ""
+            for c in sorted(classes, key=lambda x: (_CLASS_ORDER_IDX.get(x.grade, 999), x.name or "")):
                 n = len(c.student_ids or [])
                 kids: List[StudentItem] = []
                 for sid in (c.student_ids or []):
                     st = id_to_student.get(str(sid))
-                    if st and (not q or q in (st.name or "").lower()):
+                    if st and (not q or q in (st.name or "").casefold()):
                         kids.append(st)
                 if q and not kids:
                     continue
                 top = QTreeWidgetItem(t)
                 top.setText(0, f"{c.name or ''}  ({len(kids)}명)")
-                top.setData(0, Qt.UserRole, ("class", c.id, c.grade or "", c.name or ""))
-                top.setFont(0, _font(10, extra_bold=True))
-                for st in sorted(kids, key=lambda x: (x.name or "")):
+                top.setData(0, Qt.UserRole, self._add_item_meta(("class", c.id, c.grade or "", c.name or "")))
+                top.setFont(0, self._font_group)
+                for st in sorted(kids, key=_BY_NAME):
                     it = QTreeWidgetItem(top)
                     it.setText(0, st.name)
-                    it.setData(0, Qt.UserRole, ("student", st.grade or "", st.name or "", st.id or ""))
-                    it.setFont(0, _font(10, bold=True))
+                    it.setData(0, Qt.UserRole, self._add_item_meta(("student", st.grade or "", st.name or "", st.id or "")))
+                    it.setFont(0, self._font_item)
                 try:
                     top.setExpanded(False)
                 except Exception:
@@ -415,22 +550,23 @@ class ClassWorksheetScreen(QWidget):
             if t.topLevelItemCount() == 0:
                 empty = QTreeWidgetItem(t)
                 empty.setText(0, "등록된 반이 없습니다")
-                empty.setFont(0, _font(10, extra_bold=True))
+                empty.setFont(0, self._font_group)
             return
 
         students = self._filtered_students()
         if not students:
             empty = QTreeWidgetItem(t)
             empty.setText(0, "등록된 학생이 없습니다")
-            empty.setFont(0, _font(10, extra_bold=True))
+            empty.setFont(0, self._font_group)
             return
 
-        by_cls: Dict[str, List[StudentItem]] = {}
+        # students는 이미 이름순 → 그룹 내 순서도 이름순 유지
+        by_cls: Dict[str, List[StudentItem]] = defaultdict(list)
         for s in students:
             key = (s.grade or "").strip()
             if not key:
                 continue
-            by_cls.setdefault(key, []).append(s)
+            by_cls[key].append(s)
 
         # 표시 대상 키 정렬
         keys = sorted(by_cls.keys(), key=_grade_rank)
@@ -438,15 +574,17 @@ class ClassWorksheetScreen(QWidget):
         for k in keys:
             top = QTreeWidgetItem(t)
             # ✅ 사이드바 폭 축소 대응: 카운트는 같은 라인에 붙여서 1컬럼 유지
-            top.setText(0, f"{k}  ({len(by_cls.get(k, []))}명)")
-            top.setData(0, Qt.UserRole, ("group", k))
-            top.setFont(0, _font(10, extra_bold=True))
+            group = by_cls[k]
+            top.setText(0, f"{k}  ({len(group)}명)")
+            self._group_items[k] = top
+            top.setData(0, Qt.UserRole, self._add_item_meta(("group", k)))
+            top.setFont(0, self._font_group)
 
-            for st in sorted(by_cls.get(k, []), key=lambda x: (x.name or "")):
+            for st in group:
                 it = QTreeWidgetItem(top)
                 it.setText(0, st.name)
-                it.setData(0, Qt.UserRole, ("student", k, st.name, st.id))
-                it.setFont(0, _font(10, bold=True))
+                it.setData(0, Qt.UserRole, self._add_item_meta(("student", k, st.name, st.id)))
+                it.setFont(0, self._font_item)
 
             # ✅ 요청: 드롭다운을 미리 펼치지 않음(기본 접힘)
             try:
@@ -461,42 +599,39 @@ class ClassWorksheetScreen(QWidget):
         t = self._tree
         if t is None:
             return
-        for i in range(t.topLevelItemCount()):
-            item = t.topLevelItem(i)
-            if item is None:
-                continue
-            data = item.data(0, Qt.UserRole)
-            if isinstance(data, tuple) and len(data) >= 2 and data[0] == "group" and str(data[1]) == str(key):
-                try:
-                    item.setExpanded(True)
-                    t.setCurrentItem(item)
-                except Exception:
-                    pass
-                break
+        item = self._group_items.get(str(key))
+        if item is not None:
+            try:
+                item.setExpanded(True)
+                t.setCurrentItem(item)
+            except Exception:
+                pass
+
+    def _add_item_meta(self, meta: tuple) -> int:
+        self._item_meta.append(meta)
+        return len(self._item_meta) - 1
+
+    def _item_meta_of(self, item: QTreeWidgetItem) -> Optional[tuple]:
+        idx = item.data(0, Qt.UserRole)
+        if isinstance(idx, int) and 0 <= idx < len(self._item_meta):
+            return self._item_meta[idx]
+        return None
 
     def _on_tree_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        try:
-            data = item.data(0, Qt.UserRole)
-        except Exception:
-            data = None
+        data = self._item_meta_of(item)
 
-        if isinstance(data, tuple) and data:
+        if data:
             kind = data[0]
-            if kind == "group":
-                key = str(data[1])
-                self._selected_key = key
-                try:
-                    item.setExpanded(not item.isExpanded())
-                except Exception:
-                    pass
-                self._render_right_panel()
-            elif kind == "class":
-                self._selected_key = str(data[1] or "")
+            if kind in ("group", "class"):
+                key = str(data[1] or "")
                 try:
                     item.setExpanded(not item.isExpanded())
                 except Exception:
                     pass
-                self._render_right_panel()
+                # 같은 그룹/반을 다시 누른 경우(펼침 토글만) 우측 패널은 그대로 둠
+                if key != self._selected_key:
+                    self._selected_key = key
+                    self._render_right_panel()
             elif kind == "student":
                 try:
                     grade = str(data[1] or "")
@@ -513,19 +648,16 @@ class ClassWorksheetScreen(QWidget):
         if not nm:
             return
 
-        # 기존 페이지 제거 후 교체
-        try:
-            if self._student_page is not None:
-                self._student_page.setParent(None)
-        except Exception:
-            pass
-
-        self._student_page = StudentPage(self.db_connection, student_id=sid, student_name=nm, student_grade=gd)
-        try:
-            if self._right_body_lay is not None:
-                self._right_body_lay.addWidget(self._student_page, 1)
-        except Exception:
-            pass
+        # 학생 페이지는 최초 1회만 생성하고 이후에는 데이터만 교체(위젯 재생성/QSS 재적용 방지)
+        if self._student_page is None:
+            self._student_page = StudentPage(self.db_connection, student_id=sid, student_name=nm, student_grade=gd)
+            try:
+                if self._right_body_lay is not None:
+                    self._right_body_lay.addWidget(self._student_page, 1)
+            except Exception:
+                pass
+        else:
+            self._student_page.update_student(student_id=sid, student_name=nm, student_grade=gd)
 
         # 타이틀/힌트는 숨김(학생 페이지가 대신 표시)
         try:
@@ -542,9 +674,13 @@ class ClassWorksheetScreen(QWidget):
         title = "수업"
         hint = "좌측에서 학생을 선택하면 학생별 관리 페이지가 열립니다."
         if self._right_title is not None:
-            self._right_title.setText(title)
+            if title != self._right_title_text:
+                self._right_title.setText(title)
+                self._right_title_text = title
             self._right_title.show()
         if self._right_hint is not None:
-            self._right_hint.setText(hint)
+            if hint != self._right_hint_text:
+                self._right_hint.setText(hint)
+                self._right_hint_text = hint
             self._right_hint.show()
 
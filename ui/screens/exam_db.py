@@ -3,17 +3,25 @@
 
 기출 메타데이터 관리 및 파싱 결과 조회 화면
 """
-from typing import List, Dict
-
-from PyQt5.QtCore import Qt, QEvent, QSize
+import dataclasses
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Set, Tuple
+
+from PyQt5.QtCore import (
+    Qt, QEvent, QSize, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QRect,
+    QObject, QRunnable, QThreadPool, QThread, pyqtSignal,
+)
 from PyQt5.QtGui import QFont, QColor, QPainter, QBrush
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QAbstractItemView,
+    QTableView,
     QHeaderView,
     QFileDialog,
     QMessageBox,
@@ -24,6 +32,7 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QLineEdit,
     QFrame,
+    QMenu,
     QSizePolicy,
     QStyledItemDelegate,
     QStyle,
@@ -40,6 +49,209 @@ from processors.hwp.hwp_reader import HWPNotInstalledError, HWPInitializationErr
 from core.unit_catalog import list_subjects, list_major_units, list_sub_units
 
 
+def _major_unit_choices(subject: str) -> Tuple[str, ...]:
+    """대단원 콤보 항목("선택" + 대단원). 대단원 목록은 unit_catalog 캐시를 그대로 사용, addItems 한 번에 채움"""
+    if subject and subject != "선택":
+        return ("선택",) + list_major_units(subject)
+    return ("선택",)
+
+
+def _sub_unit_choices(subject: str, major: str) -> Tuple[str, ...]:
+    """소단원 콤보 항목("(없음)" + 소단원)"""
+    if subject and subject != "선택" and major and major != "선택":
+        return ("(없음)",) + list_sub_units(subject, major)
+    return ("(없음)",)
+
+
+# 기출별 문제 목록 캐시 최대 개수(행 사이를 오갈 때 DB 재조회 방지)
+_PROBLEMS_CACHE_MAX = 16
+
+# 기출DB 화면 QSS(교재DB와 동일한 색/대비/테이블/간격). 모듈 로드 시 1회만 만들어 재사용
+_QSS = """
+    QWidget#ExamDBRoot {
+        background: transparent;
+        font-family: 'Pretendard','Malgun Gothic','맑은 고딕';
+    }
+    QWidget#ExamDBRoot * {
+        outline: none;
+    }
+
+    QLabel#panelTitle {
+        color: #222222;
+        font-size: 12pt;
+        font-weight: 800;
+    }
+    QLabel#InlineLabel {
+        color: #222222;
+        font-weight: 700;
+        background: transparent;
+    }
+
+    QPushButton#primary {
+        background-color: #2563EB;
+        color: #FFFFFF;
+        border: 1px solid #2563EB;
+        border-radius: 10px;
+        padding: 9px 16px;
+        font-weight: 800;
+    }
+    QPushButton#primary:hover { background-color: #1D4ED8; }
+
+    QPushButton#secondary {
+        background-color: #FFFFFF;
+        color: #2563EB;
+        border: 1px solid #2563EB;
+        border-radius: 10px;
+        padding: 8px 14px;
+        min-height: 22px;
+        font-weight: 800;
+    }
+    QPushButton#secondary:hover { background-color: #EFF6FF; }
+    QPushButton#secondary:disabled { color: #94A3B8; border-color: #CBD5E1; }
+    QPushButton#filterApplyBtn {
+        background-color: #FFFFFF;
+        color: #2563EB;
+        border: 1px solid #2563EB;
+        border-radius: 8px;
+        padding: 4px 10px;
+        min-height: 22px;
+        font-weight: 700;
+    }
+    QPushButton#filterApplyBtn:hover { background-color: #EFF6FF; }
+
+    QLineEdit {
+        background-color: #FFFFFF;
+        border: 1.5px solid #CBD5E1;
+        border-radius: 8px;
+        padding: 8px 15px;
+        color: #222222;
+        font-weight: 600;
+    }
+    QLineEdit::placeholder {
+        color: #64748B;
+    }
+    QLineEdit:focus {
+        border: 2px solid #2563EB;
+        padding: 7px 14px;
+    }
+
+    QFrame#leftCard, QFrame#PreviewPanel {
+        background-color: #FFFFFF;
+        border: 1px solid #E2E8F0;
+        border-radius: 12px;
+    }
+
+    QCheckBox#onlyUntagged {
+        color: #222222;
+        font-weight: 800;
+        background: none;
+    }
+    QCheckBox#onlyUntagged::indicator {
+        width: 18px;
+        height: 18px;
+        background: #FFFFFF;
+        border: 2px solid #334155;
+        border-radius: 4px;
+    }
+    QCheckBox#onlyUntagged::indicator:checked {
+        background: #2563EB;
+        border-color: #2563EB;
+    }
+    QCheckBox#onlyUntagged::indicator:disabled {
+        background: #F1F5F9;
+        border-color: #CBD5E1;
+    }
+
+    QComboBox {
+        background-color: #FFFFFF;
+        border: 1.5px solid #CBD5E1;
+        border-radius: 10px;
+        padding: 6px 10px;
+        color: #222222;
+        font-weight: 600;
+    }
+    QComboBox:hover { background-color: #F8FAFC; }
+    QComboBox::drop-down { border: none; }
+    QComboBox QAbstractItemView {
+        background-color: #FFFFFF;
+        border: 1px solid #E0E0E0;
+        selection-background-color: #E2E8F0;
+        selection-color: #222222;
+        outline: 0;
+    }
+
+    QTableView#DBTable, QTableView#ProblemTable {
+        background-color: #FFFFFF;
+        border: 1px solid #E2E8F0;
+        border-radius: 12px;
+        gridline-color: #E0E0E0;
+        selection-color: #222222;
+        color: #222222;
+        outline: none;
+    }
+    QTableView#ProblemTable {
+        selection-background-color: #E8F2FF;
+    }
+    QTableView::item {
+        padding-top: 2px;
+        padding-bottom: 2px;
+        padding-left: 12px;
+        padding-right: 12px;
+        color: #222222;
+        background: none;
+        font-weight: 700;
+        border: none;
+        border-bottom: 1px solid #F1F5F9;
+    }
+    QTableView::item:selected {
+        background: none;
+        color: #222222;
+        font-weight: 700;
+    }
+    QTableView#ProblemTable::item:selected {
+        background-color: #E8F2FF;
+        color: #222222;
+        border: none;
+        border-bottom: 1px solid #D6E8FF;
+    }
+    QTableView::item:hover {
+        background: none;
+    }
+
+    QHeaderView::section {
+        background-color: #F8FAFC;
+        color: #222222;
+        font-weight: 800;
+        padding: 0px 10px;
+        border: none;
+        border-right: 1px solid #F1F5F9;
+        border-bottom: 1px solid #F1F5F9;
+    }
+    QHeaderView::section:last {
+        border-right: none;
+    }
+
+    QComboBox#DifficultyCombo {
+        background-color: #ffffff;
+        border: 1px solid #dcdcdc;
+        border-radius: 4px;
+        padding: 0px;
+        min-width: 55px;
+        font-size: 10pt;
+        color: #000000;
+        font-weight: bold;
+    }
+    QComboBox#DifficultyCombo::drop-down { border: none; }
+    QComboBox#DifficultyCombo QAbstractItemView {
+        background-color: #FFFFFF;
+        border: 1px solid #E0E0E0;
+        selection-background-color: #F0F7FF;
+        selection-color: #000000;
+        outline: 0;
+    }
+"""
+
+
 class ExamDBScreen(QWidget):
     """기출DB 화면"""
     
@@ -59,13 +271,43 @@ class ExamDBScreen(QWidget):
         self.hwp_restore = HWPRestore(db_connection)
         self.current_exam_id = None
         self.current_exam_grade = None
+        # 기출 목록은 워커 스레드에서 조회. 토큰으로 늦게 도착한 이전 결과를 버림
+        self._exam_load_token = 0
+        self._exam_loader: Optional[_LoadExamsTask] = None
+        self._exam_select_after_load: Optional[str] = None
+        # exam_id → get_problems_by_source 결과(LRU). 문제 변경 시 _invalidate_problems로 제거
+        self._problems_cache: "OrderedDict[str, list]" = OrderedDict()
+        # HWP 파싱은 QThread 워커에서 실행(진행률/완료는 시그널로 수신)
+        self._parse_thread: Optional[QThread] = None
+        self._parse_worker: Optional[_ReparseWorker] = None
+        self._parse_progress: Optional[QProgressDialog] = None
+        # 진행 중인 파싱 대상 기출과 안내 문구용 작업명("파싱"/"재파싱")
+        self._parse_exam_id: Optional[str] = None
+        self._parse_label = "파싱"
+        # 미리보기 생성은 QThreadPool 작업으로 실행
+        self._preview_task: Optional[_GeneratePreviewsTask] = None
+        self._preview_progress: Optional[QProgressDialog] = None
+        # 기출 행 메뉴(수정/삭제/재파싱). 처음 열 때 1회만 만들고 재사용
+        self._row_menu: Optional[QMenu] = None
+        self._action_edit = None
+        self._action_delete = None
+        self._action_reparse = None
+        # problem_id → 난이도(None=미지정). _difficulty_timer가 모아서 한 번에 저장
+        self._pending_difficulty: Dict[str, Optional[str]] = {}
+        # init_ui에서 만드는 위젯/상태(생성 전 접근에 대비해 미리 선언)
+        self._exams_cache: List[Exam] = []
+        # exam_id → Exam(load_exams 결과). 수정 다이얼로그에서 find_by_id 재조회 생략
+        self._exam_index: Dict[str, Exam] = {}
+        self.search_input: Optional[QLineEdit] = None
+        self.btn_generate_preview: Optional[QPushButton] = None
+        self.only_untagged_difficulty_checkbox: Optional[QCheckBox] = None
+        self.only_untagged_unit_checkbox: Optional[QCheckBox] = None
         self.init_ui()
         self.load_exams()
     
     def init_ui(self):
         """UI 초기화"""
         self.setObjectName("ExamDBRoot")
-        self._exams_cache: List[Exam] = []
 
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(10)
@@ -82,7 +324,12 @@ class ExamDBScreen(QWidget):
         self.search_input.setFixedHeight(40)
         self.search_input.setMinimumWidth(520)
         self.search_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.search_input.textChanged.connect(self._apply_exam_filters)
+        # 연속 타이핑은 120ms 유휴 후 1회만 필터링
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._apply_exam_filters)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
         control_layout.addWidget(self.search_input)
 
         control_layout.addStretch(1)
@@ -126,21 +373,32 @@ class ExamDBScreen(QWidget):
         table_layout.setContentsMargins(14, 14, 14, 14)
         table_layout.setSpacing(8)
 
+        left_title_row = QHBoxLayout()
+        left_title_row.setContentsMargins(0, 0, 0, 0)
         left_title = QLabel("기출 목록")
         left_title.setObjectName("panelTitle")
-        table_layout.addWidget(left_title)
-
-        self.table = QTableWidget()
+        left_title_row.addWidget(left_title)
+        left_title_row.addStretch(1)
+        # 목록 조회 중 표시(워커 완료 시 숨김)
+        self.exam_loading_label = QLabel("불러오는 중…")
+        self.exam_loading_label.setStyleSheet("color:#94A3B8; font-size:9pt;")
+        self.exam_loading_label.setVisible(False)
+        left_title_row.addWidget(self.exam_loading_label)
+        table_layout.addLayout(left_title_row)
+
+        # ✅ 셀마다 QTableWidgetItem/위젯을 만들지 않도록 모델(_exams_cache) + 필터 프록시(검색) 구조
+        self.exam_model = ExamTableModel(self)
+        self.exam_proxy = ExamFilterProxyModel(self)
+        self.exam_proxy.setSourceModel(self.exam_model)
+
+        self.table = QTableView()
         self.table.setObjectName("DBTable")
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels(
-            ["출처", "연도", "학년", "학기", "유형", "학교명", "생성일", "문제수", "상태", "⋯"]
-        )
+        self.table.setModel(self.exam_proxy)
         # ✅ 유형(컬럼 4)을 가장 넓게(Stretch)
         self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.ExtendedSelection)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(False)
         self.table.setShowGrid(True)
         self.table.verticalHeader().setVisible(False)
@@ -153,6 +411,9 @@ class ExamDBScreen(QWidget):
 
         # ✅ 선택 효과(교재DB 동일): delegate로 배경+좌측 라인
         self.table.setItemDelegate(_RowSelectDelegate(self.table))
+        # 상태 배지/더보기(⋯)는 셀 위젯 대신 delegate가 직접 그림
+        self.table.setItemDelegateForColumn(8, _StatusBadgeDelegate(self.table))
+        self.table.setItemDelegateForColumn(9, _MoreActionDelegate(self.table, on_click=self.on_more_clicked))
 
         # 컬럼 너비(유형 4는 Stretch)
         self.table.setColumnWidth(0, 110)  # 출처
@@ -165,15 +426,25 @@ class ExamDBScreen(QWidget):
         self.table.setColumnWidth(8, 90)  # 상태
         self.table.setColumnWidth(9, 70)  # ⋯
 
-        # 헤더 가운데 정렬(전체 컬럼)
-        for col in range(10):
-            header_item = self.table.horizontalHeaderItem(col)
-            if header_item:
-                header_item.setTextAlignment(Qt.AlignCenter)
-
-        # 행 선택 시 Problem 목록 조회
+        # 행 선택 시 Problem 목록 조회. 방향키로 연속 이동하면 마지막 행만 60ms 후 1회 조회
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(60)
+        self._selection_timer.timeout.connect(self._load_problems_for_current_selection)
         self.table.selectionModel().selectionChanged.connect(self.on_table_selection_changed)
 
+        # 미지정만 필터 중 태깅으로 인한 목록 갱신. 단축키 연타 시 마지막 1회만 다시 그림
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(120)
+        self._reload_timer.timeout.connect(self._reload_untagged_problems)
+
+        # 난이도 저장은 250ms 동안 모아 set_problem_difficulties로 일괄 반영
+        self._difficulty_timer = QTimer(self)
+        self._difficulty_timer.setSingleShot(True)
+        self._difficulty_timer.setInterval(250)
+        self._difficulty_timer.timeout.connect(self._flush_pending_difficulty)
+
         # 더보기 메뉴 (우클릭)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.on_table_context_menu)
@@ -259,47 +530,41 @@ class ExamDBScreen(QWidget):
         # 초기 콤보 상태
         self.on_unit_subject_changed(self.unit_subject_combo.currentText())
         
-        self.problem_table = QTableWidget()
+        # ✅ 행마다 QTableWidgetItem 5개를 만들지 않도록 모델 + QTableView(보이는 행만 그림)
+        self.problem_model = ProblemTableModel(self)
+        self.problem_table = QTableView()
         self.problem_table.setObjectName("ProblemTable")
-        self.problem_table.setColumnCount(5)
-        self.problem_table.setHorizontalHeaderLabels([
-            "#", "미리보기", "난이도", "단원", "원본"
-        ])
+        self.problem_table.setModel(self.problem_model)
         # ✅ 폭이 좁아져도 사용자가 컬럼을 조절할 수 있게(기본 Interactive)
         try:
             self.problem_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         except Exception:
             pass
         self.problem_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)  # 미리보기 자동 확장
-        self.problem_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.problem_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.problem_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.problem_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.problem_table.setAlternatingRowColors(False)
         self.problem_table.setShowGrid(True)
         self.problem_table.verticalHeader().setVisible(False)
-        # ✅ 밀도: 행 높이 강제
+        # ✅ 밀도: 행 높이 고정(행마다 setRowHeight 대신 균일 높이)
         try:
+            self.problem_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
             self.problem_table.verticalHeader().setDefaultSectionSize(38)
         except Exception:
             pass
         self.problem_table.setColumnWidth(0, 50)   # #
-        self.problem_table.setColumnWidth(2, 62)   # 난이도(55px 위젯 + 여유)
+        self.problem_table.setColumnWidth(2, 62)   # 난이도
         self.problem_table.setColumnWidth(3, 220)  # 단원(가독성)
         self.problem_table.setColumnWidth(4, 80)  # 원본
         self.problem_table.setWordWrap(False)
 
-        # 헤더 정렬(미리보기 컬럼 제외)
-        for col in range(5):
-            if col != 1:
-                header_item = self.problem_table.horizontalHeaderItem(col)
-                if header_item:
-                    header_item.setTextAlignment(Qt.AlignCenter)
-
-        # 셀 위젯(난이도 콤보) 선택 배경 동기화용
-        self._problem_cell_widgets = {}
-        self.problem_table.selectionModel().selectionChanged.connect(self.on_problem_selection_changed)
+        # 난이도: 행마다 콤보 위젯을 두지 않고 delegate가 글자만 그림. 클릭한 셀에만 편집용 콤보 생성
+        self.problem_table.setItemDelegateForColumn(2, DifficultyDelegate(self.problem_table))
+        self.problem_table.clicked.connect(self._on_problem_clicked)
+        self.problem_model.difficulty_edited.connect(self.on_difficulty_changed)
         
         # Problem 행 더블클릭 시 상세 보기
-        self.problem_table.itemDoubleClicked.connect(self.on_problem_double_clicked)
+        self.problem_table.doubleClicked.connect(self.on_problem_double_clicked)
         # 난이도 단축키(0~4)
         self.problem_table.installEventFilter(self)
         
@@ -314,213 +579,7 @@ class ExamDBScreen(QWidget):
         main_layout.addWidget(splitter)
 
         # ✅ 교재DB와 동일한 QSS 규칙(색/대비/테이블/간격)
-        self.setStyleSheet(
-            """
-            QWidget#ExamDBRoot {
-                background: transparent;
-                font-family: 'Pretendard','Malgun Gothic','맑은 고딕';
-            }
-            QWidget#ExamDBRoot * {
-                outline: none;
-            }
-
-            QLabel#panelTitle {
-                color: #222222;
-                font-size: 12pt;
-                font-weight: 800;
-            }
-            QLabel#InlineLabel {
-                color: #222222;
-                font-weight: 700;
-                background: transparent;
-            }
-
-            QPushButton#primary {
-                background-color: #2563EB;
-                color: #FFFFFF;
-                border: 1px solid #2563EB;
-                border-radius: 10px;
-                padding: 9px 16px;
-                font-weight: 800;
-            }
-            QPushButton#primary:hover { background-color: #1D4ED8; }
-
-            QPushButton#secondary {
-                background-color: #FFFFFF;
-                color: #2563EB;
-                border: 1px solid #2563EB;
-                border-radius: 10px;
-                padding: 8px 14px;
-                min-height: 22px;
-                font-weight: 800;
-            }
-            QPushButton#secondary:hover { background-color: #EFF6FF; }
-            QPushButton#secondary:disabled { color: #94A3B8; border-color: #CBD5E1; }
-            QPushButton#filterApplyBtn {
-                background-color: #FFFFFF;
-                color: #2563EB;
-                border: 1px solid #2563EB;
-                border-radius: 8px;
-                padding: 4px 10px;
-                min-height: 22px;
-                font-weight: 700;
-            }
-            QPushButton#filterApplyBtn:hover { background-color: #EFF6FF; }
-
-            QLineEdit {
-                background-color: #FFFFFF;
-                border: 1.5px solid #CBD5E1;
-                border-radius: 8px;
-                padding: 8px 15px;
-                color: #222222;
-                font-weight: 600;
-            }
-            QLineEdit::placeholder {
-                color: #64748B;
-            }
-            QLineEdit:focus {
-                border: 2px solid #2563EB;
-                padding: 7px 14px;
-            }
-
-            QFrame#leftCard, QFrame#PreviewPanel {
-                background-color: #FFFFFF;
-                border: 1px solid #E2E8F0;
-                border-radius: 12px;
-            }
-
-            QCheckBox#onlyUntagged {
-                color: #222222;
-                font-weight: 800;
-                background: none;
-            }
-            QCheckBox#onlyUntagged::indicator {
-                width: 18px;
-                height: 18px;
-                background: #FFFFFF;
-                border: 2px solid #334155;
-                border-radius: 4px;
-            }
-            QCheckBox#onlyUntagged::indicator:checked {
-                background: #2563EB;
-                border-color: #2563EB;
-            }
-            QCheckBox#onlyUntagged::indicator:disabled {
-                background: #F1F5F9;
-                border-color: #CBD5E1;
-            }
-
-            QComboBox {
-                background-color: #FFFFFF;
-                border: 1.5px solid #CBD5E1;
-                border-radius: 10px;
-                padding: 6px 10px;
-                color: #222222;
-                font-weight: 600;
-            }
-            QComboBox:hover { background-color: #F8FAFC; }
-            QComboBox::drop-down { border: none; }
-            QComboBox QAbstractItemView {
-                background-color: #FFFFFF;
-                border: 1px solid #E0E0E0;
-                selection-background-color: #E2E8F0;
-                selection-color: #222222;
-                outline: 0;
-            }
-
-            QTableWidget#DBTable, QTableWidget#ProblemTable {
-                background-color: #FFFFFF;
-                border: 1px solid #E2E8F0;
-                border-radius: 12px;
-                gridline-color: #E0E0E0;
-                selection-color: #222222;
-                color: #222222;
-                outline: none;
-            }
-            QTableWidget#ProblemTable {
-                selection-background-color: #E8F2FF;
-            }
-            QTableWidget::item {
-                padding-top: 2px;
-                padding-bottom: 2px;
-                padding-left: 12px;
-                padding-right: 12px;
-                color: #222222;
-                background: none;
-                font-weight: 700;
-                border: none;
-                border-bottom: 1px solid #F1F5F9;
-            }
-            QTableWidget::item:selected {
-                background: none;
-                color: #222222;
-                font-weight: 700;
-            }
-            QTableWidget#ProblemTable::item:selected {
-                background-color: #E8F2FF;
-                color: #222222;
-                border: none;
-                border-bottom: 1px solid #D6E8FF;
-            }
-            QTableWidget::item:hover {
-                background: none;
-            }
-
-            QHeaderView::section {
-                background-color: #F8FAFC;
-                color: #222222;
-                font-weight: 800;
-                padding: 0px 10px;
-                border: none;
-                border-right: 1px solid #F1F5F9;
-                border-bottom: 1px solid #F1F5F9;
-            }
-            QHeaderView::section:last {
-                border-right: none;
-            }
-
-            QLabel#StatusBadgeOk {
-                background-color: #F0FDF4;
-                color: #166534;
-                border-radius: 8px;
-                padding: 4px 10px;
-                font-weight: 800;
-            }
-            QLabel#StatusBadgeWarn {
-                background-color: #FFFBEB;
-                color: #92400E;
-                border-radius: 8px;
-                padding: 4px 10px;
-                font-weight: 800;
-            }
-            QLabel#StatusBadgeFail {
-                background-color: #FEF2F2;
-                color: #991B1B;
-                border-radius: 8px;
-                padding: 4px 10px;
-                font-weight: 800;
-            }
-
-            QComboBox#DifficultyCombo {
-                background-color: #ffffff;
-                border: 1px solid #dcdcdc;
-                border-radius: 4px;
-                padding: 0px;
-                min-width: 55px;
-                font-size: 10pt;
-                color: #000000;
-                font-weight: bold;
-            }
-            QComboBox#DifficultyCombo::drop-down { border: none; }
-            QComboBox#DifficultyCombo QAbstractItemView {
-                background-color: #FFFFFF;
-                border: 1px solid #E0E0E0;
-                selection-background-color: #F0F7FF;
-                selection-color: #000000;
-                outline: 0;
-            }
-            """
-        )
+        self.setStyleSheet(_QSS)
 
         # 헤더 높이(밀도 최적화)
         try:
@@ -530,126 +589,66 @@ class ExamDBScreen(QWidget):
             pass
 
 
-    def load_exams(self):
-        """기출 목록 로드"""
-        try:
-            self._exams_cache = self.exam_repo.list_all()
-            self._apply_exam_filters()
-        
-        except ConnectionError as e:
-            QMessageBox.warning(self, "연결 오류", f"DB에 연결할 수 없습니다.\n\n{str(e)}")
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"기출 목록을 불러올 수 없습니다.\n\n{str(e)}")
+    def load_exams(self, select_exam_id: Optional[str] = None):
+        """
+        기출 목록 로드(워커 스레드). 완료 시 _on_exams_loaded에서 필터 적용.
+
+        Args:
+            select_exam_id: 로드 완료 후 선택할 기출 ID
+        """
+        self._exam_load_token += 1
+        self._exam_select_after_load = select_exam_id
+        task = _LoadExamsTask(self._exam_load_token, self.db_connection)
+        task.signals.finished.connect(self._on_exams_loaded)
+        task.signals.error.connect(self._on_exams_load_failed)
+        self._exam_loader = task
+        self.exam_loading_label.setVisible(True)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_exams_loaded(self, token: int, exams: list):
+        if token != self._exam_load_token:
+            return
+        self._exam_loader = None
+        self.exam_loading_label.setVisible(False)
+        self._exams_cache = exams
+        self._exam_index = {e.id: e for e in exams if e.id}
+        self._apply_exam_filters()
+        select_id = self._exam_select_after_load
+        self._exam_select_after_load = None
+        if select_id:
+            self._select_exam_row_by_id(select_id)
+
+    def _on_exams_load_failed(self, token: int, message: str):
+        if token != self._exam_load_token:
+            return
+        self._exam_loader = None
+        self._exam_select_after_load = None
+        self.exam_loading_label.setVisible(False)
+        QMessageBox.warning(self, "오류", f"기출 목록을 불러올 수 없습니다.\n\n{message}")
+
+    def _on_search_text_changed(self, _text: str):
+        """검색어 입력 → 필터 디바운스 재시작"""
+        self._filter_timer.start()
 
     def _apply_exam_filters(self):
         """상단 검색창 기준으로 기출 목록 필터링(데이터 구조 변경 없음)"""
-        exams = list(getattr(self, "_exams_cache", []) or [])
-        query = (self.search_input.text() if getattr(self, "search_input", None) else "") or ""
-        q = query.strip().lower()
-
-        if q:
-            filtered: List[Exam] = []
-            for ex in exams:
-                hay = f"{ex.year or ''} {ex.grade or ''} {ex.semester or ''} {ex.exam_type or ''} {ex.school_name or ''}".lower()
-                if q in hay:
-                    filtered.append(ex)
-            exams = filtered
-
-        self.table.setRowCount(len(exams))
-
-        for row, exam in enumerate(exams):
-            # 출처
-            item = QTableWidgetItem("내신기출")
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, item)
-
-            # 연도
-            item = QTableWidgetItem(exam.year or "")
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 1, item)
-
-            # 학년
-            item = QTableWidgetItem(exam.grade or "")
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 2, item)
-
-            # 학기
-            item = QTableWidgetItem(exam.semester or "")
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 3, item)
-
-            # 유형(중간고사, 기말고사 등) — 컬럼 인덱스 4, 글자색·중앙 정렬 명시
-            type_text = getattr(exam, "exam_type", None) or ""
-            item = QTableWidgetItem(str(type_text) if type_text else "")
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setForeground(QBrush(QColor("#222222")))
-            if type_text:
-                item.setToolTip(str(type_text))
-            self.table.setItem(row, 4, item)
-
-            # 학교명(좌측 정렬) + ID 저장(기존 구조 유지: col 5 item에 UserRole)
-            item = QTableWidgetItem(exam.school_name or "")
-            item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            self.table.setItem(row, 5, item)
-            item.setData(Qt.UserRole, exam.id)
-
-            # 생성일
-            date_str = exam.created_at.strftime("%Y.%m.%d") if getattr(exam, "created_at", None) else ""
-            item = QTableWidgetItem(date_str)
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 6, item)
-
-            # 문제수
-            item = QTableWidgetItem(str(exam.problem_count))
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 7, item)
-
-            # 상태(배지)
-            if exam.is_parsed:
-                status = "완료" if (exam.problem_count or 0) > 0 else "부분"
-            else:
-                status = "실패"
-            badge = QLabel(status)
-            if status == "완료":
-                badge.setObjectName("StatusBadgeOk")
-            elif status == "부분":
-                badge.setObjectName("StatusBadgeWarn")
-            else:
-                badge.setObjectName("StatusBadgeFail")
-            badge.setAlignment(Qt.AlignCenter)
-            badge_wrap = QWidget()
-            wrap_l = QHBoxLayout(badge_wrap)
-            wrap_l.setContentsMargins(0, 0, 0, 0)
-            wrap_l.addStretch()
-            wrap_l.addWidget(badge)
-            wrap_l.addStretch()
-            self.table.setCellWidget(row, 8, badge_wrap)
-
-            # 더보기 버튼
-            btn_more = QPushButton("⋯")
-            btn_more.setMinimumWidth(40)
-            btn_more.setMinimumHeight(28)
-            btn_more.setFont(QFont("맑은 고딕", 14, QFont.Bold))
-            btn_more.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: transparent;
-                    color: #94A3B8;
-                    border: none;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #F1F5F9;
-                    color: #475569;
-                }
-                """
-            )
-            btn_more.clicked.connect(lambda checked, eid=exam.id: self.on_more_clicked(eid))
-            self.table.setCellWidget(row, 9, btn_more)
+        exams = self._exams_cache
+        query = (self.search_input.text() if self.search_input is not None else "") or ""
+
+        # 리셋/필터 중에는 그리기·정렬을 멈추고 끝에서 한 번만 갱신(유형 컬럼 Stretch 고정)
+        with _batched_view_update(self.table, stretch_col=4):
+            # 목록 자체가 바뀐 경우(load_exams)에만 모델 리셋, 검색어 변경은 프록시 필터만 갱신
+            if exams is not self.exam_model.exams():
+                self.exam_model.set_exams(exams)
+            self.exam_proxy.set_query(query.strip().lower())
+
+    def _exam_at(self, view_row: int):
+        """뷰(필터 적용) 행 번호 → Exam"""
+        src = self.exam_proxy.mapToSource(self.exam_proxy.index(view_row, 0))
+        if not src.isValid():
+            return None
+        return self.exam_model.exam_at(src.row())
 
-            # ✅ 행 높이(밀도 최적화)
-            self.table.setRowHeight(row, 38)
-    
     def on_create_db(self):
         """DB 생성 버튼 클릭 처리"""
         # 1. HWP 파일 선택
@@ -675,6 +674,9 @@ class ExamDBScreen(QWidget):
     
     def process_exam_creation(self, hwp_path: str, metadata: dict):
         """기출 생성 및 파싱 처리"""
+        if self._parse_thread is not None:
+            QMessageBox.information(self, "알림", "다른 HWP 파일을 파싱하는 중입니다. 완료 후 다시 시도해주세요.")
+            return
         try:
             # 3. Exam 생성
             exam = Exam(
@@ -695,226 +697,225 @@ class ExamDBScreen(QWidget):
             progress.setWindowModality(Qt.WindowModal)
             progress.setAutoClose(True)
             progress.setAutoReset(True)
-            
-            def progress_callback(current, total):
-                if total > 0:
-                    progress.setMaximum(total)
-                    progress.setValue(current)
-                if progress.wasCanceled():
-                    return False
-                return True
-            
-            # 5. 파싱 실행 (저장되는 한 문제짜리 문서에 스타일 적용)
-            result = self.parsing_service.reparse_exam(
-                exam_id=exam_id,
-                hwp_path=hwp_path,
-                mode=ReparseMode.REPLACE,
-                creator="",  # 추후 사용자 정보에서 가져오기
-                progress_callback=progress_callback,
-                apply_style_to_blocks=True
+
+            # 5. 파싱 실행 (저장되는 한 문제짜리 문서에 스타일 적용) — 워커 스레드에서
+            self._invalidate_problems(exam_id)
+            self._start_parse_worker(exam_id, hwp_path, progress)
+        except Exception as e:
+            self._show_parse_error(e)
+
+    def _start_parse_worker(
+        self, exam_id: str, hwp_path: str, progress: QProgressDialog, label: str = "파싱"
+    ):
+        """reparse_exam을 QThread에서 실행하고 진행률/완료를 시그널로 받음"""
+        thread = QThread(self)
+        worker = _ReparseWorker(self.db_connection, exam_id, hwp_path)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_parse_progress)
+        worker.finished.connect(self._on_parse_finished)
+        worker.failed.connect(self._on_parse_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        # 워커 스레드는 reparse_exam 실행 중이라 이벤트를 못 받으므로 취소 플래그는 직접 호출로 설정
+        progress.canceled.connect(worker.cancel, Qt.DirectConnection)
+
+        self._parse_thread = thread
+        self._parse_worker = worker
+        self._parse_progress = progress
+        self._parse_exam_id = exam_id
+        self._parse_label = label
+        progress.show()
+        thread.start()
+
+    def _end_parse(self):
+        if self._parse_progress is not None:
+            self._parse_progress.close()
+        self._parse_progress = None
+        self._parse_worker = None
+        self._parse_thread = None
+        self._parse_exam_id = None
+        self._flush_pending_difficulty()
+
+    def _on_parse_progress(self, current: int, total: int):
+        progress = self._parse_progress
+        if progress is None or total <= 0:
+            return
+        progress.setMaximum(total)
+        progress.setValue(current)
+
+    def _on_parse_finished(self, result: dict):
+        exam_id = self._parse_exam_id
+        label = self._parse_label
+        self._end_parse()
+        if result.get('success'):
+            QMessageBox.information(
+                self,
+                "완료",
+                f"{label}이 완료되었습니다.\n\n"
+                f"생성된 문제: {result['created_count']}개\n"
+                f"총 문제: {result['total_problems']}개"
             )
-            
-            progress.close()
-            
-            if result['success']:
-                QMessageBox.information(
-                    self,
-                    "완료",
-                    f"파싱이 완료되었습니다.\n\n"
-                    f"생성된 문제: {result['created_count']}개\n"
-                    f"총 문제: {result['total_problems']}개"
-                )
-                # 목록 새로고침
-                self.load_exams()
-            else:
-                QMessageBox.warning(
-                    self,
-                    "파싱 실패",
-                    f"파싱 중 오류가 발생했습니다.\n\n{result.get('error', '알 수 없는 오류')}"
-                )
-        
-        except (HWPNotInstalledError, HWPInitializationError) as e:
+            # 목록 새로고침
+            self.load_exams()
+            if exam_id and self.current_exam_id == exam_id:
+                self._invalidate_problems(exam_id)
+                self.load_problems(exam_id)
+        else:
+            QMessageBox.warning(
+                self,
+                f"{label} 실패",
+                f"{label} 중 오류가 발생했습니다.\n\n{result.get('error', '알 수 없는 오류')}"
+            )
+
+    def _on_parse_failed(self, error: object):
+        self._end_parse()
+        self._show_parse_error(error)
+
+    def _show_parse_error(self, e):
+        """파싱 예외 종류별 안내"""
+        if isinstance(e, (HWPNotInstalledError, HWPInitializationError)):
             QMessageBox.critical(
                 self,
                 "한글 프로그램 오류",
                 f"한글 프로그램을 사용할 수 없습니다.\n\n{str(e)}\n\n"
                 "한글과컴퓨터의 한글 프로그램을 설치한 후 다시 시도해주세요."
             )
-        except ConnectionError as e:
+        elif isinstance(e, ConnectionError):
             QMessageBox.warning(
                 self,
                 "연결 오류",
                 f"DB에 연결할 수 없습니다.\n\n{str(e)}\n\n"
                 "오프라인 모드로 동작 중입니다."
             )
-        except Exception as e:
+        else:
             QMessageBox.critical(self, "오류", f"처리 중 오류가 발생했습니다.\n\n{str(e)}")
     
     def on_table_selection_changed(self, *args):
         """테이블 선택 변경 시 Problem 목록 조회"""
+        self._flush_pending_difficulty()
         selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
-            self.problem_table.setRowCount(0)
+            self._selection_timer.stop()
+            self._clear_problem_rows()
             self.current_exam_id = None
             self.current_exam_grade = None
-            try:
-                if getattr(self, "btn_generate_preview", None):
-                    self.btn_generate_preview.setEnabled(False)
-            except Exception:
-                pass
+            if self.btn_generate_preview is not None:
+                self.btn_generate_preview.setEnabled(False)
             return
         
-        row = selected_rows[0].row()
-        exam_id_item = self.table.item(row, 5)  # 학교명 셀에 ID 저장
-        if not exam_id_item:
+        exam = self._exam_at(selected_rows[0].row())
+        if exam is None:
             return
         
-        exam_id = exam_id_item.data(Qt.UserRole)
+        exam_id = exam.id
         if not exam_id:
             return
         
         self.current_exam_id = exam_id
         # 선택된 exam의 학년은 단원 태그 저장 시 grade로 함께 저장(빠른 실무 태깅)
-        grade_item = self.table.item(row, 2)
-        self.current_exam_grade = grade_item.text() if grade_item else None
-        try:
-            if getattr(self, "btn_generate_preview", None):
-                self.btn_generate_preview.setEnabled(True)
-        except Exception:
-            pass
+        self.current_exam_grade = exam.grade or ""
+        if self.btn_generate_preview is not None:
+            self.btn_generate_preview.setEnabled(self._preview_task is None)
+
+        self._selection_timer.start()
 
-        self.load_problems(exam_id)
+    def _load_problems_for_current_selection(self):
+        """선택이 멈춘 뒤 현재 기출의 Problem 목록 조회"""
+        if self.current_exam_id:
+            self.load_problems(self.current_exam_id)
     
+    def _reload_untagged_problems(self):
+        """(디바운스) 난이도 미지정만 필터 목록 갱신"""
+        if self.current_exam_id:
+            self.load_problems(self.current_exam_id)
+
     def load_problems(self, exam_id: str):
         """Problem 목록 로드"""
         try:
-            problems = self.problem_service.get_problems_by_source(
-                source_id=exam_id,
-                source_type=SourceType.EXAM
-            )
+            problems = self._problems_cache.get(exam_id)
+            if problems is None:
+                # DB에서 다시 읽기 전에 아직 저장 안 된 난이도부터 반영
+                self._flush_pending_difficulty()
+                problems = self.problem_service.get_problems_by_source(
+                    source_id=exam_id,
+                    source_type=SourceType.EXAM
+                )
+                self._problems_cache[exam_id] = problems
+                if len(self._problems_cache) > _PROBLEMS_CACHE_MAX:
+                    self._problems_cache.popitem(last=False)
+            self._problems_cache.move_to_end(exam_id)
 
             # 필터: 난이도 미지정만
-            if getattr(self, "only_untagged_difficulty_checkbox", None) and self.only_untagged_difficulty_checkbox.isChecked():
+            if self.only_untagged_difficulty_checkbox is not None and self.only_untagged_difficulty_checkbox.isChecked():
                 problems = [p for p in problems if not p.get("difficulty")]
             # 필터: 단원 미지정만 (대단원이 비어있으면 미지정으로 판단)
-            if getattr(self, "only_untagged_unit_checkbox", None) and self.only_untagged_unit_checkbox.isChecked():
+            if self.only_untagged_unit_checkbox is not None and self.only_untagged_unit_checkbox.isChecked():
                 problems = [p for p in problems if not p.get("major_unit")]
             
-            self.problem_table.setRowCount(len(problems))
-            self._problem_cell_widgets = {}
-            
-            for row, problem in enumerate(problems):
-                # 문제 번호
-                problem_index = problem.get('problem_index', '')
-                if isinstance(problem_index, list):
-                    problem_index = problem_index[0] if problem_index else ''
-                item = QTableWidgetItem(str(problem_index))
-                item.setTextAlignment(Qt.AlignCenter)
-                item.setData(Qt.UserRole, problem.get('problem_id'))  # ID 저장
-                self.problem_table.setItem(row, 0, item)
-                
-                # 미리보기
-                preview = problem.get('content_text_preview', '')
-                if isinstance(preview, list):
-                    preview = ' '.join(str(x) for x in preview) if preview else ''
-                elif preview is None:
-                    preview = ''
-                preview_text = str(preview)
-                item = QTableWidgetItem(preview_text)
-                item.setTextAlignment(Qt.AlignLeft)
-                if preview_text:
-                    item.setToolTip(preview_text)
-                self.problem_table.setItem(row, 1, item)
-                
-                # 난이도(드롭다운): 최소 55px 너비로 글자 가시성 확보, 중앙 정렬
-                difficulty = problem.get("difficulty")
-                combo = QComboBox()
-                combo.setObjectName("DifficultyCombo")
-                combo.addItems(["미지정", "하", "중", "상", "킬"])
-                combo.setFont(QFont("맑은 고딕", 10))
-                combo.setFixedWidth(55)
-                combo.setMinimumHeight(26)
-                try:
-                    combo.view().setMinimumWidth(80)
-                except Exception:
-                    pass
-
-                current_text = difficulty if difficulty else "미지정"
-                if current_text in ["하", "중", "상", "킬"]:
-                    combo.setCurrentText(current_text)
-                else:
-                    combo.setCurrentText("미지정")
-
-                problem_id = problem.get("problem_id")
-                combo.currentTextChanged.connect(lambda val, pid=problem_id: self.on_difficulty_changed(pid, val))
-                container = QWidget()
-                container.setStyleSheet("QWidget { background-color: transparent; border: none; }")
-                w_layout = QHBoxLayout(container)
-                w_layout.setContentsMargins(0, 0, 0, 0)
-                w_layout.setSpacing(0)
-                w_layout.setAlignment(Qt.AlignCenter)
-                w_layout.addWidget(combo)
-                self.problem_table.setCellWidget(row, 2, container)
-                self._problem_cell_widgets[row] = {2: container}
-
-                # 단원 표시
-                unit_display = problem.get("unit_display") or ""
-                unit_text = unit_display if unit_display else "미지정"
-                item = QTableWidgetItem(str(unit_text))
-                item.setTextAlignment(Qt.AlignCenter)
-                if unit_display:
-                    item.setToolTip(str(unit_display))
-                self.problem_table.setItem(row, 3, item)
-                
-                # 원본
-                has_raw = problem.get('has_content_raw', False)
-                raw_text = "✓" if has_raw else "✗"
-                item = QTableWidgetItem(str(raw_text))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.problem_table.setItem(row, 4, item)
-
-                self.problem_table.setRowHeight(row, 38)
+            # 모델은 전체 목록을 들고 첫 페이지만 노출(나머지는 스크롤 시 fetchMore)
+            table = self.problem_table
+            table.clearSelection()
+            with _batched_view_update(table, stretch_col=1):
+                self.problem_model.set_problems(problems)
+            table.scrollToTop()
         
         except ConnectionError as e:
             QMessageBox.warning(self, "연결 오류", f"DB에 연결할 수 없습니다.\n\n{str(e)}")
         except Exception as e:
             QMessageBox.critical(self, "오류", f"문제 목록을 불러올 수 없습니다.\n\n{str(e)}")
 
-    def on_problem_selection_changed(self, selected, deselected):
-        """문제 테이블 선택 변경 시 난이도 셀 위젯 배경을 행 하이라이트(#E8F2FF)와 동일하게"""
-        try:
-            deselected_rows = {idx.row() for idx in deselected.indexes()}
-            selected_rows = {idx.row() for idx in selected.indexes()}
-
-            for r in deselected_rows:
-                widgets = self._problem_cell_widgets.get(r, {})
-                for w in widgets.values():
-                    w.setStyleSheet("QWidget { background-color: transparent; border: none; }")
-
-            for r in selected_rows:
-                widgets = self._problem_cell_widgets.get(r, {})
-                for w in widgets.values():
-                    w.setStyleSheet("QWidget { background-color: #E8F2FF; border: none; }")
-        except Exception:
-            pass
+    def _clear_problem_rows(self) -> None:
+        """문제 목록/행 비우기"""
+        self.problem_model.set_problems([])
+
+    def _invalidate_problems(self, exam_id: Optional[str]) -> None:
+        """해당 기출의 문제 목록 캐시 제거(재파싱/미리보기 생성/삭제 등 변경 후)"""
+        if exam_id:
+            self._problems_cache.pop(exam_id, None)
+
+    def _on_problem_clicked(self, index: QModelIndex):
+        """난이도 셀 한 번 클릭으로 편집(콤보) 열기"""
+        if index.isValid() and index.column() == 2:
+            self.problem_table.edit(index)
 
     def on_difficulty_changed(self, problem_id: str, value: str):
-        """난이도 변경 처리"""
+        """난이도 변경 처리(모델 행/캐시 dict는 setData에서 이미 갱신됨)"""
         if not problem_id:
             return
+        self._pending_difficulty[str(problem_id)] = None if value == "미지정" else value
+        # 연타 중에도 첫 입력 기준 250ms 안에는 저장되도록 재시작하지 않음
+        if not self._difficulty_timer.isActive():
+            self._difficulty_timer.start()
+
+        # 미지정만 필터가 켜져 있으면, 태깅 후 목록 갱신(편집기 커밋이 끝난 뒤)
+        if self.only_untagged_difficulty_checkbox is not None and self.only_untagged_difficulty_checkbox.isChecked():
+            if self.current_exam_id:
+                self._reload_timer.start()
+
+    def _flush_pending_difficulty(self, force: bool = False):
+        """모아 둔 난이도 변경을 한 번에 저장"""
+        self._difficulty_timer.stop()
+        if not self._pending_difficulty:
+            return
+        if self._parse_thread is not None and not force:
+            # (재)파싱 워커가 자기 연결로 쓰기 트랜잭션을 잡고 있으므로 끝날 때(_end_parse)까지 미룸
+            return
+        pending, self._pending_difficulty = self._pending_difficulty, {}
         try:
-            difficulty = None if value == "미지정" else value
-            self.problem_service.set_problem_difficulty(problem_id, difficulty)
-
-            # 미지정만 필터가 켜져 있으면, 태깅 후 목록 갱신
-            if getattr(self, "only_untagged_difficulty_checkbox", None) and self.only_untagged_difficulty_checkbox.isChecked():
-                if self.current_exam_id:
-                    self.load_problems(self.current_exam_id)
+            self.problem_service.set_problem_difficulties(pending)
         except ConnectionError as e:
             QMessageBox.warning(self, "연결 오류", f"DB에 연결할 수 없습니다.\n\n{str(e)}")
         except Exception as e:
             QMessageBox.critical(self, "오류", f"난이도를 저장할 수 없습니다.\n\n{str(e)}")
 
+    def closeEvent(self, event):
+        """닫히기 전에 대기 중인 난이도 변경 저장"""
+        self._flush_pending_difficulty(force=True)
+        super().closeEvent(event)
+
     def on_only_untagged_changed(self):
         """미지정만 보기 토글(난이도/단원)"""
         if self.current_exam_id:
@@ -924,64 +925,94 @@ class ExamDBScreen(QWidget):
         """현재 기출의 미리보기 텍스트를 일괄 생성"""
         if not self.current_exam_id:
             return
-        try:
-            progress = QProgressDialog("미리보기 텍스트를 생성하는 중...", "취소", 0, 100, self)
-            progress.setWindowModality(Qt.WindowModal)
-            progress.setAutoClose(True)
-            progress.setAutoReset(True)
+        if self._preview_task is not None:
+            return
+        # 미리보기 생성은 문제 행 전체를 다시 쓰므로 대기 중인 난이도부터 저장
+        self._flush_pending_difficulty()
+        if not self.db_connection.is_connected():
+            QMessageBox.warning(self, "연결 오류", "DB에 연결되지 않았습니다.")
+            return
 
-            def progress_callback(current, total):
-                if total <= 0:
-                    progress.setMaximum(1)
-                    progress.setValue(0)
-                else:
-                    progress.setMaximum(total)
-                    progress.setValue(current)
-                if progress.wasCanceled():
-                    return False
-                return True
+        progress = QProgressDialog("미리보기 텍스트를 생성하는 중...", "취소", 0, 100, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+
+        task = _GeneratePreviewsTask(self.db_connection, self.current_exam_id)
+        # 취소 버튼 → 워커가 다음 progress_callback에서 중단
+        progress.canceled.connect(task.cancel_event.set)
+        task.signals.progress.connect(self._on_preview_progress)
+        task.signals.finished.connect(self._on_previews_finished)
+        task.signals.error.connect(self._on_previews_failed)
+        self._preview_task = task
+        self._preview_progress = progress
+        if self.btn_generate_preview is not None:
+            self.btn_generate_preview.setEnabled(False)
+        progress.show()
+        QThreadPool.globalInstance().start(task)
+
+    def _end_previews(self):
+        """미리보기 작업 정리(다이얼로그 닫기/버튼 복원)"""
+        if self._preview_progress is not None:
+            self._preview_progress.close()
+            self._preview_progress.deleteLater()
+        self._preview_progress = None
+        self._preview_task = None
+        if self.btn_generate_preview is not None:
+            self.btn_generate_preview.setEnabled(bool(self.current_exam_id))
+
+    def _on_preview_progress(self, current: int, total: int):
+        progress = self._preview_progress
+        if progress is None:
+            return
+        if total <= 0:
+            progress.setMaximum(1)
+            progress.setValue(0)
+        else:
+            progress.setMaximum(total)
+            progress.setValue(current)
 
-            result = self.problem_service.generate_previews_for_source(
-                source_id=self.current_exam_id,
-                source_type=SourceType.EXAM,
-                only_missing=True,
-                progress_callback=progress_callback,
-            )
-            progress.close()
-            QMessageBox.information(
-                self,
-                "완료",
-                f"미리보기 생성이 완료되었습니다.\n\n"
-                f"- 대상: {result.get('total', 0)}개\n"
-                f"- 생성: {result.get('updated', 0)}개\n"
-                f"- 건너뜀: {result.get('skipped', 0)}개\n"
-                f"- 실패: {result.get('failed', 0)}개"
-            )
-            self.load_problems(self.current_exam_id)
-        except ConnectionError as e:
-            QMessageBox.warning(self, "연결 오류", f"DB에 연결할 수 없습니다.\n\n{str(e)}")
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"미리보기를 생성할 수 없습니다.\n\n{str(e)}")
+    def _on_previews_finished(self, exam_id: str, result: dict):
+        self._end_previews()
+        self._invalidate_problems(exam_id)
+        QMessageBox.information(
+            self,
+            "완료",
+            f"미리보기 생성이 완료되었습니다.\n\n"
+            f"- 대상: {result.get('total', 0)}개\n"
+            f"- 생성: {result.get('updated', 0)}개\n"
+            f"- 건너뜀: {result.get('skipped', 0)}개\n"
+            f"- 실패: {result.get('failed', 0)}개"
+        )
+        if self.current_exam_id == exam_id:
+            self.load_problems(exam_id)
+
+    def _on_previews_failed(self, error: object):
+        self._end_previews()
+        if isinstance(error, ConnectionError):
+            QMessageBox.warning(self, "연결 오류", f"DB에 연결할 수 없습니다.\n\n{str(error)}")
+        else:
+            QMessageBox.critical(self, "오류", f"미리보기를 생성할 수 없습니다.\n\n{str(error)}")
 
     def on_unit_subject_changed(self, subject: str):
         """과목 변경 → 대단원/소단원 갱신"""
         self.major_unit_combo.blockSignals(True)
         self.major_unit_combo.clear()
-        self.major_unit_combo.addItem("선택")
-        if subject and subject != "선택":
-            self.major_unit_combo.addItems(list_major_units(subject))
+        self.major_unit_combo.addItems(_major_unit_choices(subject))
         self.major_unit_combo.blockSignals(False)
 
+        self.sub_unit_combo.blockSignals(True)
         self.sub_unit_combo.clear()
-        self.sub_unit_combo.addItem("(없음)")
+        self.sub_unit_combo.addItems(_sub_unit_choices("", ""))
+        self.sub_unit_combo.blockSignals(False)
 
     def on_unit_major_changed(self, major: str):
         """대단원 변경 → 소단원 갱신"""
         subject = self.unit_subject_combo.currentText()
+        self.sub_unit_combo.blockSignals(True)
         self.sub_unit_combo.clear()
-        self.sub_unit_combo.addItem("(없음)")
-        if subject and subject != "선택" and major and major != "선택":
-            self.sub_unit_combo.addItems(list_sub_units(subject, major))
+        self.sub_unit_combo.addItems(_sub_unit_choices(subject, major))
+        self.sub_unit_combo.blockSignals(False)
 
     def apply_unit_to_selection(self):
         """현재 입력된 과목/대단원/소단원을 선택된 문제들에 일괄 적용"""
@@ -1004,43 +1035,28 @@ class ExamDBScreen(QWidget):
         if not selected:
             return
 
+        unit_text = f"{major} > {sub}" if sub else major
         try:
-            for idx in selected:
-                row = idx.row()
-                problem_id_item = self.problem_table.item(row, 0)
-                if not problem_id_item:
-                    continue
-                problem_id = problem_id_item.data(Qt.UserRole)
-                if not problem_id:
-                    continue
-                self.problem_service.set_problem_unit(
-                    problem_id=problem_id,
-                    subject=subject,
-                    major_unit=major,
-                    sub_unit=sub,
-                    grade=self.current_exam_grade
-                )
-                # 화면 즉시 반영
-                unit_text = f"{major} > {sub}" if sub else major
-                unit_item = self.problem_table.item(row, 3)
-                if unit_item:
-                    unit_item.setText(unit_text)
-                else:
-                    unit_item = QTableWidgetItem(unit_text)
-                    unit_item.setTextAlignment(Qt.AlignCenter)
-                    self.problem_table.setItem(row, 3, unit_item)
-
-            # 단원 미지정만 필터가 켜져 있으면, 태깅 후 목록 갱신(방금 태깅한 문제들 제거)
-            if getattr(self, "only_untagged_unit_checkbox", None) and self.only_untagged_unit_checkbox.isChecked():
-                self.load_problems(self.current_exam_id)
-                if self.problem_table.rowCount() > 0:
+            with _batched_view_update(self.problem_table, stretch_col=1):
+                saved = self._apply_unit_rows(selected, subject, major, sub, unit_text)
+            if not saved:
+                # 일부/전부 저장 실패 → 화면·캐시를 DB 기준으로 다시 읽음
+                exam_id = self.current_exam_id
+                self._invalidate_problems(exam_id)
+                self.load_problems(exam_id)
+                QMessageBox.warning(self, "저장 실패", "일부 문제의 단원을 저장하지 못했습니다. 목록을 다시 불러왔습니다.")
+                return
+
+            # 단원 미지정만 필터가 켜져 있으면 태깅한 행은 이미 빠졌으므로 첫 행 선택
+            if self.only_untagged_unit_checkbox is not None and self.only_untagged_unit_checkbox.isChecked():
+                if self.problem_model.rowCount() > 0:
                     self.problem_table.selectRow(0)
                 return
 
             # 다음 행 이동(빠른 전수 태깅)
             current_row = selected[0].row()
             if not self._select_next_untagged_unit(current_row):
-                next_row = min(current_row + 1, self.problem_table.rowCount() - 1)
+                next_row = min(current_row + 1, self.problem_model.rowCount() - 1)
                 if next_row != current_row:
                     self.problem_table.selectRow(next_row)
         except ConnectionError as e:
@@ -1048,14 +1064,44 @@ class ExamDBScreen(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "오류", f"단원을 저장할 수 없습니다.\n\n{str(e)}")
 
+    def _apply_unit_rows(self, selected, subject: str, major: str, sub, unit_text: str) -> bool:
+        """선택 행들에 단원 저장(set_problem_units 1회) + 모델 행 갱신. 전부 저장됐을 때만 True"""
+        rows: List[int] = []
+        problem_ids: List[str] = []
+        for idx in selected:
+            problem_id = self.problem_model.problem_id(idx.row())
+            if problem_id:
+                rows.append(idx.row())
+                problem_ids.append(str(problem_id))
+        if not problem_ids:
+            return True
+        saved = self.problem_service.set_problem_units(
+            problem_ids,
+            subject=subject,
+            major_unit=major,
+            sub_unit=sub,
+            grade=self.current_exam_grade
+        )
+        if saved != len(problem_ids):
+            return False
+        # 화면/캐시 즉시 반영(목록 재조회 없음). 모델 행 dict는 캐시와 같은 객체
+        self.problem_model.update_units(
+            rows, subject=subject, major_unit=major, sub_unit=sub, unit_display=unit_text
+        )
+        # 단원 미지정만 보기 중이면 방금 태깅한 행만 목록에서 제거(필터 목록은 캐시의 사본)
+        if self.only_untagged_unit_checkbox is not None and self.only_untagged_unit_checkbox.isChecked():
+            self.problem_model.remove_rows(rows)
+        return True
+
     def _select_next_untagged_unit(self, from_row: int) -> bool:
-        """현재 행 다음부터 '단원 미지정'인 문제를 찾아 이동"""
-        for r in range(from_row + 1, self.problem_table.rowCount()):
-            item = self.problem_table.item(r, 3)
-            if item and item.text() == "미지정":
-                self.problem_table.selectRow(r)
-                return True
-        return False
+        """현재 행 다음의 '단원 미지정' 문제로 이동(아직 안 채운 페이지면 거기까지 불러옴)"""
+        model = self.problem_model
+        r = model.next_untagged_unit_row(from_row)
+        if r < 0:
+            return False
+        model.ensure_loaded(r)
+        self.problem_table.selectRow(r)
+        return True
 
     def eventFilter(self, obj, event):
         """단축키: 난이도(0~4), 단원 적용(Enter)"""
@@ -1077,31 +1123,17 @@ class ExamDBScreen(QWidget):
                 selected = self.problem_table.selectionModel().selectedRows()
                 if selected:
                     row = selected[0].row()
-                    widget = self.problem_table.cellWidget(row, 2)
-                    combo = None
-                    if isinstance(widget, QComboBox):
-                        combo = widget
-                    elif isinstance(widget, QWidget):
-                        try:
-                            combo = widget.findChild(QComboBox)
-                        except Exception:
-                            combo = None
-                    if combo:
-                        combo.setCurrentText(mapping[key])
-                        next_row = min(row + 1, self.problem_table.rowCount() - 1)
+                    if row < self.problem_model.rowCount():
+                        self.problem_model.setData(self.problem_model.index(row, 2), mapping[key])
+                        next_row = min(row + 1, self.problem_model.rowCount() - 1)
                         if next_row != row:
                             self.problem_table.selectRow(next_row)
                 return True
         return super().eventFilter(obj, event)
     
-    def on_problem_double_clicked(self, item):
+    def on_problem_double_clicked(self, index: QModelIndex):
         """Problem 더블클릭 시 상세 보기"""
-        row = item.row()
-        problem_id_item = self.problem_table.item(row, 0)
-        if not problem_id_item:
-            return
-        
-        problem_id = problem_id_item.data(Qt.UserRole)
+        problem_id = self.problem_model.problem_id(index.row())
         if not problem_id:
             return
         
@@ -1122,36 +1154,41 @@ class ExamDBScreen(QWidget):
     
     def on_more_clicked(self, exam_id: str):
         """더보기 버튼 클릭 처리"""
-        from PyQt5.QtWidgets import QMenu
-        
         selected_ids = self._get_selected_exam_ids()
         target_ids = selected_ids if (exam_id in selected_ids and len(selected_ids) > 1) else [exam_id]
-
-        menu = QMenu(self)
-        
-        action_edit = menu.addAction("수정")
-        action_delete = menu.addAction("삭제")
-        action_reparse = menu.addAction("재파싱")
-
-        if len(target_ids) != 1:
-            action_edit.setEnabled(False)
-            action_reparse.setEnabled(False)
-        
-        action = menu.exec_(self.table.mapToGlobal(self.table.viewport().mapFromGlobal(
+        self._exec_row_menu(target_ids, self.table.mapToGlobal(self.table.viewport().mapFromGlobal(
             self.table.cursor().pos()
         )))
-        
-        if action == action_edit:
+
+    def _exec_row_menu(self, target_ids: List[str], global_pos):
+        """기출 행 메뉴를 띄우고 고른 동작 실행(여러 개 선택 시 수정/재파싱 비활성)"""
+        if self._row_menu is None:
+            self._row_menu = QMenu(self)
+            self._action_edit = self._row_menu.addAction("수정")
+            self._action_delete = self._row_menu.addAction("삭제")
+            self._action_reparse = self._row_menu.addAction("재파싱")
+
+        single = len(target_ids) == 1
+        self._action_edit.setEnabled(single)
+        self._action_reparse.setEnabled(single)
+
+        action = self._row_menu.exec_(global_pos)
+
+        if action is None:
+            return
+        if action == self._action_edit:
             self.on_edit_exam(target_ids[0])
-        elif action == action_delete:
+        elif action == self._action_delete:
             self.on_delete_exams(target_ids)
-        elif action == action_reparse:
+        elif action == self._action_reparse:
             self.on_reparse_exam(target_ids[0])
     
     def on_edit_exam(self, exam_id: str):
         """기출 수정"""
         try:
-            exam = self.exam_repo.find_by_id(exam_id)
+            # 목록 로드 때 받아 둔 값을 복사해 사용(수정 실패 시 캐시가 오염되지 않게), 없으면 DB 조회
+            cached = self._exam_index.get(exam_id)
+            exam = dataclasses.replace(cached) if cached is not None else self.exam_repo.find_by_id(exam_id)
             if not exam:
                 QMessageBox.warning(self, "오류", "기출 정보를 찾을 수 없습니다.")
                 return
@@ -1202,6 +1239,7 @@ class ExamDBScreen(QWidget):
             exam.school_name = new_school
 
             updated = self.exam_repo.update(exam)
+            self._exam_index.pop(exam_id, None)
             if (not updated) and (not changed):
                 QMessageBox.information(self, "완료", "변경 사항이 없습니다.")
             elif updated or changed:
@@ -1209,8 +1247,7 @@ class ExamDBScreen(QWidget):
             else:
                 QMessageBox.warning(self, "오류", "기출을 수정할 수 없습니다.")
 
-            self.load_exams()
-            self._select_exam_row_by_id(exam_id)
+            self.load_exams(select_exam_id=exam_id)
         except ConnectionError as e:
             QMessageBox.warning(self, "연결 오류", f"DB에 연결할 수 없습니다.\n\n{str(e)}")
         except Exception as e:
@@ -1242,24 +1279,25 @@ class ExamDBScreen(QWidget):
             return
 
         try:
-            deleted_sources = 0
-            deleted_problems = 0
-            failed: List[str] = []
-
-            for eid in ids:
-                deleted_problems += self.problem_service.delete_problems_by_source(
-                    eid, SourceType.EXAM
-                )
-                if self.exam_repo.delete(eid):
-                    deleted_sources += 1
-                else:
-                    failed.append(eid)
+            # 연결 문제 + 기출을 IN (...) 두 문장으로 지우고 한 번에 커밋.
+            # 문제 삭제가 실패하면 예외로 빠져나가 기출은 지우지 않음(롤백 완료 상태)
+            deleted_problems = self.problem_service.delete_problems_by_sources(
+                ids, SourceType.EXAM, commit=False
+            )
+            deleted_ids = set(self.exam_repo.delete_many(ids))
+            for eid in deleted_ids:
+                self._invalidate_problems(eid)
+                self._exam_index.pop(eid, None)
+            if not deleted_ids:
+                deleted_problems = 0
+            deleted_sources = len(deleted_ids)
+            failed = [eid for eid in ids if eid not in deleted_ids]
 
             self.load_exams()
             if self.current_exam_id in ids:
                 self.current_exam_id = None
                 self.current_exam_grade = None
-                self.problem_table.setRowCount(0)
+                self._clear_problem_rows()
 
             if failed:
                 QMessageBox.warning(
@@ -1280,7 +1318,10 @@ class ExamDBScreen(QWidget):
             QMessageBox.critical(self, "오류", f"삭제 중 오류가 발생했습니다.\n\n{str(e)}")
     
     def on_reparse_exam(self, exam_id: str):
-        """기출 재파싱"""
+        """기출 재파싱(워커 스레드에서 실행, 완료 시 목록 새로고침)"""
+        if self._parse_thread is not None:
+            QMessageBox.information(self, "알림", "다른 HWP 파일을 파싱하는 중입니다. 완료 후 다시 시도해주세요.")
+            return
         # HWP 파일 선택
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -1298,64 +1339,22 @@ class ExamDBScreen(QWidget):
             progress.setWindowModality(Qt.WindowModal)
             progress.setAutoClose(True)
             progress.setAutoReset(True)
-            
-            def progress_callback(current, total):
-                if total > 0:
-                    progress.setMaximum(total)
-                    progress.setValue(current)
-                if progress.wasCanceled():
-                    return False
-                return True
-            
-            # 재파싱 실행 (저장되는 한 문제짜리 문서에 스타일 적용)
-            result = self.parsing_service.reparse_exam(
-                exam_id=exam_id,
-                hwp_path=file_path,
-                mode=ReparseMode.REPLACE,
-                creator="",
-                progress_callback=progress_callback,
-                apply_style_to_blocks=True
-            )
-            
-            progress.close()
-            
-            if result['success']:
-                QMessageBox.information(
-                    self,
-                    "완료",
-                    f"재파싱이 완료되었습니다.\n\n"
-                    f"생성된 문제: {result['created_count']}개\n"
-                    f"총 문제: {result['total_problems']}개"
-                )
-                # 목록 새로고침
-                self.load_exams()
-                if self.current_exam_id == exam_id:
-                    self.load_problems(exam_id)
-            else:
-                QMessageBox.warning(
-                    self,
-                    "파싱 실패",
-                    f"재파싱 중 오류가 발생했습니다.\n\n{result.get('error', '알 수 없는 오류')}"
-                )
-        
-        except (HWPNotInstalledError, HWPInitializationError) as e:
-            QMessageBox.critical(
-                self,
-                "한글 프로그램 오류",
-                f"한글 프로그램을 사용할 수 없습니다.\n\n{str(e)}"
-            )
-        except ConnectionError as e:
-            QMessageBox.warning(self, "연결 오류", f"DB에 연결할 수 없습니다.\n\n{str(e)}")
+
+            # 재파싱 실행 (저장되는 한 문제짜리 문서에 스타일 적용) — 워커 스레드에서
+            self._flush_pending_difficulty()
+            self._invalidate_problems(exam_id)
+            self._exam_index.pop(exam_id, None)
+            self._start_parse_worker(exam_id, file_path, progress, label="재파싱")
         except Exception as e:
-            QMessageBox.critical(self, "오류", f"재파싱 중 오류가 발생했습니다.\n\n{str(e)}")
+            self._show_parse_error(e)
     
     def on_table_context_menu(self, position):
         """테이블 우클릭 메뉴"""
-        item = self.table.itemAt(position)
-        if not item:
+        index = self.table.indexAt(position)
+        if not index.isValid():
             return
         
-        row = item.row()
+        row = index.row()
         # 우클릭한 행이 현재 선택에 없으면, 해당 행만 선택(멀티 선택 유지 케이스 고려)
         try:
             if not self.table.selectionModel().isRowSelected(row, self.table.rootIndex()):
@@ -1364,99 +1363,739 @@ class ExamDBScreen(QWidget):
         except Exception:
             pass
 
-        exam_id_item = self.table.item(row, 5)
-        if not exam_id_item:
-            return
-        
-        exam_id = exam_id_item.data(Qt.UserRole)
+        exam = self._exam_at(row)
+        exam_id = exam.id if exam is not None else None
         if not exam_id:
             return
 
         selected_ids = self._get_selected_exam_ids()
         target_ids = selected_ids if (exam_id in selected_ids and len(selected_ids) > 1) else [exam_id]
-        
-        from PyQt5.QtWidgets import QMenu
-        
-        menu = QMenu(self)
-        action_edit = menu.addAction("수정")
-        action_delete = menu.addAction("삭제")
-        action_reparse = menu.addAction("재파싱")
-
-        if len(target_ids) != 1:
-            action_edit.setEnabled(False)
-            action_reparse.setEnabled(False)
-        
-        action = menu.exec_(self.table.viewport().mapToGlobal(position))
-        
-        if action == action_edit:
-            self.on_edit_exam(target_ids[0])
-        elif action == action_delete:
-            self.on_delete_exams(target_ids)
-        elif action == action_reparse:
-            self.on_reparse_exam(target_ids[0])
+        self._exec_row_menu(target_ids, self.table.viewport().mapToGlobal(position))
 
     def _get_selected_exam_ids(self) -> List[str]:
-        """기출 테이블에서 선택된 행들의 exam_id 리스트"""
-        ids: List[str] = []
+        """기출 테이블에서 선택된 행들의 exam_id 리스트(선택 순서 유지, 중복 제거)"""
         try:
-            selected = self.table.selectionModel().selectedRows()
-            for idx in selected:
-                r = idx.row()
-                item = self.table.item(r, 5)
-                if item:
-                    eid = item.data(Qt.UserRole)
-                    if eid:
-                        ids.append(str(eid))
+            # 학교명(5) 컬럼 인덱스의 UserRole = exam_id (프록시가 원본 모델로 위임)
+            ids = [idx.data(Qt.UserRole) for idx in self.table.selectionModel().selectedRows(5)]
         except Exception:
             return []
-        uniq: List[str] = []
-        seen = set()
-        for x in ids:
-            if x not in seen:
-                seen.add(x)
-                uniq.append(x)
-        return uniq
+        return list(dict.fromkeys(str(x) for x in ids if x))
 
     def _select_exam_row_by_id(self, exam_id: str) -> None:
         """목록 새로고침 후 특정 기출 행을 다시 선택"""
         if not exam_id:
             return
         try:
-            for r in range(self.table.rowCount()):
-                item = self.table.item(r, 5)
-                if item and item.data(Qt.UserRole) == exam_id:
-                    self.table.selectRow(r)
-                    break
+            src_row = self.exam_model.row_of(exam_id)
+            if src_row < 0:
+                return
+            # 검색 필터에 걸러진 행이면 프록시 인덱스가 무효
+            idx = self.exam_proxy.mapFromSource(self.exam_model.index(src_row, 0))
+            if idx.isValid():
+                self.table.selectRow(idx.row())
         except Exception:
             pass
 
 
+@contextmanager
+def _batched_view_update(table, stretch_col: Optional[int] = None):
+    """
+    대량 갱신 동안 그리기/시그널/정렬을 멈추고 끝에서 한 번만 다시 그림.
+    stretch_col: Stretch 컬럼은 행 변경마다 resizeSections가 돌므로 그 동안 Fixed로 고정.
+    """
+    prev_sort = table.isSortingEnabled()
+    header = table.horizontalHeader()
+    prev_mode = header.sectionResizeMode(stretch_col) if stretch_col is not None else None
+    if stretch_col is not None:
+        header.setSectionResizeMode(stretch_col, QHeaderView.Fixed)
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    table.setSortingEnabled(False)
+    try:
+        yield table
+    finally:
+        if stretch_col is not None:
+            header.setSectionResizeMode(stretch_col, prev_mode)
+        table.setSortingEnabled(prev_sort)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
+
+
+# 셀 그리기에 쓰는 색/브러시는 paint/data 호출마다 만들지 않고 공유
+_SELECT_BG = QColor("#E2E8F0")
+_SELECT_LINE = QColor("#2563EB")
+_CELL_TEXT = QColor("#000000")
+_TYPE_FG_BRUSH = QBrush(QColor("#222222"))
+_MORE_HOVER_BG = QColor("#F1F5F9")
+_MORE_FG = QColor("#94A3B8")
+_MORE_FG_HOVER = QColor("#475569")
+
+
 class _RowSelectDelegate(QStyledItemDelegate):
     """선택 행 강조: 배경 + 좌측 블루 포인트 라인."""
 
-    def paint(self, painter: QPainter, option, index):  # type: ignore[override]
+    def _paint_selection(self, painter: QPainter, option, index) -> bool:
+        """선택 행이면 배경(+0번 컬럼 좌측 라인)을 그리고 True 반환."""
         selected = bool(option.state & QStyle.State_Selected)
+        if selected:
+            painter.save()
+            painter.setPen(Qt.NoPen)
+            # 선택 배경은 연한 회색만(요구사항)
+            painter.setBrush(_SELECT_BG)
+            painter.drawRect(option.rect)
+            if index.column() == 0:
+                painter.setBrush(_SELECT_LINE)
+                painter.drawRect(option.rect.left(), option.rect.top(), 4, option.rect.height())
+            painter.restore()
+        return selected
+
+    def paint(self, painter: QPainter, option, index):  # type: ignore[override]
         # hover 하이라이트는 "배경 노이즈"가 될 수 있어 사용하지 않음
+        selected = self._paint_selection(painter, option, index)
 
         opt = option
         if selected:
             opt.state = opt.state & ~QStyle.State_Selected
-            opt.palette.setColor(opt.palette.Text, QColor("#000000"))
+            opt.palette.setColor(opt.palette.Text, _CELL_TEXT)
             f = opt.font
             f.setWeight(QFont.Bold)
             opt.font = f
         else:
-            opt.palette.setColor(opt.palette.Text, QColor("#000000"))
+            opt.palette.setColor(opt.palette.Text, _CELL_TEXT)
 
-        if selected:
-            painter.save()
+        super().paint(painter, opt, index)
+
+
+# 상태 배지: (배경, 글자) 색. 모델은 _STATUS_ROLE로 상태 문자열을 제공
+_STATUS_ROLE = Qt.UserRole + 1
+_STATUS_BADGE_COLORS = {
+    "완료": (QColor("#F0FDF4"), QColor("#166534")),
+    "부분": (QColor("#FFFBEB"), QColor("#92400E")),
+    "실패": (QColor("#FEF2F2"), QColor("#991B1B")),
+}
+
+
+class _StatusBadgeDelegate(_RowSelectDelegate):
+    """상태 컬럼: QLabel 셀 위젯 대신 둥근 배지를 직접 그림."""
+
+    def paint(self, painter: QPainter, option, index):  # type: ignore[override]
+        self._paint_selection(painter, option, index)
+        text = str(index.data(_STATUS_ROLE) or "")
+        if not text:
+            return
+        bg, fg = _STATUS_BADGE_COLORS.get(text, _STATUS_BADGE_COLORS["실패"])
+        painter.save()
+        f = QFont(option.font)
+        f.setWeight(QFont.ExtraBold)
+        painter.setFont(f)
+        fm = painter.fontMetrics()
+        w = fm.horizontalAdvance(text) + 20
+        h = fm.height() + 8
+        r = QRect(0, 0, w, h)
+        r.moveCenter(option.rect.center())
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(r, 8, 8)
+        painter.setPen(fg)
+        painter.drawText(r, Qt.AlignCenter, text)
+        painter.restore()
+
+
+class _MoreActionDelegate(_RowSelectDelegate):
+    """더보기 컬럼: 행마다 QPushButton을 두지 않고 ⋯ 글리프를 그리고, 클릭은 editorEvent에서 처리."""
+
+    def __init__(self, parent=None, *, on_click=None):
+        super().__init__(parent)
+        self._on_click = on_click
+        # 글리프 폰트는 delegate당 1회만 생성
+        self._font = QFont("맑은 고딕", 14, QFont.Bold)
+
+    @staticmethod
+    def _button_rect(option) -> QRect:
+        r = QRect(0, 0, 40, 28)
+        r.moveCenter(option.rect.center())
+        return r
+
+    def paint(self, painter: QPainter, option, index):  # type: ignore[override]
+        self._paint_selection(painter, option, index)
+        hover = bool(option.state & QStyle.State_MouseOver)
+        painter.save()
+        r = self._button_rect(option)
+        if hover:
+            painter.setRenderHint(QPainter.Antialiasing, True)
             painter.setPen(Qt.NoPen)
-            # 선택 배경은 연한 회색만(요구사항)
-            painter.setBrush(QColor("#E2E8F0"))
-            painter.drawRect(option.rect)
-            if index.column() == 0:
-                painter.setBrush(QColor("#2563EB"))
-                painter.drawRect(option.rect.left(), option.rect.top(), 4, option.rect.height())
-            painter.restore()
+            painter.setBrush(_MORE_HOVER_BG)
+            painter.drawRoundedRect(r, 8, 8)
+        painter.setFont(self._font)
+        painter.setPen(_MORE_FG_HOVER if hover else _MORE_FG)
+        painter.drawText(r, Qt.AlignCenter, "⋯")
+        painter.restore()
 
-        super().paint(painter, opt, index)
+    def editorEvent(self, event, model, option, index):  # type: ignore[override]
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and self._button_rect(option).contains(event.pos())
+        ):
+            exam_id = index.data(Qt.UserRole)
+            if exam_id and self._on_click is not None:
+                self._on_click(exam_id)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+_EXAM_HEADERS = ["출처", "연도", "학년", "학기", "유형", "학교명", "생성일", "문제수", "상태", "⋯"]
+
+
+def _exam_status(exam: Exam) -> str:
+    if exam.is_parsed:
+        return "완료" if (exam.problem_count or 0) > 0 else "부분"
+    return "실패"
+
+
+class _ReparseWorker(QObject):
+    """reparse_exam을 워커 스레드에서 실행(REPLACE, 블록 스타일 적용). DB는 이 스레드 전용 쓰기 연결로."""
+
+    progress = pyqtSignal(int, int)  # (current, total)
+    finished = pyqtSignal(dict)  # reparse_exam 결과
+    failed = pyqtSignal(object)  # 예외 객체
+
+    def __init__(self, db_connection: SQLiteConnection, exam_id: str, hwp_path: str):
+        super().__init__()
+        self.db_connection = db_connection
+        self.exam_id = exam_id
+        self.hwp_path = hwp_path
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def _progress_callback(self, current, total) -> bool:
+        self.progress.emit(int(current or 0), int(total or 0))
+        return not self._cancelled
+
+    def run(self) -> None:
+        # 한글 COM 자동화는 호출 스레드마다 COM 초기화가 필요
+        com = None
+        try:
+            import pythoncom  # type: ignore
+            pythoncom.CoInitialize()
+            com = pythoncom
+        except Exception:
+            com = None
+        writer = None
+        try:
+            # 메인(GUI) 연결을 스레드 간에 공유하지 않음: 이 스레드에서 연 연결로 삭제·재삽입 후 commit
+            writer = self.db_connection.open_writer()
+            result = ParsingService(writer).reparse_exam(
+                exam_id=self.exam_id,
+                hwp_path=self.hwp_path,
+                mode=ReparseMode.REPLACE,
+                creator="",  # 추후 사용자 정보에서 가져오기
+                progress_callback=self._progress_callback,
+                apply_style_to_blocks=True
+            )
+        except Exception as e:
+            self.failed.emit(e)
+            return
+        finally:
+            if writer is not None:
+                writer.disconnect()
+            if com is not None:
+                try:
+                    com.CoUninitialize()
+                except Exception:
+                    pass
+        self.finished.emit(result if isinstance(result, dict) else {})
+
+
+class _LoadExamsSignals(QObject):
+    finished = pyqtSignal(int, list)  # (token, exams)
+    error = pyqtSignal(int, str)  # (token, message)
+
+
+class _LoadExamsTask(QRunnable):
+    """기출 목록을 워커 스레드에서 조회(SQLite 조회 동안 UI가 멈추지 않도록)."""
+
+    def __init__(self, token: int, db_connection: SQLiteConnection):
+        super().__init__()
+        self.token = token
+        self.db_connection = db_connection
+        self.signals = _LoadExamsSignals()
+
+    def run(self) -> None:
+        reader = None
+        try:
+            # sqlite3 연결은 스레드 간 공유 불가 → 이 스레드 전용 연결로 조회
+            reader = self.db_connection.open_reader()
+            exams = list(ExamRepository(reader).list_all() or [])
+        except Exception as e:
+            self.signals.error.emit(self.token, str(e))
+            return
+        finally:
+            if reader is not None:
+                reader.disconnect()
+        self.signals.finished.emit(self.token, exams)
+
+
+class _PreviewSignals(QObject):
+    progress = pyqtSignal(int, int)  # (current, total)
+    finished = pyqtSignal(str, dict)  # (exam_id, generate_previews_for_source 결과)
+    error = pyqtSignal(object)  # 예외 객체
+
+
+class _GeneratePreviewsTask(QRunnable):
+    """기출 1개의 미리보기 텍스트 일괄 생성을 워커 스레드에서 실행(취소는 cancel_event로)."""
+
+    def __init__(self, db_connection: SQLiteConnection, exam_id: str):
+        super().__init__()
+        self.db_connection = db_connection
+        self.exam_id = exam_id
+        self.cancel_event = threading.Event()
+        self.signals = _PreviewSignals()
+
+    def _progress_callback(self, current, total) -> bool:
+        self.signals.progress.emit(int(current or 0), int(total or 0))
+        return not self.cancel_event.is_set()
+
+    def run(self) -> None:
+        com = None
+        try:
+            import pythoncom  # type: ignore
+            pythoncom.CoInitialize()
+            com = pythoncom
+        except Exception:
+            com = None
+        writer = None
+        try:
+            # 미리보기를 문제 행에 저장하므로 이 스레드 전용 쓰기 연결 사용
+            writer = self.db_connection.open_writer()
+            result = ProblemService(writer).generate_previews_for_source(
+                source_id=self.exam_id,
+                source_type=SourceType.EXAM,
+                only_missing=True,
+                progress_callback=self._progress_callback,
+            )
+        except Exception as e:
+            self.signals.error.emit(e)
+            return
+        finally:
+            if writer is not None:
+                writer.disconnect()
+            if com is not None:
+                try:
+                    com.CoUninitialize()
+                except Exception:
+                    pass
+        self.signals.finished.emit(self.exam_id, result if isinstance(result, dict) else {})
+
+
+class ExamTableModel(QAbstractTableModel):
+    """기출 목록 모델: Exam 리스트와 함께 컬럼별 표시 문자열 배열을 들고 data()는 인덱싱만 한다."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._exams: List[Exam] = []
+        # 컬럼별 표시 문자열(행 순서와 동일). 목록 로드 시 1회만 계산
+        self._columns: List[List[str]] = [[] for _ in _EXAM_HEADERS]
+        self._ids: List[str] = []
+        # exam_id → 원본 행 번호
+        self._row_by_id: Dict[str, int] = {}
+        self._statuses: List[str] = []
+        # 검색용 소문자 문자열(행 순서와 동일)
+        self._search_keys: List[str] = []
+        # 3글자 조각 → 그 조각을 포함하는 행 번호(3글자 이상 검색어의 후보 축소용)
+        self._trigrams: Dict[str, Set[int]] = {}
+
+    def exams(self) -> List[Exam]:
+        return self._exams
+
+    def set_exams(self, exams: List[Exam]) -> None:
+        self.beginResetModel()
+        self._exams = exams
+        years = [ex.year or "" for ex in exams]
+        grades = [ex.grade or "" for ex in exams]
+        semesters = [ex.semester or "" for ex in exams]
+        types = [str(ex.exam_type or "") for ex in exams]
+        schools = [ex.school_name or "" for ex in exams]
+        dates = [ex.created_at.strftime("%Y.%m.%d") if ex.created_at else "" for ex in exams]
+        counts = [str(ex.problem_count) for ex in exams]
+        self._statuses = [_exam_status(ex) for ex in exams]
+        self._ids = [ex.id for ex in exams]
+        self._row_by_id = {eid: row for row, eid in enumerate(self._ids)}
+        n = len(exams)
+        self._columns = [
+            ["내신기출"] * n, years, grades, semesters, types, schools, dates, counts, self._statuses, [""] * n,
+        ]
+        self._search_keys = [
+            f"{y} {g} {sm} {t} {sc}".lower()
+            for y, g, sm, t, sc in zip(years, grades, semesters, types, schools)
+        ]
+        trigrams: Dict[str, Set[int]] = defaultdict(set)
+        for row, key in enumerate(self._search_keys):
+            for i in range(len(key) - 2):
+                trigrams[key[i:i + 3]].add(row)
+        self._trigrams = dict(trigrams)
+        self.endResetModel()
+
+    def search_key(self, row: int) -> str:
+        return self._search_keys[row]
+
+    def trigram_candidates(self, query: str) -> Optional[Set[int]]:
+        """
+        검색어의 모든 3글자 조각을 포함하는 행 집합(최종 부분 일치 확인 전 후보).
+        검색어가 3글자 미만이면 None(전체 선형 검사).
+        """
+        if len(query) < 3:
+            return None
+        sets = []
+        for i in range(len(query) - 2):
+            rows = self._trigrams.get(query[i:i + 3])
+            if not rows:
+                return set()
+            sets.append(rows)
+        sets.sort(key=len)
+        return set.intersection(*sets)
+
+    def row_of(self, exam_id: str) -> int:
+        """exam_id의 원본 행 번호(없으면 -1)"""
+        return self._row_by_id.get(exam_id, -1)
+
+    def exam_at(self, row: int):
+        if 0 <= row < len(self._exams):
+            return self._exams[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._exams)
+
+    def columnCount(self, parent=QModelIndex()):  # type: ignore[override]
+        return 0 if parent.isValid() else len(_EXAM_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # type: ignore[override]
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole and 0 <= section < len(_EXAM_HEADERS):
+                return _EXAM_HEADERS[section]
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if role == Qt.DisplayRole:
+            return self._columns[col][row]
+        if role == Qt.TextAlignmentRole:
+            # 학교명만 좌측 정렬
+            return int(Qt.AlignVCenter | Qt.AlignLeft) if col == 5 else int(Qt.AlignCenter)
+        if role == Qt.UserRole:
+            return self._ids[row]
+        if role == _STATUS_ROLE:
+            return self._statuses[row]
+        if role == Qt.ForegroundRole and col == 4:
+            return _TYPE_FG_BRUSH
+        if role == Qt.ToolTipRole and col == 4:
+            return self._columns[4][row] or None
+        return None
+
+
+_PROBLEM_HEADERS = ["#", "미리보기", "난이도", "단원", "원본"]
+
+
+class DifficultyDelegate(QStyledItemDelegate):
+    """난이도 컬럼: 평소에는 글자만 그리고, 편집할 때만 QComboBox 편집기를 만든다."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 편집기 폰트는 delegate당 1회만 생성
+        self._font = QFont("맑은 고딕", 10)
+
+    def createEditor(self, parent, option, index):  # type: ignore[override]
+        combo = QComboBox(parent)
+        combo.setObjectName("DifficultyCombo")
+        combo.addItems(_DIFFICULTY_CHOICES)
+        combo.setFont(self._font)
+        try:
+            combo.view().setMinimumWidth(80)
+        except Exception:
+            pass
+        # 항목을 고르면 바로 저장하고 편집 종료
+        combo.activated.connect(self._commit_and_close)
+        return combo
+
+    def setEditorData(self, editor, index):  # type: ignore[override]
+        editor.setCurrentText(index.data(Qt.EditRole) or "미지정")
+        QTimer.singleShot(0, editor.showPopup)
+
+    def setModelData(self, editor, model, index):  # type: ignore[override]
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):  # type: ignore[override]
+        r = QRect(0, 0, min(option.rect.width(), 55), 26)
+        r.moveCenter(option.rect.center())
+        editor.setGeometry(r)
+
+    def _commit_and_close(self, *_):
+        editor = self.sender()
+        if editor is None:
+            return
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+
+_DIFFICULTY_CHOICES = ("미지정", "하", "중", "상", "킬")
+
+
+class ProblemTableModel(QAbstractTableModel):
+    """
+    문제 목록 모델: get_problems_by_source 결과(dict 리스트)를 그대로 들고 셀 값은 data()에서 계산.
+    전체 목록 중 page_size 단위로만 행을 노출하고, 뷰가 끝까지 스크롤하면 fetchMore로 다음 페이지.
+    난이도(2) 컬럼만 편집 가능하며, 값이 바뀌면 difficulty_edited(problem_id, 난이도 텍스트)를 알린다.
+    """
+
+    difficulty_edited = pyqtSignal(object, str)
+
+    def __init__(self, parent=None, page_size: int = 50):
+        super().__init__(parent)
+        self._rows: List[dict] = []
+        self._loaded = 0
+        self._page_size = page_size
+        # 단원 미지정 행 번호(오름차순, 아직 노출 안 된 페이지 포함). 다음 미지정 행을 bisect로 찾음
+        self._untagged_unit_rows: List[int] = []
+
+    def set_problems(self, rows: List[dict]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(self._page_size, len(rows))
+        self._untagged_unit_rows = [r for r, p in enumerate(rows) if not p.get("unit_display")]
+        self.endResetModel()
+
+    def next_untagged_unit_row(self, after: int) -> int:
+        """after 다음의 단원 미지정 행 번호(전체 목록 기준, 없으면 -1)"""
+        rows = self._untagged_unit_rows
+        i = bisect_right(rows, after)
+        return rows[i] if i < len(rows) else -1
+
+    def ensure_loaded(self, row: int) -> None:
+        """row까지 노출되도록 남은 페이지를 이어서 불러옴"""
+        while row >= self._loaded and self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def problem_at(self, row: int) -> Optional[dict]:
+        if 0 <= row < self._loaded:
+            return self._rows[row]
+        return None
+
+    def problem_id(self, row: int):
+        p = self.problem_at(row)
+        return p.get("problem_id") if p else None
+
+    def update_problem(self, row: int, **fields) -> None:
+        """행 dict를 제자리에서 수정하고 해당 행만 다시 그림"""
+        p = self.problem_at(row)
+        if p is None:
+            return
+        p.update(fields)
+        if "unit_display" in fields:
+            self._track_unit(row, bool(fields["unit_display"]))
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(_PROBLEM_HEADERS) - 1))
+
+    def update_units(self, rows: List[int], **fields) -> None:
+        """여러 행의 단원 필드를 수정하고 단원(3) 컬럼의 해당 범위만 한 번에 다시 그림"""
+        rows = [r for r in rows if 0 <= r < self._loaded]
+        if not rows:
+            return
+        tagged = bool(fields.get("unit_display"))
+        for r in rows:
+            self._rows[r].update(fields)
+            self._track_unit(r, tagged)
+        self.dataChanged.emit(
+            self.index(min(rows), 3), self.index(max(rows), 3), [Qt.DisplayRole, Qt.ToolTipRole]
+        )
+
+    def remove_rows(self, rows: List[int]) -> None:
+        """노출된 행들을 연속 구간별 beginRemoveRows로 제거(전체 리셋 없이)"""
+        rows = sorted({r for r in rows if 0 <= r < self._loaded}, reverse=True)
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self._loaded -= last - first + 1
+            self.endRemoveRows()
+        if rows:
+            self._untagged_unit_rows = [r for r, p in enumerate(self._rows) if not p.get("unit_display")]
+
+    def _track_unit(self, row: int, tagged: bool) -> None:
+        """단원 미지정 행 목록(_untagged_unit_rows)에 row의 태깅 상태 반영"""
+        rows = self._untagged_unit_rows
+        i = bisect_right(rows, row) - 1
+        if i >= 0 and rows[i] == row:
+            if tagged:
+                del rows[i]
+        elif not tagged:
+            rows.insert(i + 1, row)
+
+    def rowCount(self, parent=QModelIndex()):  # type: ignore[override]
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):  # type: ignore[override]
+        return 0 if parent.isValid() else len(_PROBLEM_HEADERS)
+
+    def canFetchMore(self, parent):  # type: ignore[override]
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent):  # type: ignore[override]
+        if parent.isValid():
+            return
+        n = min(self._page_size, len(self._rows) - self._loaded)
+        if n <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + n - 1)
+        self._loaded += n
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # type: ignore[override]
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole and 0 <= section < len(_PROBLEM_HEADERS):
+                return _PROBLEM_HEADERS[section]
+            # 헤더 정렬(미리보기 컬럼 제외)
+            if role == Qt.TextAlignmentRole and section != 1:
+                return Qt.AlignCenter
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        p = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                problem_index = p.get("problem_index", "")
+                if isinstance(problem_index, list):
+                    problem_index = problem_index[0] if problem_index else ""
+                return str(problem_index)
+            if col == 1:
+                return _preview_text(p)
+            if col == 2:
+                return _difficulty_text(p)
+            if col == 3:
+                return str(p.get("unit_display") or "미지정")
+            if col == 4:
+                return "✓" if p.get("has_content_raw", False) else "✗"
+            return ""
+        if role == Qt.EditRole and col == 2:
+            return _difficulty_text(p)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignVCenter | Qt.AlignLeft) if col == 1 else int(Qt.AlignCenter)
+        if role == Qt.ToolTipRole:
+            if col == 1:
+                # 셀 폭 안에 다 보이는 짧은 미리보기는 툴팁 생략
+                text = _preview_text(p)
+                return text if len(text) > _PREVIEW_TOOLTIP_MIN else None
+            if col == 3:
+                return str(p.get("unit_display") or "") or None
+            return None
+        if role == Qt.UserRole:
+            return p.get("problem_id")
+        return None
+
+
+    def flags(self, index):  # type: ignore[override]
+        f = super().flags(index)
+        if index.isValid() and index.column() == 2:
+            f |= Qt.ItemIsEditable
+        return f
+
+    def setData(self, index, value, role=Qt.EditRole):  # type: ignore[override]
+        if role != Qt.EditRole or not index.isValid() or index.column() != 2:
+            return False
+        p = self.problem_at(index.row())
+        if p is None:
+            return False
+        text = value if value in _DIFFICULTY_CHOICES else "미지정"
+        difficulty = None if text == "미지정" else text
+        if (p.get("difficulty") or None) == difficulty:
+            return False
+        p["difficulty"] = difficulty
+        self.dataChanged.emit(index, index)
+        self.difficulty_edited.emit(p.get("problem_id"), text)
+        return True
+
+
+def _difficulty_text(problem: dict) -> str:
+    d = problem.get("difficulty")
+    return d if d in _DIFFICULTY_CHOICES else "미지정"
+
+
+# 이 길이(글자 수) 이하의 미리보기는 셀에 다 보이므로 툴팁을 만들지 않음
+_PREVIEW_TOOLTIP_MIN = 60
+
+
+def _preview_text(problem: dict) -> str:
+    # get_problems_by_source가 항상 압축된 str로 돌려줌
+    return problem.get("content_text_preview") or ""
+
+
+class ExamFilterProxyModel(QSortFilterProxyModel):
+    """검색어(소문자) 부분 일치 필터. 필터링은 뷰 재구성 없이 프록시에서 처리.
+
+    통과한 원본 행 집합을 기억해 두고, 검색어가 좁혀지는 경우(이전 검색어를 포함)에는
+    이전 통과 행만 다시 검사한다. 통과 집합이 바뀌지 않으면 invalidateFilter 자체를 생략.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ""
+        # None = 필터 없음(전체 통과)
+        self._accepted: Optional[Set[int]] = None
+
+    def setSourceModel(self, model):  # type: ignore[override]
+        super().setSourceModel(model)
+        try:
+            model.modelReset.connect(self._on_source_reset)
+        except Exception:
+            pass
+
+    def _on_source_reset(self) -> None:
+        # 목록이 새로 로드되면 행 번호가 바뀌므로 통과 집합을 처음부터 다시 계산
+        self._accepted = self._compute_accepted(self._query, None)
+        self.invalidateFilter()
+
+    def _compute_accepted(self, query: str, candidates) -> Optional[Set[int]]:
+        if not query:
+            return None
+        src = self.sourceModel()
+        if src is None:
+            return set()
+        shortlist = src.trigram_candidates(query)
+        if shortlist is not None:
+            candidates = shortlist if candidates is None else shortlist.intersection(candidates)
+        elif candidates is None:
+            candidates = range(src.rowCount())
+        key = src.search_key
+        return {r for r in candidates if query in key(r)}
+
+    def set_query(self, query: str) -> None:
+        if query == self._query:
+            return
+        prev_query, prev_accepted = self._query, self._accepted
+        narrowing = bool(prev_query) and prev_accepted is not None and prev_query in query
+        accepted = self._compute_accepted(query, prev_accepted if narrowing else None)
+        self._query = query
+        self._accepted = accepted
+        if accepted == prev_accepted:
+            return
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):  # type: ignore[override]
+        accepted = self._accepted
+        return accepted is None or source_row in accepted
@@ -6,10 +6,11 @@
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QMargins
+from PyQt5.QtGui import QFont, QColor, QPixmap, QPainter
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -19,17 +20,135 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QMessageBox,
     QFrame,
-    QGraphicsDropShadowEffect,
+    qDrawBorderPixmap,
 )
 
+from services.login_api import login as api_login
+from ui.components.app_footer import create_app_footer
+from ui.components.fonts import app_font
 
-def _font(size_pt: int, weight: int = QFont.Normal) -> QFont:
-    f = QFont("Pretendard")
-    if not f.exactMatch():
-        f = QFont("맑은 고딕")
-    f.setPointSize(int(size_pt))
-    f.setWeight(int(weight))
-    return f
+
+# 로그인 카드 스타일시트(인스턴스마다 문자열을 새로 만들지 않도록 모듈 상수로 1회 정의)
+_LOGIN_CARD_QSS = """
+    QFrame#LoginCard {
+        background-color: white;
+        border: none;
+    }
+    QFrame#LoginCard QLabel#LoginTitle {
+        font-size: 36pt;
+        font-weight: 900;
+        color: #000000;
+        background: transparent;
+        border: none;
+    }
+    QFrame#LoginCard QLineEdit {
+        background-color: white;
+        border: 1px solid #E0E0E0;
+        border-radius: 8px;
+        padding: 12px;
+        font-size: 11pt;
+        color: #1A1A1A;
+    }
+    QFrame#LoginCard QLineEdit:focus {
+        border: 1px solid #E0E0E0;
+    }
+    QFrame#LoginCard QLineEdit::placeholder {
+        color: #555555;
+    }
+    QFrame#LoginCard QPushButton#LoginBtn {
+        background-color: #1976D2;
+        color: white;
+        font-weight: bold;
+        font-size: 13pt;
+        border: none;
+        border-radius: 8px;
+        padding: 12px;
+    }
+    QFrame#LoginCard QPushButton#LoginBtn:hover {
+        background-color: #1565C0;
+    }
+    QFrame#LoginCard QPushButton#LoginBtn:pressed {
+        background-color: #0D47A1;
+    }
+    QFrame#LoginCard QPushButton#LoginBtn:disabled {
+        background-color: #B0BEC5;
+    }
+"""
+
+
+# 카드 그림자: 번짐 반경(px), 아래쪽 오프셋(px), 가장 진한 곳의 알파
+_SHADOW_BLUR = 20
+_SHADOW_Y_OFFSET = 2
+_SHADOW_ALPHA = 30
+
+
+@lru_cache(maxsize=None)
+def _card_shadow_pixmap() -> QPixmap:
+    """9-slice용 그림자 픽스맵(바깥 → 안쪽으로 진해지는 링을 겹쳐 그림). 최초 1회만 생성."""
+    b = _SHADOW_BLUR
+    size = b * 2 + 8
+    pm = QPixmap(size, size)
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setPen(Qt.NoPen)
+    for i in range(b):
+        step = round(_SHADOW_ALPHA * (i + 1) / b) - round(_SHADOW_ALPHA * i / b)
+        if step <= 0:
+            continue
+        painter.setBrush(QColor(0, 0, 0, step))
+        painter.drawRoundedRect(i, i, size - 2 * i, size - 2 * i, b - i, b - i)
+    painter.end()
+    return pm
+
+
+class _ShadowHost(QWidget):
+    """
+    자식 카드 둘레에 미리 그려 둔 그림자 픽스맵을 9-slice로 그리는 래퍼.
+    QGraphicsDropShadowEffect처럼 다시 그릴 때마다 카드 전체를 오프스크린 렌더링하지 않음.
+    """
+
+    def __init__(self, child: QWidget, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        lay = QVBoxLayout(self)
+        b = _SHADOW_BLUR
+        lay.setContentsMargins(b, b, b, b)
+        lay.setSpacing(0)
+        lay.addWidget(child)
+
+    def paintEvent(self, event):  # type: ignore[override]
+        b = _SHADOW_BLUR
+        painter = QPainter(self)
+        qDrawBorderPixmap(
+            painter,
+            self.rect().translated(0, _SHADOW_Y_OFFSET),
+            QMargins(b, b, b, b),
+            _card_shadow_pixmap(),
+        )
+        painter.end()
+
+
+class _LoginSignals(QObject):
+    finished = pyqtSignal(str, dict)  # (user_id, api_login 결과)
+    failed = pyqtSignal(str)  # 오류 메시지
+
+
+class _LoginTask(QRunnable):
+    """로그인 API 호출을 워커 스레드에서 실행(네트워크 대기 동안 UI가 멈추지 않도록)."""
+
+    def __init__(self, user_id: str, password: str):
+        super().__init__()
+        self.user_id = user_id
+        self.password = password
+        self.signals = _LoginSignals()
+
+    def run(self) -> None:
+        try:
+            result = api_login(self.user_id, self.password)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self.user_id, result if isinstance(result, dict) else {})
 
 
 class LoginScreen(QWidget):
@@ -39,6 +158,8 @@ class LoginScreen(QWidget):
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        # 진행 중인 로그인 요청(완료 전 중복 요청 방지 + 시그널 객체 참조 유지)
+        self._login_task: Optional[_LoginTask] = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -53,58 +174,10 @@ class LoginScreen(QWidget):
         self.login_card = QFrame()
         self.login_card.setObjectName("LoginCard")
         self.login_card.setFixedWidth(380)
-        self.login_card.setStyleSheet("""
-            QFrame#LoginCard {
-                background-color: white;
-                border: none;
-            }
-            QFrame#LoginCard QLabel#LoginTitle {
-                font-size: 36pt;
-                font-weight: 900;
-                color: #000000;
-                background: transparent;
-                border: none;
-            }
-            QFrame#LoginCard QLineEdit {
-                background-color: white;
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 11pt;
-                color: #1A1A1A;
-            }
-            QFrame#LoginCard QLineEdit:focus {
-                border: 1px solid #E0E0E0;
-            }
-            QFrame#LoginCard QLineEdit::placeholder {
-                color: #555555;
-            }
-            QFrame#LoginCard QPushButton#LoginBtn {
-                background-color: #1976D2;
-                color: white;
-                font-weight: bold;
-                font-size: 13pt;
-                border: none;
-                border-radius: 8px;
-                padding: 12px;
-            }
-            QFrame#LoginCard QPushButton#LoginBtn:hover {
-                background-color: #1565C0;
-            }
-            QFrame#LoginCard QPushButton#LoginBtn:pressed {
-                background-color: #0D47A1;
-            }
-            QFrame#LoginCard QPushButton#LoginBtn:disabled {
-                background-color: #B0BEC5;
-            }
-        """)
-
-        shadow = QGraphicsDropShadowEffect(self.login_card)
-        shadow.setBlurRadius(20)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        self.login_card.setGraphicsEffect(shadow)
+        # 카드는 QSS 흰 배경(모서리 없음)으로 전체를 칠하므로 부모 배경 지우기 생략
+        self.login_card.setAttribute(Qt.WA_StyledBackground, True)
+        self.login_card.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.login_card.setStyleSheet(_LOGIN_CARD_QSS)
 
         card_layout = QVBoxLayout(self.login_card)
         card_layout.setContentsMargins(40, 36, 40, 36)
@@ -115,7 +188,7 @@ class LoginScreen(QWidget):
         title = QLabel("HanQ")
         title.setObjectName("LoginTitle")
         title.setAlignment(Qt.AlignCenter)
-        title.setFont(_font(36, QFont.Black))
+        title.setFont(app_font(36, QFont.Black))
         title.setStyleSheet("background: transparent; border: none; color: #000000;")
         card_layout.addWidget(title)
 
@@ -125,7 +198,7 @@ class LoginScreen(QWidget):
         self.inp_id = QLineEdit()
         self.inp_id.setPlaceholderText("아이디를 입력하세요")
         self.inp_id.setMinimumHeight(44)
-        self.inp_id.setClearButtonEnabled(True)
+        self.inp_id.setClearButtonEnabled(False)
         card_layout.addWidget(self.inp_id)
 
         self.inp_password = QLineEdit()
@@ -149,28 +222,14 @@ class LoginScreen(QWidget):
         # 카드 수평 중앙 배치
         h_layout = QHBoxLayout()
         h_layout.addStretch(1)
-        h_layout.addWidget(self.login_card)
+        h_layout.addWidget(_ShadowHost(self.login_card))
         h_layout.addStretch(1)
         main_layout.addLayout(h_layout)
 
         main_layout.addStretch(1)
 
-        # 푸터 (메인 페이지 스타일, 바닥 고정)
-        footer_layout = QVBoxLayout()
-        footer_layout.setSpacing(4)
-
-        copy_lbl = QLabel("© 2026 HanQ. All rights reserved.")
-        copy_lbl.setStyleSheet("color: #777777; font-size: 10pt; background: transparent; border: none;")
-        copy_lbl.setAlignment(Qt.AlignCenter)
-
-        dev_lbl = QLabel("Developed by 이창현수학")
-        dev_lbl.setStyleSheet("color: #333333; font-size: 10pt; font-weight: bold; background: transparent; border: none;")
-        dev_lbl.setAlignment(Qt.AlignCenter)
-        dev_lbl.setFont(_font(10, QFont.DemiBold))
-
-        footer_layout.addWidget(copy_lbl)
-        footer_layout.addWidget(dev_lbl)
-        main_layout.addLayout(footer_layout)
+        # 푸터 (공용 푸터, 바닥 고정). 로그인 화면은 "Developed by"까지 #333 굵게 유지
+        main_layout.addWidget(create_app_footer(spacing=4, bold_dev_by=True))
 
     def _on_login(self) -> None:
         user_id = (self.inp_id.text() or "").strip()
@@ -181,15 +240,22 @@ class LoginScreen(QWidget):
             self.inp_id.setFocus()
             return
 
-        self.btn_login.setEnabled(False)
-        try:
-            from services.login_api import login as api_login
-            result = api_login(user_id, password)
-        except Exception as e:
-            QMessageBox.warning(self, "오류", f"로그인 요청 중 오류가 발생했습니다.\n\n{e}")
-            self.btn_login.setEnabled(True)
+        if self._login_task is not None:
             return
+        self.btn_login.setEnabled(False)
+        task = _LoginTask(user_id, password)
+        task.signals.finished.connect(self._on_login_finished)
+        task.signals.failed.connect(self._on_login_failed)
+        self._login_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_login_failed(self, message: str) -> None:
+        self._login_task = None
+        self.btn_login.setEnabled(True)
+        QMessageBox.warning(self, "오류", f"로그인 요청 중 오류가 발생했습니다.\n\n{message}")
 
+    def _on_login_finished(self, user_id: str, result: dict) -> None:
+        self._login_task = None
         self.btn_login.setEnabled(True)
         if result.get("success"):
             name = result.get("name") or user_id
@@ -3,16 +3,20 @@
 
 - 기존 디자인 전면 폐기 (Rewrite from scratch)
 - 중앙 Hero + CTA + 3단 Feature 카드
-- Opacity + Geometry 애니메이션
+- 위치(슬라이드) 애니메이션
 - 메인 페이지 진입 시 헤더 탭 하이라이트 해제
 """
 
 from __future__ import annotations
 
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Callable, Optional, List, Tuple
 
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QEasingCurve, QPropertyAnimation
-from PyQt5.QtGui import QFont, QColor, QPixmap, QPainter, QPen
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QTimer, QEasingCurve, QPropertyAnimation, QPoint,
+    QParallelAnimationGroup, QSequentialAnimationGroup,
+)
+from PyQt5.QtGui import QFont, QColor, QPixmap, QPainter, QPen, QPixmapCache
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -21,9 +25,11 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QFrame,
     QSizePolicy,
-    QGraphicsOpacityEffect,
 )
 
+from ui.components.app_footer import create_app_footer
+from ui.components.fonts import app_font
+
 try:
     import qtawesome as qta  # type: ignore
 
@@ -33,15 +39,12 @@ except Exception:
     _QTA_AVAILABLE = False
 
 
+# 랜딩 페이지는 Inter를 먼저 찾음
+_FONT_FAMILIES = ("Inter", "Pretendard")
+
+
 def _font(size_pt: int, weight: int) -> QFont:
-    f = QFont("Inter")
-    if not f.exactMatch():
-        f = QFont("Pretendard")
-    if not f.exactMatch():
-        f = QFont("맑은 고딕")
-    f.setPointSize(int(size_pt))
-    f.setWeight(int(weight))
-    return f
+    return app_font(size_pt, weight, families=_FONT_FAMILIES)
 
 
 def _qta_pixmap(icon_name: str, color: str, size: int) -> Optional[QPixmap]:
@@ -53,18 +56,17 @@ def _qta_pixmap(icon_name: str, color: str, size: int) -> Optional[QPixmap]:
         return None
 
 
-def _fallback_file_pixmap(color_hex: str = "#2563EB", size: int = 28) -> QPixmap:
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    c = QColor(color_hex)
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.Antialiasing, True)
-    pen = QPen(c)
-    pen.setWidthF(2.0)
+@lru_cache(maxsize=None)
+def _icon_pen(color_hex: str, width: float) -> QPen:
+    """대체 아이콘용 펜(색 문자열 파싱/펜 생성은 (색, 두께)당 1회)"""
+    pen = QPen(QColor(color_hex))
+    pen.setWidthF(width)
     pen.setCapStyle(Qt.RoundCap)
     pen.setJoinStyle(Qt.RoundJoin)
-    painter.setPen(pen)
-    painter.setBrush(Qt.NoBrush)
+    return pen
+
+
+def _draw_file(painter: QPainter, size: int) -> None:
     # sheet
     pad = 6
     painter.drawRoundedRect(pad, pad, size - pad * 2, size - pad * 2, 6, 6)
@@ -75,41 +77,15 @@ def _fallback_file_pixmap(color_hex: str = "#2563EB", size: int = 28) -> QPixmap
     x2 = size - pad - 5
     painter.drawLine(x1, y1, x2, y1)
     painter.drawLine(x1, y2, int(size * 0.78), y2)
-    painter.end()
-    return pm
 
 
-def _fallback_check_pixmap(color_hex: str = "#2563EB", size: int = 28) -> QPixmap:
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    c = QColor(color_hex)
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.Antialiasing, True)
-    pen = QPen(c)
-    pen.setWidthF(2.6)
-    pen.setCapStyle(Qt.RoundCap)
-    pen.setJoinStyle(Qt.RoundJoin)
-    painter.setPen(pen)
-    painter.setBrush(Qt.NoBrush)
+def _draw_check(painter: QPainter, size: int) -> None:
     # check
     painter.drawLine(int(size * 0.20), int(size * 0.55), int(size * 0.42), int(size * 0.74))
     painter.drawLine(int(size * 0.42), int(size * 0.74), int(size * 0.82), int(size * 0.28))
-    painter.end()
-    return pm
 
 
-def _fallback_user_pixmap(color_hex: str = "#2563EB", size: int = 28) -> QPixmap:
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    c = QColor(color_hex)
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.Antialiasing, True)
-    pen = QPen(c)
-    pen.setWidthF(2.0)
-    pen.setCapStyle(Qt.RoundCap)
-    pen.setJoinStyle(Qt.RoundJoin)
-    painter.setPen(pen)
-    painter.setBrush(Qt.NoBrush)
+def _draw_user(painter: QPainter, size: int) -> None:
     # head
     r = int(size * 0.22)
     cx = int(size * 0.5)
@@ -121,67 +97,111 @@ def _fallback_user_pixmap(color_hex: str = "#2563EB", size: int = 28) -> QPixmap
     w = int(size * 0.60)
     h = int(size * 0.30)
     painter.drawRoundedRect(left, top, w, h, 6, 6)
+
+
+# kind → (그리기 함수, 펜 두께)
+_FALLBACK_DRAW = {
+    "file": (_draw_file, 2.0),
+    "check": (_draw_check, 2.6),
+    "user": (_draw_user, 2.0),
+}
+
+
+@lru_cache(maxsize=None)
+def _fallback_pixmap(kind: str, color_hex: str = "#2563EB", size: int = 28) -> QPixmap:
+    """qtawesome이 없을 때 쓰는 대체 아이콘. (kind, 색, 크기)당 처음 한 번만 QPainter로 그림."""
+    draw, width = _FALLBACK_DRAW[kind]
+    pm = QPixmap(size, size)
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setPen(_icon_pen(color_hex, width))
+    painter.setBrush(Qt.NoBrush)
+    draw(painter, size)
     painter.end()
     return pm
 
 
-def _main_stylesheet() -> str:
-    return """
-        QWidget#MainLandingRoot {
-            background-color: #F8F9FA;
-        }
-        QWidget#MainLandingRoot * {
-            outline: none;
-            font-family: 'Pretendard','Inter','Malgun Gothic','맑은 고딕';
-        }
-        QWidget#MainLandingRoot QLabel {
-            background: transparent;
-            border: none;
-        }
-
-        QLabel#MainTitle {
-            color: #1A1A1A;
-            font-weight: 600;
-        }
-        QLabel#SubTitle {
-            color: #555555;
-        }
-
-        QPushButton#StartButton {
-            background-color: #3498DB;
-            color: #FFFFFF;
-            border: none;
-            border-radius: 10px;
-            padding: 12px 52px;
-            font-weight: 800;
-        }
-        QPushButton#StartButton:hover {
-            background-color: #2980B9;
-        }
-        QPushButton#StartButton:pressed {
-            background-color: #2471A3;
-        }
-
-        QFrame#FeatureCard {
-            background-color: #FFFFFF;
-            border: 1px solid #E9ECEF;
-            border-radius: 16px;
-        }
-        QLabel#CardTitle {
-            color: #1A1A1A;
-            font-weight: 600;
-            border: none;
-        }
-        QLabel#CardDesc {
-            color: #555555;
-            border: none;
-        }
-    """
+# 랜딩 페이지 스타일시트(생성 시마다 함수 호출/문자열 생성 없이 같은 객체 재사용)
+_MAIN_QSS = """
+    QWidget#MainLandingRoot {
+        background-color: #F8F9FA;
+    }
+    QWidget#MainLandingRoot * {
+        outline: none;
+        font-family: 'Pretendard','Inter','Malgun Gothic','맑은 고딕';
+    }
+    QWidget#MainLandingRoot QLabel {
+        background: transparent;
+        border: none;
+    }
+
+    QLabel#MainTitle {
+        color: #1A1A1A;
+        font-weight: 600;
+    }
+    QLabel#SubTitle {
+        color: #555555;
+    }
+
+    QPushButton#StartButton {
+        background-color: #3498DB;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 10px;
+        padding: 12px 52px;
+        font-weight: 800;
+    }
+    QPushButton#StartButton:hover {
+        background-color: #2980B9;
+    }
+    QPushButton#StartButton:pressed {
+        background-color: #2471A3;
+    }
+
+    QFrame#FeatureCard {
+        background-color: #FFFFFF;
+        border: 1px solid #E9ECEF;
+        border-radius: 16px;
+    }
+    QLabel#CardTitle {
+        color: #1A1A1A;
+        font-weight: 600;
+        border: none;
+    }
+    QLabel#CardDesc {
+        color: #555555;
+        border: none;
+    }
+"""
 
 
 # 메인 컬러의 가장 진한 톤 (아이콘·그림자 가시성)
 _CARD_ICON_COLOR = "#1D4ED8"
 
+# 카드 아이콘: icon_key → qtawesome 아이콘 이름(없으면 같은 kind의 대체 아이콘)
+_CARD_ICONS = {
+    "file": "fa5s.file-alt",
+    "check": "fa5s.check-circle",
+    "user": "fa5s.user-graduate",
+}
+
+
+def _card_icon_pixmap(icon_key: str, color: str = _CARD_ICON_COLOR, size: int = 32) -> Optional[QPixmap]:
+    """카드 아이콘 픽스맵. QPixmapCache에 (키, 색, 크기)로 보관해 카드 재생성 시 다시 그리지 않음."""
+    icon_name = _CARD_ICONS.get(icon_key)
+    if icon_name is None:
+        return None
+    cache_key = f"hanq:card:{icon_key}:{color}:{size}"
+    pm = QPixmapCache.find(cache_key)
+    if pm is not None and not pm.isNull():
+        return pm
+    pm = _qta_pixmap(icon_name, color, size)
+    if pm is None:
+        pm = _fallback_pixmap(icon_key, color, size)
+    QPixmapCache.insert(cache_key, pm)
+    return pm
+
 
 class FeatureCard(QFrame):
     def __init__(
@@ -194,8 +214,9 @@ class FeatureCard(QFrame):
         super().__init__(parent)
         self.setObjectName("FeatureCard")
         self.setFixedSize(300, 190)
+        # QSS 배경(WA_StyledBackground)만 그림. autoFill은 같은 영역을 한 번 더 칠하므로 끔.
+        # 둥근 모서리 바깥은 부모 배경이 비쳐야 하므로 WA_OpaquePaintEvent는 쓰지 않음
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setAutoFillBackground(True)
 
         self._radius = 20
 
@@ -208,19 +229,7 @@ class FeatureCard(QFrame):
         icon = QLabel()
         icon.setFixedSize(34, 34)
         icon.setStyleSheet("border: none;")
-        pm = None
-        if icon_key == "file":
-            pm = _qta_pixmap("fa5s.file-alt", _CARD_ICON_COLOR, 32)
-            if pm is None:
-                pm = _fallback_file_pixmap(_CARD_ICON_COLOR, 32)
-        elif icon_key == "check":
-            pm = _qta_pixmap("fa5s.check-circle", _CARD_ICON_COLOR, 32)
-            if pm is None:
-                pm = _fallback_check_pixmap(_CARD_ICON_COLOR, 32)
-        elif icon_key == "user":
-            pm = _qta_pixmap("fa5s.user-graduate", _CARD_ICON_COLOR, 32)
-            if pm is None:
-                pm = _fallback_user_pixmap(_CARD_ICON_COLOR, 32)
+        pm = _card_icon_pixmap(icon_key)
         if pm is not None:
             icon.setPixmap(pm)
         root.addWidget(icon, alignment=Qt.AlignLeft)
@@ -261,29 +270,26 @@ class MainPageScreen(QWidget):
     def __init__(self, db_connection=None, parent=None):
         super().__init__(parent)
         self.db_connection = db_connection  # 구조 유지(미사용)
-        self._anim_refs: List[QPropertyAnimation] = []
+        # 진입 애니메이션 전체(대상별 대기+슬라이드를 담은 병렬 그룹)
+        self._anim_group: Optional[QParallelAnimationGroup] = None
+        # Feature 카드는 첫 showEvent에서 생성(_build_cards). 그 전까지는 빈 행만 둠
+        self._cards_built = False
+        self._cards_layout: Optional[QHBoxLayout] = None
+        self.card_1: Optional[FeatureCard] = None
+        self.card_2: Optional[FeatureCard] = None
+        self.card_3: Optional[FeatureCard] = None
+        self.card_1_wrap: Optional[QWidget] = None
+        self.card_2_wrap: Optional[QWidget] = None
+        self.card_3_wrap: Optional[QWidget] = None
         self._animated_once = False
+        # 헤더 탭 선택 해제 함수(첫 showEvent에서 window().header를 찾아 1회만 해석)
+        self._header_ref: Optional[QWidget] = None
+        self._clear_tabs: Optional[Callable[[], None]] = None
         self._build_ui()
 
-    @staticmethod
-    def _wrap_for_anim(child: QWidget) -> QWidget:
-        """DropShadow 등 graphicsEffect가 있는 위젯도 Opacity 애니메이션 가능하게 래핑."""
-        w = QWidget()
-        w.setContentsMargins(0, 0, 0, 0)
-        lay = QHBoxLayout(w)
-        lay.setContentsMargins(0, 0, 0, 0)
-        lay.setSpacing(0)
-        lay.addWidget(child)
-        # child가 고정 크기면 wrapper도 동일하게
-        try:
-            w.setFixedSize(child.size())
-        except Exception:
-            pass
-        return w
-
     def _build_ui(self):
         self.setObjectName("MainLandingRoot")
-        self.setStyleSheet(_main_stylesheet())
+        self.setStyleSheet(_MAIN_QSS)
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
@@ -320,15 +326,11 @@ class MainPageScreen(QWidget):
         self.title.setFont(f)
         hero_layout.addWidget(self.title)
 
-        # ✅ 줄 길이/줄간격(160%)을 강제하기 위해 RichText 사용
-        self.desc = QLabel(
-            "<div style='text-align:center; line-height:160%;'>"
-            "한글문서 기반의 학생별 맞춤 학습지부터<br/>"
-            "오답노트 및 개별 보고서 생성까지</div>"
-        )
+        # 줄바꿈 위치만 고정하면 되므로 HTML 파서 없이 PlainText 두 줄로 표시
+        self.desc = QLabel("한글문서 기반의 학생별 맞춤 학습지부터\n오답노트 및 개별 보고서 생성까지")
         self.desc.setObjectName("SubTitle")
         self.desc.setAlignment(Qt.AlignCenter)
-        self.desc.setTextFormat(Qt.RichText)
+        self.desc.setTextFormat(Qt.PlainText)
         self.desc.setFont(_font(15, QFont.Medium))
         hero_layout.addWidget(self.desc)
 
@@ -345,7 +347,8 @@ class MainPageScreen(QWidget):
         self.cta_btn.setMinimumWidth(220)
         self.cta_btn.clicked.connect(self.start_requested.emit)
 
-        self.cta_wrap = self._wrap_for_anim(self.cta_btn)
+        # 애니메이션은 버튼 자체의 pos에 적용(그래픽 이펙트가 없으므로 래퍼 위젯 불필요)
+        self.cta_wrap = self.cta_btn
         # ✅ 버튼 shadow 잘림 방지: 버튼을 담는 레이아웃에 여백(20px)
         cta_section = QWidget()
         cta_lay = QHBoxLayout(cta_section)
@@ -365,83 +368,80 @@ class MainPageScreen(QWidget):
         cards_layout.setContentsMargins(20, 20, 20, 20)
         cards_layout.setSpacing(24)
         cards_layout.setAlignment(Qt.AlignCenter)
-
-        self.card_1 = FeatureCard("file", "hwp 문항 관리", "한글 파일을 기반으로 한 정밀한 DB 구축")
-        self.card_2 = FeatureCard("check", "맞춤형 학습지", "클릭 몇 번으로 완성되는 학생별 맞춤 프린트")
-        self.card_3 = FeatureCard("user", "성적 & 오답 관리", "학생별 오답 데이터를 분석하여 자동으로 생성되는 오답노트")
-
-        self.card_1_wrap = self._wrap_for_anim(self.card_1)
-        self.card_2_wrap = self._wrap_for_anim(self.card_2)
-        self.card_3_wrap = self._wrap_for_anim(self.card_3)
-        cards_layout.addWidget(self.card_1_wrap)
-        cards_layout.addWidget(self.card_2_wrap)
-        cards_layout.addWidget(self.card_3_wrap)
+        # 카드 높이(190)만큼 미리 자리를 잡아 두어 첫 표시 때 레이아웃이 튀지 않게 함
+        cards_wrap.setMinimumHeight(190 + 40)
+        self._cards_layout = cards_layout
 
         container_layout.addWidget(cards_wrap, alignment=Qt.AlignHCenter)
 
         outer.addWidget(container, alignment=Qt.AlignHCenter)
         outer.addStretch(1)
-        outer.addWidget(self._create_footer())
-
-    def _create_footer(self) -> QWidget:
-        """메인 페이지 최하단 고정형 푸터(저작권·개발자 정보). 시인성 강화."""
-        footer_widget = QWidget()
-        footer_layout = QVBoxLayout(footer_widget)
-        footer_layout.setContentsMargins(0, 0, 0, 25)
-        footer_layout.setSpacing(2)
-
-        copyright_lbl = QLabel("© 2026 HanQ. All rights reserved.")
-        copyright_lbl.setAlignment(Qt.AlignCenter)
-        copyright_lbl.setStyleSheet(
-            "color: #777777; font-size: 10pt; font-weight: 400; border: none;"
-        )
-        copyright_lbl.setFont(_font(10, QFont.Normal))
-
-        dev_lbl = QLabel(
-            'Developed by <span style="font-weight: bold; color: #333333;">이창현수학</span>'
-        )
-        dev_lbl.setAlignment(Qt.AlignCenter)
-        dev_lbl.setTextFormat(Qt.RichText)
-        dev_lbl.setStyleSheet(
-            "color: #666666; font-size: 10pt; border: none;"
-        )
-        dev_lbl.setFont(_font(10, QFont.Normal))
-
-        footer_layout.addWidget(copyright_lbl)
-        footer_layout.addWidget(dev_lbl)
-
-        return footer_widget
+        # 메인 페이지 최하단 고정형 푸터(저작권·개발자 정보)
+        outer.addWidget(create_app_footer(bottom_margin=25, spacing=2))
+
+    def _build_cards(self) -> None:
+        """Feature 카드 3장 생성(메인 페이지가 처음 보일 때 1회)"""
+        self.card_1 = FeatureCard("file", "hwp 문항 관리", "한글 파일을 기반으로 한 정밀한 DB 구축")
+        self.card_2 = FeatureCard("check", "맞춤형 학습지", "클릭 몇 번으로 완성되는 학생별 맞춤 프린트")
+        self.card_3 = FeatureCard("user", "성적 & 오답 관리", "학생별 오답 데이터를 분석하여 자동으로 생성되는 오답노트")
+
+        self.card_1_wrap = self.card_1
+        self.card_2_wrap = self.card_2
+        self.card_3_wrap = self.card_3
+        self._cards_layout.addWidget(self.card_1_wrap)
+        self._cards_layout.addWidget(self.card_2_wrap)
+        self._cards_layout.addWidget(self.card_3_wrap)
+        self._cards_built = True
 
     def showEvent(self, event):  # type: ignore[override]
+        if not self._cards_built:
+            self._build_cards()
         super().showEvent(event)
 
         # 1) 메인 페이지 진입 시: 헤더 탭 하이라이트 완전 해제
-        try:
-            w = self.window()
-            header = getattr(w, "header", None)
-            if header is not None:
-                # Header에 전용 API가 있으면 그걸 사용(Exclusive 그룹에서도 확실히)
-                if hasattr(header, "clear_tab_selection"):
-                    header.clear_tab_selection()
-                elif getattr(header, "tab_group", None) is not None:
-                    for btn in header.tab_group.buttons():
-                        btn.setChecked(False)
-        except Exception:
-            pass
+        if self._clear_tabs is None:
+            self._resolve_header()
+        if self._clear_tabs is not None:
+            self._clear_tabs()
 
-        # 2) 애니메이션 (Opacity + Geometry)
+        # 2) 애니메이션 (위치 슬라이드)
         if self._animated_once:
             return
         self._animated_once = True
         QTimer.singleShot(30, self._run_animations)
 
+    def _resolve_header(self) -> None:
+        """window().header와 탭 해제 함수를 찾아 보관(헤더가 아직 없으면 다음 show에서 다시 시도)."""
+        try:
+            header = getattr(self.window(), "header", None)
+        except Exception:
+            header = None
+        if header is None:
+            return
+        self._header_ref = header
+        # Header에 전용 API가 있으면 그걸 사용(Exclusive 그룹에서도 확실히)
+        clear = getattr(header, "clear_tab_selection", None)
+        if clear is None and getattr(header, "tab_group", None) is not None:
+            group = header.tab_group
+
+            def clear() -> None:
+                for btn in group.buttons():
+                    btn.setChecked(False)
+
+        self._clear_tabs = clear
+
     def hideEvent(self, event):  # type: ignore[override]
         # 화면 전환 후 다시 들어왔을 때도 "열릴 때" 효과가 필요하면 재생
         self._animated_once = False
         super().hideEvent(event)
 
     def _run_animations(self):
-        self._anim_refs.clear()
+        # 이전 재생이 남아 있으면 끝 위치로 보낸 뒤 정리(현재 pos를 도착 위치로 쓰기 위해)
+        if self._anim_group is not None:
+            self._anim_group.setCurrentTime(self._anim_group.totalDuration())
+            self._anim_group.stop()
+            self._anim_group.deleteLater()
+            self._anim_group = None
 
         targets: List[Tuple[QWidget, int]] = [
             (self.title, 0),
@@ -452,38 +452,32 @@ class MainPageScreen(QWidget):
             (self.card_3_wrap, 300),
         ]
 
+        # 대상별 타이머 대신 (대기 → 슬라이드) 순차 그룹을 병렬 그룹 하나로 묶어 한 번에 시작
+        group = QParallelAnimationGroup(self)
         for w, delay in targets:
-            self._animate_in(w, delay_ms=delay)
-
-    def _animate_in(self, w: QWidget, delay_ms: int):
+            anim = self._slide_in(w, delay_ms=delay)
+            if anim is not None:
+                group.addAnimation(anim)
+        self._anim_group = group
+        group.start()
+
+    def _slide_in(self, w: QWidget, delay_ms: int) -> Optional[QSequentialAnimationGroup]:
+        # QGraphicsOpacityEffect는 매 프레임 위젯을 오프스크린 픽스맵으로 다시 그리므로 쓰지 않고,
+        # 18px 아래에서 제자리로 올라오는 위치 애니메이션만 적용
         try:
-            end_geo = w.geometry()
-            start_geo = w.geometry()
-            start_geo.moveTop(start_geo.top() + 18)
-
-            eff = QGraphicsOpacityEffect(w)
-            w.setGraphicsEffect(eff)
-            eff.setOpacity(0.0)
-
-            geo_anim = QPropertyAnimation(w, b"geometry", self)
-            geo_anim.setDuration(520)
-            geo_anim.setStartValue(start_geo)
-            geo_anim.setEndValue(end_geo)
-            geo_anim.setEasingCurve(QEasingCurve.OutCubic)
-
-            self._anim_refs.append(geo_anim)
-
-            op_anim = QPropertyAnimation(eff, b"opacity", self)
-            op_anim.setDuration(520)
-            op_anim.setStartValue(0.0)
-            op_anim.setEndValue(1.0)
-            op_anim.setEasingCurve(QEasingCurve.OutCubic)
-            self._anim_refs.append(op_anim)
-
-            def _start():
-                geo_anim.start()
-                op_anim.start()
-
-            QTimer.singleShot(max(0, int(delay_ms)), _start)
+            end_pos = w.pos()
+            start_pos = end_pos + QPoint(0, 18)
+            # 지연 시간 동안 제자리에 보였다가 튀는 것을 막기 위해 시작 위치로 먼저 이동
+            w.move(start_pos)
+
+            seq = QSequentialAnimationGroup()
+            seq.addPause(max(0, int(delay_ms)))
+            pos_anim = QPropertyAnimation(w, b"pos")
+            pos_anim.setDuration(520)
+            pos_anim.setStartValue(start_pos)
+            pos_anim.setEndValue(end_pos)
+            pos_anim.setEasingCurve(QEasingCurve.OutCubic)
+            seq.addAnimation(pos_anim)
+            return seq
         except Exception:
-            return
+            return None
@@ -14,9 +14,10 @@ import os
 import shutil
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 
-from PyQt5.QtCore import Qt, QDate, pyqtSignal, QRect, QRectF
+from PyQt5.QtCore import Qt, QDate, pyqtSignal, QObject, QRect, QRectF, QRunnable, QThreadPool, QTimer
 from PyQt5.QtGui import (
     QBrush,
     QColor,
@@ -49,89 +50,223 @@ from PyQt5.QtWidgets import (
 )
 
 from core.models import Worksheet, SavedReport
-from database.repositories import ProblemRepository, ReportRepository, WorksheetAssignmentRepository, WorksheetRepository
+from database.repositories import ProblemRepository, ReportRepository, WorksheetAssignmentRepository
 from services.report.report_service import aggregate_report
 from ui.components.grading_dialog import GradingDialog
+from ui.components.fonts import app_font
 from ui.components.standard_message import show_info, show_warning
 from ui.screens.worksheet_list import WorksheetListScreen, CompactStudySheetRow, StudySheetItem
 from services.worksheet.hwp_composer import WorksheetHwpComposer, WorksheetComposeError
 from processors.hwp.hwp_reader import HWPReader, HWPNotInstalledError, HWPInitializationError
 from ui.components.standard_action_dialog import DialogAction, StandardActionDialog
 
-try:
-    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-    from matplotlib.figure import Figure
-    _HAS_MATPLOTLIB = True
-except ImportError:
-    _HAS_MATPLOTLIB = False
 
-try:
-    from PyQt5.QtPrintSupport import QPrinter
-    _HAS_QPRINTER = True
-except ImportError:
-    _HAS_QPRINTER = False
+@lru_cache(maxsize=1)
+def _load_matplotlib():
+    """(Figure, FigureCanvasQTAgg). matplotlib은 무거우므로 보고서 차트를 처음 그릴 때 1회만 import. 없으면 None."""
+    try:
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        return None
+    return Figure, FigureCanvasQTAgg
+
+
+@lru_cache(maxsize=1)
+def _load_qprinter():
+    """QPrinter 클래스(보고서 PDF 출력 시에만 import). 없으면 None."""
+    try:
+        from PyQt5.QtPrintSupport import QPrinter
+    except ImportError:
+        return None
+    return QPrinter
+
+
+# Row 버튼/배지 스타일시트(Row마다 문자열을 새로 만들지 않도록 모듈 상수로 1회 정의)
+_GRADE_BTN_QSS = """
+    QPushButton#GradeBtn {
+        padding: 0px;
+        margin: 0px;
+        background: #2563EB;
+        border: 1.5px solid #1D4ED8;
+        color: #FFFFFF;
+        font-weight: 800;
+        font-size: 9pt;
+        border-radius: 6px;
+    }
+    QPushButton#GradeBtn:hover {
+        background: #1D4ED8;
+        border-color: #1E40AF;
+    }
+"""
+
+_WRONG_BTN_QSS = """
+    QPushButton#WrongBtn {
+        padding: 0px;
+        margin: 0px;
+        background: #EEF2FF;
+        border: 1.5px solid #C7D2FE;
+        color: #3730A3;
+        font-weight: 800;
+        font-size: 9pt;
+        border-radius: 6px;
+    }
+    QPushButton#WrongBtn:hover:enabled {
+        background: #E0E7FF;
+        border-color: #A5B4FC;
+        color: #312E81;
+    }
+    QPushButton#WrongBtn:disabled {
+        background: #F1F5F9;
+        border: 1.5px solid #E2E8F0;
+        color: #94A3B8;
+    }
+"""
+
+_SCORE_BADGE_QSS = """
+    QLabel#ScoreBadge {
+        background: #F1F5F9;
+        color: #0F172A;
+        border: 1px solid #E2E8F0;
+        border-radius: 6px;
+        padding: 2px 6px;
+    }
+"""
+
+# 오답노트 Row 배지(가로 여백만 조금 넓음)
+_WRONGNOTE_SCORE_BADGE_QSS = """
+    QLabel#ScoreBadge {
+        background: #F1F5F9;
+        color: #0F172A;
+        border: 1px solid #E2E8F0;
+        border-radius: 6px;
+        padding: 2px 8px;
+    }
+"""
 
 
 def _font(size_pt: int, *, bold: bool = False, extra_bold: bool = False) -> QFont:
-    f = QFont("Pretendard")
-    if not f.exactMatch():
-        f = QFont("맑은 고딕")
-    f.setPointSize(int(size_pt))
-    if extra_bold:
-        f.setWeight(QFont.ExtraBold)
-    elif bold:
-        f.setBold(True)
-    else:
-        try:
-            f.setWeight(QFont.Medium)
-        except Exception:
-            pass
-    return f
+    weight = QFont.ExtraBold if extra_bold else (QFont.Bold if bold else QFont.Medium)
+    return app_font(size_pt, weight)
+
+
+def _strip_str(v) -> str:
+    """str(v or "").strip()과 같되, 이미 문자열이면 str() 변환을 건너뜀."""
+    if isinstance(v, str):
+        return v.strip()
+    return str(v).strip() if v else ""
+
+
+# numbered 항목에서 문제ID를 찾을 키(앞쪽 우선)
+_PID_KEYS = ("problem_id", "problemId", "problemID", "pid", "problem")
 
 
 def _extract_problem_id(d: dict) -> str:
     if not isinstance(d, dict):
         return ""
-    for k in ("problem_id", "problemId", "problemID", "pid", "problem"):
+    for k in _PID_KEYS:
         v = d.get(k)
-        if v is None:
-            continue
-        s = str(v).strip()
-        if s:
-            return s
+        if v is not None:
+            s = str(v).strip()
+            if s:
+                return s
     return ""
 
 
 def _build_no_to_pid(numbered: list) -> Dict[int, str]:
     out: Dict[int, str] = {}
     for it in (numbered or []):
-        if not isinstance(it, dict):
+        pid = _extract_problem_id(it)
+        if not pid:
             continue
         try:
-            no = int(it.get("no"))
+            out[int(it.get("no"))] = pid
         except Exception:
             continue
-        pid = _extract_problem_id(it)
+    return out
+
+
+# 레거시 채점 기록에서 is_correct가 문자열로 저장된 경우 정답으로 보는 값
+_TRUTHY_ANSWERS = frozenset(("true", "1", "o", "ok", "yes"))
+
+
+def _wrong_pids_from_answers(answers: list, no_to_pid: Dict[int, str]) -> List[str]:
+    """채점 answers 중 오답 문항의 문제ID 목록(번호를 읽을 수 없는 항목은 건너뜀)."""
+    out: List[str] = []
+    for a in answers:
+        if not isinstance(a, dict):
+            continue
+        is_correct = a.get("is_correct")
+        if isinstance(is_correct, str):
+            is_correct = is_correct.strip().lower() in _TRUTHY_ANSWERS
+        if is_correct:
+            continue
+        try:
+            no = int(a.get("no"))
+        except Exception:
+            continue
+        pid = _strip_str(a.get("problem_id")) or _strip_str(no_to_pid.get(no))
         if pid:
-            out[no] = pid
+            out.append(pid)
     return out
 
 
+def _no_to_pid_from_worksheet(ws: Worksheet) -> Dict[int, str]:
+    """학습지의 번호 → 문제ID. numbered가 비어있으면 problem_ids 순서(1부터)로 매핑."""
+    no_to_pid = _build_no_to_pid(list(ws.numbered or []))
+    if no_to_pid:
+        return no_to_pid
+    out: Dict[int, str] = {}
+    for i, pid in enumerate(getattr(ws, "problem_ids", None) or [], start=1):
+        pid2 = _strip_str(pid)
+        if pid2:
+            out[i] = pid2
+    return out
+
+
+def _assignment_doc(
+    repo: WorksheetAssignmentRepository, cache: Dict[str, dict], student_id: str, worksheet_id: str
+) -> Optional[dict]:
+    """출제 문서. 목록 로드 때 받아 둔 cache를 먼저 보고, 없을 때만 DB에서 1건 조회."""
+    doc = cache.get(worksheet_id)
+    if doc is None:
+        doc = repo.find_one(worksheet_id=worksheet_id, student_id=student_id)
+        if doc is not None:
+            cache[worksheet_id] = doc
+    return doc
+
+
+def _problems_by_ids(repo: Optional[ProblemRepository], cache: Dict[str, object], pids: List[str]) -> Dict[str, object]:
+    """문제ID → Problem. cache에 없는 ID만 한 번에 조회해 채운 뒤 요청 순서대로 돌려줌."""
+    missing = [pid for pid in dict.fromkeys(pids) if pid not in cache]
+    if missing and repo is not None:
+        try:
+            for p in repo.list_by_ids(missing):
+                if p and p.id:
+                    cache[str(p.id)] = p
+        except Exception:
+            pass
+    return {pid: cache[pid] for pid in pids if pid in cache}
+
+
+# 파일/폴더 이름에 쓸 수 없는 문자 → "_" (translate 한 번으로 치환)
+_BAD_FILENAME_CHARS = str.maketrans({ch: "_" for ch in '<>:"/\\|?*'})
+
+
 def _safe_filename(name: str, *, fallback: str = "worksheet") -> str:
     s = (name or "").strip() or fallback
-    bad = '<>:"/\\|?*'
-    for ch in bad:
-        s = s.replace(ch, "_")
+    s = s.translate(_BAD_FILENAME_CHARS)
     s = " ".join(s.split())
     return s[:120]
 
 
+# ui/screens/student_page.py -> 프로젝트 루트(모듈 로드 시 1회 계산)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
 def _project_root() -> str:
     """프로젝트 루트(폴더 옮김 시 DB·오답노트 캐시가 함께 따라가도록)."""
-    path = os.path.abspath(__file__)
-    for _ in range(3):  # ui/screens/student_page.py -> 프로젝트 루트
-        path = os.path.dirname(path)
-    return path
+    return _PROJECT_ROOT
 
 
 def _ascii_temp_dir(sub: str) -> str:
@@ -144,8 +279,9 @@ def _ascii_temp_dir(sub: str) -> str:
     return d
 
 
+@lru_cache(maxsize=1)
 def _wrongnote_cache_dir() -> str:
-    """오답노트 HWP 캐시 루트(프로젝트 db/wrongnote_cache → 폴더 옮김 시 함께 이동)."""
+    """오답노트 HWP 캐시 루트(프로젝트 db/wrongnote_cache → 폴더 옮김 시 함께 이동). 폴더 생성은 최초 1회."""
     root = _project_root()
     d = os.path.join(root, "db", "wrongnote_cache")
     try:
@@ -155,14 +291,17 @@ def _wrongnote_cache_dir() -> str:
     return d
 
 
+@lru_cache(maxsize=256)
 def _wrongnote_cached_hwp_path(student_id: str, worksheet_id: str) -> str:
-    """해당 (학생, 학습지) 오답노트 HWP 캐시 파일 경로."""
+    """
+    해당 (학생, 학습지) 오답노트 HWP 캐시 파일 경로(같은 쌍은 경로 계산·폴더 생성을 1회만).
+    세션 중 폴더가 지워져도 HWP 생성 작업이 저장 직전에 다시 만든다.
+    """
     base = _wrongnote_cache_dir()
     sid = (student_id or "").strip() or "unknown"
     wid = (worksheet_id or "").strip() or "unknown"
-    for ch in '<>:"/\\|?*':
-        sid = sid.replace(ch, "_")
-        wid = wid.replace(ch, "_")
+    sid = sid.translate(_BAD_FILENAME_CHARS)
+    wid = wid.translate(_BAD_FILENAME_CHARS)
     sub = os.path.join(base, sid[:64])
     try:
         os.makedirs(sub, exist_ok=True)
@@ -171,6 +310,41 @@ def _wrongnote_cached_hwp_path(student_id: str, worksheet_id: str) -> str:
     return os.path.join(sub, f"{wid[:64]}.hwp")
 
 
+# 검색어 입력 후 목록을 다시 그리기까지 대기(ms). 연속 입력은 마지막 1회로 합침
+_SEARCH_DEBOUNCE_MS = 120
+
+
+def _install_search_debounce(screen: WorksheetListScreen) -> QTimer:
+    """검색창 textChanged → refresh_list 직접 연결을 디바운스 타이머 경유로 교체."""
+    timer = QTimer(screen)
+    timer.setSingleShot(True)
+    timer.setInterval(_SEARCH_DEBOUNCE_MS)
+    timer.timeout.connect(screen.refresh_list)
+    try:
+        screen.search_input.textChanged.disconnect(screen.refresh_list)
+    except Exception:
+        pass
+    screen.search_input.textChanged.connect(lambda _text: timer.start())
+    return timer
+
+
+def _discard_rows(layout: QVBoxLayout, keep: Optional[Set[QWidget]] = None) -> None:
+    """
+    마지막 stretch를 제외한 Row들을 레이아웃에서 떼어 임시 부모에 모은 뒤 한 번에 지연 삭제.
+    keep에 든 위젯(재사용할 Row)은 삭제하지 않고 숨기기만 함.
+    """
+    dead = QWidget()
+    while layout.count() > 1:
+        w = layout.takeAt(0).widget()
+        if w is None:
+            continue
+        if keep and w in keep:
+            w.hide()
+        else:
+            w.setParent(dead)
+    dead.deleteLater()
+
+
 class StudentStudySheetRow(CompactStudySheetRow):
     """수업준비-학습지 Row 디자인을 그대로 쓰되, 채점/오답노트 버튼만 추가."""
 
@@ -186,43 +360,23 @@ class StudentStudySheetRow(CompactStudySheetRow):
         self.score_badge.setFont(_font(8, bold=True))
         self.score_badge.setFixedSize(44, 26)
         self.score_badge.setAlignment(Qt.AlignCenter)
-        self.score_badge.setStyleSheet(
-            """
-            QLabel#ScoreBadge {
-                background: #F1F5F9;
-                color: #0F172A;
-                border: 1px solid #E2E8F0;
-                border-radius: 6px;
-                padding: 2px 6px;
-            }
-            """
-        )
-        is_graded = bool(getattr(item, "is_graded", False))
-        summary = (getattr(item, "graded_summary", "") or "").strip() if is_graded else ""
-        self.score_badge.setText(summary)
-        self.score_badge.setToolTip("맞은 개수 / 전체" if summary else "채점 후 표시")
-
+        self.score_badge.setStyleSheet(_SCORE_BADGE_QSS)
         self.btn_grade = QPushButton("채점")
         self.btn_grade.setObjectName("GradeBtn")
         self.btn_grade.setFocusPolicy(Qt.NoFocus)
         self.btn_grade.setCursor(Qt.PointingHandCursor)
         self.btn_grade.setFixedSize(56, 26)
         self.btn_grade.setFont(_font(8, bold=True))
-        self.btn_grade.clicked.connect(lambda _=False: self.grade_requested.emit(self.item.id))
+        self.btn_grade.clicked.connect(self._emit_grade)
 
-        wrongnote_enabled = bool(getattr(item, "wrongnote_enabled", False))
-        self.btn_wrong = QPushButton("오답노트" if wrongnote_enabled else "오답노트 생성")
+        self.btn_wrong = QPushButton("오답노트 생성")
         self.btn_wrong.setObjectName("WrongBtn")
         self.btn_wrong.setFocusPolicy(Qt.NoFocus)
         self.btn_wrong.setCursor(Qt.PointingHandCursor)
         self.btn_wrong.setFixedSize(82, 26)
         self.btn_wrong.setFont(_font(8, bold=True))
-        self.btn_wrong.clicked.connect(lambda _=False: self.wrongnote_requested.emit(self.item.id))
-        if not is_graded:
-            self.btn_wrong.setEnabled(False)
-            self.btn_wrong.setToolTip("채점 완료 후 이용 가능")
-        else:
-            self.btn_wrong.setToolTip("오답노트 보기" if wrongnote_enabled else "오답노트 생성")
+        self.btn_wrong.clicked.connect(self._emit_wrong)
+        self.update_from_item(item)
 
         # CompactRow 레이아웃의 마지막 2개(PDF/HWP) 앞에 삽입
         lay = self.layout()
@@ -243,49 +397,103 @@ class StudentStudySheetRow(CompactStudySheetRow):
                     pass
 
         # 버튼 스타일은 Row에만 로컬로 적용(수업준비 화면 영향 없음)
-        self.btn_grade.setStyleSheet(
-            """
-            QPushButton#GradeBtn {
-                padding: 0px;
-                margin: 0px;
-                background: #2563EB;
-                border: 1.5px solid #1D4ED8;
-                color: #FFFFFF;
-                font-weight: 800;
-                font-size: 9pt;
-                border-radius: 6px;
-            }
-            QPushButton#GradeBtn:hover {
-                background: #1D4ED8;
-                border-color: #1E40AF;
-            }
-            """
-        )
+        self.btn_grade.setStyleSheet(_GRADE_BTN_QSS)
 
-        self.btn_wrong.setStyleSheet(
-            """
-            QPushButton#WrongBtn {
-                padding: 0px;
-                margin: 0px;
-                background: #EEF2FF;
-                border: 1.5px solid #C7D2FE;
-                color: #3730A3;
-                font-weight: 800;
-                font-size: 9pt;
-                border-radius: 6px;
-            }
-            QPushButton#WrongBtn:hover:enabled {
-                background: #E0E7FF;
-                border-color: #A5B4FC;
-                color: #312E81;
-            }
-            QPushButton#WrongBtn:disabled {
-                background: #F1F5F9;
-                border: 1.5px solid #E2E8F0;
-                color: #94A3B8;
-            }
-            """
-        )
+        self.btn_wrong.setStyleSheet(_WRONG_BTN_QSS)
+
+    def _emit_grade(self) -> None:
+        self.grade_requested.emit(self.item.id)
+
+    def _emit_wrong(self) -> None:
+        self.wrongnote_requested.emit(self.item.id)
+
+    def update_from_item(self, item: StudySheetItem) -> None:
+        """채점 결과/오답노트 상태만 새 item 값으로 갱신(Row 재사용 시 다시 만들지 않음)."""
+        self.item = item
+        is_graded = bool(getattr(item, "is_graded", False))
+        summary = (getattr(item, "graded_summary", "") or "").strip() if is_graded else ""
+        self.score_badge.setText(summary)
+        self.score_badge.setToolTip("맞은 개수 / 전체" if summary else "채점 후 표시")
+
+        wrongnote_enabled = bool(getattr(item, "wrongnote_enabled", False))
+        self.btn_wrong.setText("오답노트" if wrongnote_enabled else "오답노트 생성")
+        self.btn_wrong.setEnabled(is_graded)
+        if not is_graded:
+            self.btn_wrong.setToolTip("채점 완료 후 이용 가능")
+        else:
+            self.btn_wrong.setToolTip("오답노트 보기" if wrongnote_enabled else "오답노트 생성")
+
+
+class _ComposeSignals(QObject):
+    finished = pyqtSignal(str, bool)  # (worksheet_id, 템플릿 없이 빈 문서로 생성했는지)
+    failed = pyqtSignal(str, str)  # (worksheet_id, 오류 메시지)
+
+
+class _WrongNoteComposeTask(QRunnable):
+    """오답노트 HWP 조합(한글 COM 자동화)을 워커 스레드에서 실행. DB는 스레드 전용 연결로 읽음."""
+
+    def __init__(
+        self,
+        db_connection,
+        *,
+        student_id: str,
+        worksheet_id: str,
+        problem_ids: List[str],
+        output_path: str,
+        title: str,
+        teacher: str,
+        date_str: str,
+        already_enabled: bool,
+    ):
+        super().__init__()
+        self.db_connection = db_connection
+        # 생성 도중 화면의 학생이 바뀔 수 있으므로 요청 시점의 학생을 보관
+        self.student_id = student_id
+        self.worksheet_id = worksheet_id
+        self.problem_ids = problem_ids
+        self.output_path = output_path
+        self.title = title
+        self.teacher = teacher
+        self.date_str = date_str
+        self.already_enabled = already_enabled
+        self.signals = _ComposeSignals()
+
+    def run(self) -> None:
+        com = None
+        try:
+            import pythoncom  # type: ignore
+            pythoncom.CoInitialize()
+            com = pythoncom
+        except Exception:
+            com = None
+        reader = None
+        try:
+            os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+            reader = self.db_connection.open_reader()
+            composer = WorksheetHwpComposer(reader)
+            composer.compose(
+                problem_ids=self.problem_ids,
+                output_path=self.output_path,
+                title=self.title,
+                teacher=self.teacher,
+                date_str=self.date_str,
+            )
+            template_missing = bool(getattr(composer, "_template_missing", False))
+        except WorksheetComposeError as e:
+            self.signals.failed.emit(self.worksheet_id, f"HWP 생성에 실패했습니다.\n\n{e}")
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.worksheet_id, f"HWP 생성 중 오류가 발생했습니다.\n\n{e}")
+            return
+        finally:
+            if reader is not None:
+                reader.disconnect()
+            if com is not None:
+                try:
+                    com.CoUninitialize()
+                except Exception:
+                    pass
+        self.signals.finished.emit(self.worksheet_id, template_missing)
 
 
 class StudentWorksheetListScreen(WorksheetListScreen):
@@ -305,6 +513,16 @@ class StudentWorksheetListScreen(WorksheetListScreen):
         self.student_id = (student_id or "").strip()
         self.student_name = (student_name or "").strip()
         self.student_grade = (student_grade or "").strip()
+        # 학습지 id → Row(검색/필터/재로드 때 다시 만들지 않고 재사용)
+        self._row_pool: Dict[str, StudentStudySheetRow] = {}
+        # 진행 중인 오답노트 HWP 생성(완료 전 중복 요청 방지 + 시그널 객체 참조 유지)
+        self._compose_task: Optional[_WrongNoteComposeTask] = None
+        # 채점 다이얼로그용 문항 저장소(클릭마다 새로 만들지 않음; ws_repo/assign_repo는 부모가 보관)
+        self._problem_repo: Optional[ProblemRepository] = ProblemRepository(db_connection) if db_connection else None
+        # problem_id → Problem(채점 다이얼로그를 다시 열 때 DB 재조회 생략, StudentPage.reload 때 비움)
+        self._problems_cache: Dict[str, object] = {}
+        # worksheet_id → 출제 문서(reload_from_db에서 받은 목록. 저장/변경 시 해당 항목 제거)
+        self._assign_by_wid: Dict[str, dict] = {}
         super().__init__(db_connection, parent=parent)
 
         # 학생 페이지에서는 "학습지 생성" 버튼을 숨김(수업준비 전용 기능)
@@ -324,6 +542,8 @@ class StudentWorksheetListScreen(WorksheetListScreen):
         except Exception:
             pass
 
+        self._search_timer = _install_search_debounce(self)
+
         # 목록 로드는 "출제된 것만"으로 오버라이드
         self.reload_from_db()
 
@@ -344,12 +564,13 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             return
 
         try:
-            assign_repo = WorksheetAssignmentRepository(self.db_connection)
-            assigns = assign_repo.list_for_student(self.student_id)
+            assigns = self.assign_repo.list_for_student(self.student_id)
         except Exception:
             assigns = []
 
-        ws_ids = [str(a.get("worksheet_id") or "").strip() for a in assigns if str(a.get("worksheet_id") or "").strip()]
+        wids = [_strip_str(a.get("worksheet_id")) for a in assigns]
+        self._assign_by_wid = {wid: a for wid, a in zip(wids, assigns) if wid}
+        ws_ids = [wid for wid in wids if wid]
         if not ws_ids:
             self._selected_ids.clear()
             self.refresh_list()
@@ -358,12 +579,12 @@ class StudentWorksheetListScreen(WorksheetListScreen):
         worksheets = self.ws_repo.list_by_ids(ws_ids)
         by_id: Dict[str, Worksheet] = {str(w.id): w for w in worksheets if w and w.id}
 
+        # (출제, 학습지) 쌍을 한 번만 묶고 수업준비-학습지와 동일하게 학습지 생성일(created_at) 최신순 정렬
+        paired = [(wid, a, by_id[wid]) for wid, a in zip(wids, assigns) if wid in by_id]
+        paired.sort(key=lambda p: p[2].created_at or datetime.min, reverse=True)
+
         items = []
-        for a in assigns:
-            wid = str(a.get("worksheet_id") or "").strip()
-            ws = by_id.get(wid)
-            if not ws:
-                continue
+        for wid, a, ws in paired:
             dt = ws.created_at
             date_str = dt.strftime("%Y.%m.%d") if dt else ""
             it = StudySheetItem(
@@ -389,25 +610,34 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             setattr(it, "wrongnote_enabled", bool(a.get("wrongnote_enabled", False)))
             if is_graded:
                 setattr(it, "graded_summary", f"{correct}/{total_q}")
+            # 검색용 소문자 문자열(입력할 때마다 Row별로 다시 만들지 않도록 로드 시 1회)
+            setattr(it, "search_hay", f"{it.grade} {it.type_text} {it.title} {it.date} {it.teacher}".lower())
             items.append(it)
 
-        # 수업준비-학습지와 동일: 학습지 생성일(created_at) 최신순
-        items.sort(
-            key=lambda it: (getattr(by_id.get(it.id), "created_at", None) or datetime.min),
-            reverse=True,
-        )
         self._items = items
-        alive = {it.id for it in self._items}
-        self._selected_ids = {sid for sid in self._selected_ids if sid in alive}
+        # 선택 상태 정리(목록에서 사라진 id 제거, 제자리 교집합)
+        self._selected_ids.intersection_update(it.id for it in self._items)
         self.refresh_list()
 
     def refresh_list(self) -> None:
         # super와 동일 로직이지만 Row만 교체(채점 버튼 추가)
-        while self.list_layout.count() > 1:
-            it = self.list_layout.takeAt(0)
-            w = it.widget()
-            if w is not None:
-                w.setParent(None)
+        # 재구성 동안 화면 갱신을 멈추고 끝에서 한 번만 다시 그림(Row마다 레이아웃/페인트 방지)
+        self.list_container.setUpdatesEnabled(False)
+        try:
+            self._rebuild_rows()
+        finally:
+            self.list_container.setUpdatesEnabled(True)
+            self.list_container.update()
+
+    def _rebuild_rows(self) -> None:
+        # 목록에서 사라졌거나 기본 정보(제목·학년 등)가 바뀐 Row는 풀에서 제거
+        alive = {it.id: it for it in self._items}
+        for wid, row in list(self._row_pool.items()):
+            it = alive.get(wid)
+            if it is None or row.item != it:
+                del self._row_pool[wid]
+                row.deleteLater()
+        _discard_rows(self.list_layout, keep=set(self._row_pool.values()))
 
         query = (self.search_input.text() or "").strip().lower()
 
@@ -415,10 +645,8 @@ class StudentWorksheetListScreen(WorksheetListScreen):
         for it in self._items:
             if not self._grade_match(it.grade):
                 continue
-            if query:
-                hay = f"{it.grade} {it.type_text} {it.title} {it.date} {it.teacher}".lower()
-                if query not in hay:
-                    continue
+            if query and query not in getattr(it, "search_hay", ""):
+                continue
             visible_items.append(it)
 
         self._visible_ids = [it.id for it in visible_items]
@@ -433,13 +661,25 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             self._sync_action_bar_state()
             return
 
+        # Row 생성/갱신 중 선택 변경이 끼어들어도 루프는 시작 시점 선택 상태 기준
+        selected = frozenset(self._selected_ids)
+        rows = []
         for it in visible_items:
-            row = StudentStudySheetRow(it, selected=it.id in self._selected_ids)
-            row.selected_changed.connect(self._on_row_selected_changed)
-            row.download_requested.connect(self._on_row_download_requested)
-            row.grade_requested.connect(self._on_grade_requested)
-            row.wrongnote_requested.connect(self._on_wrongnote_requested)
-            self.list_layout.insertWidget(self.list_layout.count() - 1, row)
+            row = self._row_pool.get(it.id)
+            if row is None:
+                row = StudentStudySheetRow(it, selected=it.id in selected)
+                row.selected_changed.connect(self._on_row_selected_changed)
+                row.download_requested.connect(self._on_row_download_requested)
+                row.grade_requested.connect(self._on_grade_requested)
+                row.wrongnote_requested.connect(self._on_wrongnote_requested)
+                self._row_pool[it.id] = row
+            else:
+                row.update_from_item(it)
+                row.set_selected(it.id in selected)
+            rows.append(row)
+        for i, row in enumerate(rows):
+            self.list_layout.insertWidget(i, row)
+            row.show()
 
         self._sync_action_bar_state()
 
@@ -451,8 +691,7 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             show_warning(self, "채점", "학생 정보(student_id)가 없습니다.")
             return
 
-        ws_repo = WorksheetRepository(self.db_connection)
-        ws = ws_repo.find_by_id(worksheet_id)
+        ws = self.ws_repo.find_by_id(worksheet_id)
         if not ws:
             show_warning(self, "채점", "학습지 정보를 찾을 수 없습니다.")
             return
@@ -463,20 +702,13 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             numbered = [{"no": i + 1, "problem_id": pid} for i, pid in enumerate(list(ws.problem_ids or []))]
 
         # 문제 로드(단원 통계)
-        pids = [str(x.get("problem_id") or "").strip() for x in numbered if str(x.get("problem_id") or "").strip()]
-        probs_by_id: Dict[str, object] = {}
-        try:
-            pr = ProblemRepository(self.db_connection)
-            probs = pr.list_by_ids(pids)
-            probs_by_id = {str(p.id): p for p in probs if p and p.id}
-        except Exception:
-            probs_by_id = {}
+        pids = [pid for pid in (_strip_str(x.get("problem_id")) for x in numbered) if pid]
+        probs_by_id = _problems_by_ids(self._problem_repo, self._problems_cache, pids)
 
         # 기존 채점 결과(있으면 prefill)
         existing: Dict[int, bool] = {}
         try:
-            ar = WorksheetAssignmentRepository(self.db_connection)
-            doc = ar.find_one(worksheet_id=worksheet_id, student_id=self.student_id)
+            doc = _assignment_doc(self.assign_repo, self._assign_by_wid, self.student_id, worksheet_id)
             if doc and isinstance(doc.get("answers"), list):
                 for a in doc.get("answers") or []:
                     try:
@@ -505,8 +737,7 @@ class StudentWorksheetListScreen(WorksheetListScreen):
 
         ok = False
         try:
-            ar = WorksheetAssignmentRepository(self.db_connection)
-            ok = ar.save_grading(
+            ok = self.assign_repo.save_grading(
                 worksheet_id=worksheet_id,
                 student_id=self.student_id,
                 total_questions=total_q,
@@ -522,10 +753,32 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             show_warning(self, "채점", "채점 결과 저장에 실패했습니다.")
             return
 
+        self._assign_by_wid.pop(worksheet_id, None)
         show_info(self, "채점 완료", f"{total_q}개 중 {correct}개 정답으로 저장했습니다.")
-        self.reload_from_db()
+        self._patch_graded_item(worksheet_id, total_q, correct, answers)
         self.grading_saved.emit(worksheet_id)
 
+    def _patch_graded_item(self, worksheet_id: str, total_q: int, correct: int, answers: list) -> None:
+        """채점 저장 후 목록 전체를 다시 읽지 않고 해당 item/Row의 채점 표시만 갱신."""
+        it = next((x for x in self._items if x.id == worksheet_id), None)
+        if it is None:
+            self.reload_from_db()
+            return
+        is_graded = total_q > 0
+        setattr(it, "is_graded", is_graded)
+        # save_grading과 같은 기준(문제ID가 있는 오답 수)
+        wrong = sum(
+            1
+            for a in answers
+            if isinstance(a, dict) and _strip_str(a.get("problem_id")) and not bool(a.get("is_correct"))
+        )
+        setattr(it, "wrong_count", wrong)
+        if is_graded:
+            setattr(it, "graded_summary", f"{correct}/{total_q}")
+        row = self._row_pool.get(worksheet_id)
+        if row is not None:
+            row.update_from_item(it)
+
     def _on_wrongnote_requested(self, worksheet_id: str) -> None:
         if not self.db_connection or not self.db_connection.is_connected():
             show_warning(self, "오답노트", "DB에 연결할 수 없습니다.")
@@ -535,8 +788,8 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             return
 
         # 출제 문서 확인(채점 여부/오답 여부)
-        ar = WorksheetAssignmentRepository(self.db_connection)
-        doc = ar.find_one(worksheet_id=worksheet_id, student_id=self.student_id)
+        ar = self.assign_repo
+        doc = _assignment_doc(ar, self._assign_by_wid, self.student_id, worksheet_id)
         if not doc:
             show_warning(self, "오답노트", "출제 정보를 찾을 수 없습니다.")
             return
@@ -544,67 +797,29 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             show_warning(self, "오답노트", "채점이 완료된 학습지에서만 오답노트를 생성할 수 있습니다.")
             return
 
-        wrong_ids = [str(x).strip() for x in (doc.get("wrong_problem_ids") or []) if str(x).strip()]
+        wrong_ids = [pid for pid in map(_strip_str, doc.get("wrong_problem_ids") or []) if pid]
 
         # ✅ 레거시 채점 데이터 보정:
         # 과거 채점 기록에는 wrong_problem_ids가 없을 수 있으므로, answers + worksheet.numbered로 복구합니다.
         if not wrong_ids:
-            ws_repo = WorksheetRepository(self.db_connection)
-            ws = ws_repo.find_by_id(worksheet_id)
+            ws = self.ws_repo.find_by_id(worksheet_id)
             if ws:
-                no_to_pid = _build_no_to_pid(list(ws.numbered or []))
-                # numbered가 비어있으면 problem_ids로 매핑
-                if not no_to_pid and getattr(ws, "problem_ids", None):
-                    try:
-                        for i, pid in enumerate(list(ws.problem_ids or []), start=1):
-                            pid2 = str(pid or "").strip()
-                            if pid2:
-                                no_to_pid[i] = pid2
-                    except Exception:
-                        pass
-
-                recovered: List[str] = []
-                for a in (doc.get("answers") or []):
-                    if not isinstance(a, dict):
-                        continue
-                    try:
-                        is_correct = a.get("is_correct")
-                        # is_correct가 문자열로 저장된 레거시도 방어
-                        if isinstance(is_correct, str):
-                            ic = is_correct.strip().lower()
-                            is_correct = ic in ("true", "1", "o", "ok", "yes")
-                        if bool(is_correct):
-                            continue  # 정답이면 스킵
-                        no = int(a.get("no"))
-                    except Exception:
-                        continue
-                    pid = str(a.get("problem_id") or "").strip()
-                    if not pid:
-                        pid = str(no_to_pid.get(no, "") or "").strip()
-                    if pid:
-                        recovered.append(pid)
-
-                # 중복 제거(순서 유지)
-                seen: Set[str] = set()
-                wrong_ids = []
-                for pid in recovered:
-                    if pid in seen:
-                        continue
-                    seen.add(pid)
-                    wrong_ids.append(pid)
+                no_to_pid = _no_to_pid_from_worksheet(ws)
+                # 틀린 답의 문제ID(answer의 problem_id 우선, 없으면 번호로 매핑) → 중복 제거(순서 유지)
+                wrong_ids = list(dict.fromkeys(_wrong_pids_from_answers(doc.get("answers") or [], no_to_pid)))
 
                 if wrong_ids:
                     try:
                         ar.set_wrong_info(worksheet_id=worksheet_id, student_id=self.student_id, wrong_problem_ids=wrong_ids)
                     except Exception:
                         pass
+                    self._assign_by_wid.pop(worksheet_id, None)
 
         if not wrong_ids:
             show_info(self, "오답노트", "틀린 문항이 없습니다. (오답노트 생성 불필요)")
             return
 
-        ws_repo = WorksheetRepository(self.db_connection)
-        ws = ws_repo.find_by_id(worksheet_id)
+        ws = self.ws_repo.find_by_id(worksheet_id)
         if not ws:
             show_warning(self, "오답노트", "학습지 정보를 찾을 수 없습니다.")
             return
@@ -627,30 +842,65 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             self.wrongnote_ready.emit(worksheet_id)
             return
 
-        # HWP 재조합 후 캐시에 저장
-        composer = WorksheetHwpComposer(self.db_connection)
-        try:
-            composer.compose(
-                problem_ids=list(wrong_ids),
-                output_path=cache_path,
-                title=title,
-                teacher=(ws.creator or "").strip(),
-                date_str=date_str,
-            )
-        except WorksheetComposeError as e:
-            show_warning(self, "오답노트", f"HWP 생성에 실패했습니다.\n\n{e}")
+        # HWP 재조합 후 캐시에 저장(한글 자동화가 수 초 걸리므로 워커 스레드에서)
+        if self._compose_task is not None:
+            show_info(self, "오답노트", "다른 오답노트를 생성하는 중입니다. 잠시 후 다시 시도해 주세요.")
             return
-        except Exception as e:
-            show_warning(self, "오답노트", f"HWP 생성 중 오류가 발생했습니다.\n\n{e}")
+        task = _WrongNoteComposeTask(
+            self.db_connection,
+            student_id=self.student_id,
+            worksheet_id=worksheet_id,
+            problem_ids=list(wrong_ids),
+            output_path=cache_path,
+            title=title,
+            teacher=(ws.creator or "").strip(),
+            date_str=date_str,
+            already_enabled=already_enabled,
+        )
+        task.signals.finished.connect(self._on_wrongnote_composed)
+        task.signals.failed.connect(self._on_wrongnote_compose_failed)
+        self._compose_task = task
+        row = self._row_pool.get(worksheet_id)
+        if row is not None:
+            row.btn_wrong.setEnabled(False)
+            row.btn_wrong.setText("생성 중...")
+        QThreadPool.globalInstance().start(task)
+
+    def _end_compose(self, worksheet_id: str) -> Optional["_WrongNoteComposeTask"]:
+        task = self._compose_task
+        self._compose_task = None
+        # 생성 중 표시했던 버튼을 item 상태대로 복구
+        row = self._row_pool.get(worksheet_id)
+        if row is not None:
+            row.update_from_item(row.item)
+        return task
+
+    def _on_wrongnote_compose_failed(self, worksheet_id: str, message: str) -> None:
+        task = self._end_compose(worksheet_id)
+        if task is not None and task.student_id != self.student_id:
+            # 그 사이 다른 학생으로 바뀜 → 이전 학생의 결과는 표시하지 않음
             return
+        show_warning(self, "오답노트", message)
 
-        if not already_enabled:
-            ok = ar.enable_wrongnote(worksheet_id=worksheet_id, student_id=self.student_id, title=title)
+    def _on_wrongnote_composed(self, worksheet_id: str, template_missing: bool) -> None:
+        task = self._end_compose(worksheet_id)
+        if task is None:
+            return
+        current = task.student_id == self.student_id
+        if not task.already_enabled:
+            # 캐시 HWP는 요청한 학생 기준으로 만들어졌으므로 활성화도 그 학생에게
+            ok = self.assign_repo.enable_wrongnote(worksheet_id=worksheet_id, student_id=task.student_id, title=task.title)
+            if current:
+                self._assign_by_wid.pop(worksheet_id, None)
             if not ok:
-                show_warning(self, "오답노트", "오답노트 활성화에 실패했습니다.")
+                if current:
+                    show_warning(self, "오답노트", "오답노트 활성화에 실패했습니다.")
                 return
+        if not current:
+            # 그 사이 다른 학생으로 바뀜 → 현재 화면에는 반영하지 않음
+            return
 
-        if getattr(composer, "_template_missing", False):
+        if template_missing:
             show_info(
                 self,
                 "오답노트",
@@ -660,7 +910,8 @@ class StudentWorksheetListScreen(WorksheetListScreen):
             )
         else:
             show_info(self, "오답노트", "오답노트를 생성했습니다. 오답노트 탭에서 HWP/PDF를 다운로드할 수 있습니다.")
-        self.reload_from_db()
+        # 목록 재구성은 현재 이벤트(다이얼로그 닫힘 등) 처리가 끝난 뒤에
+        QTimer.singleShot(0, self.reload_from_db)
         self.wrongnote_ready.emit(worksheet_id)
 
 
@@ -677,6 +928,12 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
     ):
         self.student_id = (student_id or "").strip()
         self.student_name = (student_name or "").strip()
+        # 채점 다이얼로그용 문항 저장소(클릭마다 새로 만들지 않음; ws_repo/assign_repo는 부모가 보관)
+        self._problem_repo: Optional[ProblemRepository] = ProblemRepository(db_connection) if db_connection else None
+        # problem_id → Problem(채점 다이얼로그를 다시 열 때 DB 재조회 생략, StudentPage.reload 때 비움)
+        self._problems_cache: Dict[str, object] = {}
+        # worksheet_id → 출제 문서(reload_from_db에서 받은 목록. 저장/변경 시 해당 항목 제거)
+        self._assign_by_wid: Dict[str, dict] = {}
         super().__init__(db_connection, parent=parent)
 
         # 오답노트 탭에서는 상단 생성/출제/삭제는 숨김
@@ -705,6 +962,8 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
         except Exception:
             pass
 
+        self._search_timer = _install_search_debounce(self)
+
         self.reload_from_db()
 
     def reload_from_db(self) -> None:
@@ -713,9 +972,10 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
             self.refresh_list()
             return
 
-        ar = WorksheetAssignmentRepository(self.db_connection)
-        assigns = ar.list_wrongnotes_for_student(self.student_id)
-        ws_ids = [str(a.get("worksheet_id") or "").strip() for a in assigns if str(a.get("worksheet_id") or "").strip()]
+        assigns = self.assign_repo.list_wrongnotes_for_student(self.student_id)
+        wids = [_strip_str(a.get("worksheet_id")) for a in assigns]
+        self._assign_by_wid = {wid: a for wid, a in zip(wids, assigns) if wid}
+        ws_ids = [wid for wid in wids if wid]
         if not ws_ids:
             self.refresh_list()
             return
@@ -723,12 +983,12 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
         worksheets = self.ws_repo.list_by_ids(ws_ids)
         by_id: Dict[str, Worksheet] = {str(w.id): w for w in worksheets if w and w.id}
 
+        # (출제, 학습지) 쌍을 한 번만 묶고 수업준비-학습지와 동일하게 학습지 생성일(created_at) 최신순 정렬
+        paired = [(wid, a, by_id[wid]) for wid, a in zip(wids, assigns) if wid in by_id]
+        paired.sort(key=lambda p: p[2].created_at or datetime.min, reverse=True)
+
         items = []
-        for a in assigns:
-            wid = str(a.get("worksheet_id") or "").strip()
-            ws = by_id.get(wid)
-            if not ws:
-                continue
+        for wid, a, ws in paired:
             dt = ws.created_at
             date_str = dt.strftime("%Y.%m.%d") if dt else ""
             title = (a.get("wrongnote_title") or "").strip() or f"{(ws.title or '').strip()}-{self.student_name}-오답"
@@ -764,34 +1024,32 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
                 if wc > 0:
                     setattr(it, "graded_summary", f"오답 {wc}")
 
-            wc = int(a.get("wrong_count") or 0)
+            # 검색용 소문자 문자열(입력할 때마다 Row별로 다시 만들지 않도록 로드 시 1회)
+            setattr(it, "search_hay", f"{it.grade} {it.type_text} {it.title} {it.date} {it.teacher}".lower())
             items.append(it)
 
-        # 수업준비-학습지와 동일: 학습지 생성일(created_at) 최신순
-        items.sort(
-            key=lambda it: (getattr(by_id.get(it.id), "created_at", None) or datetime.min),
-            reverse=True,
-        )
         self._items = items
         self.refresh_list()
 
     def refresh_list(self) -> None:
-        # 오답노트 탭: Row에 "채점" 버튼을 추가로 붙임
-        while self.list_layout.count() > 1:
-            it = self.list_layout.takeAt(0)
-            w = it.widget()
-            if w is not None:
-                w.setParent(None)
+        # 오답노트 탭: Row에 "채점" 버튼을 추가로 붙임(재구성 동안 화면 갱신 중지 → 끝에서 1회)
+        self.list_container.setUpdatesEnabled(False)
+        try:
+            self._rebuild_rows()
+        finally:
+            self.list_container.setUpdatesEnabled(True)
+            self.list_container.update()
+
+    def _rebuild_rows(self) -> None:
+        _discard_rows(self.list_layout)
 
         query = (self.search_input.text() or "").strip().lower()
         visible_items = []
         for it in self._items:
             if not self._grade_match(it.grade):
                 continue
-            if query:
-                hay = f"{it.grade} {it.type_text} {it.title} {it.date} {it.teacher}".lower()
-                if query not in hay:
-                    continue
+            if query and query not in getattr(it, "search_hay", ""):
+                continue
             visible_items.append(it)
 
         self._visible_ids = [it.id for it in visible_items]
@@ -806,12 +1064,17 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
             self._sync_action_bar_state()
             return
 
+        # Row 생성 중 선택 변경이 끼어들어도 루프는 시작 시점 선택 상태 기준
+        selected = frozenset(self._selected_ids)
+        rows = []
         for it in visible_items:
-            row = WrongNoteRow(it, selected=it.id in self._selected_ids)
+            row = WrongNoteRow(it, selected=it.id in selected)
             row.selected_changed.connect(self._on_row_selected_changed)
             row.download_requested.connect(self._on_wrongnote_download_requested)
             row.grade_requested.connect(self._on_wrongnote_grade_requested)
-            self.list_layout.insertWidget(self.list_layout.count() - 1, row)
+            rows.append(row)
+        for i, row in enumerate(rows):
+            self.list_layout.insertWidget(i, row)
 
         self._sync_action_bar_state()
 
@@ -823,15 +1086,14 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
             show_warning(self, "채점", "학생 정보(student_id)가 없습니다.")
             return
 
-        ar = WorksheetAssignmentRepository(self.db_connection)
-        doc = ar.find_one(worksheet_id=worksheet_id, student_id=self.student_id) or {}
-        wrong_ids = [str(x).strip() for x in (doc.get("wrong_problem_ids") or []) if str(x).strip()]
+        ar = self.assign_repo
+        doc = _assignment_doc(ar, self._assign_by_wid, self.student_id, worksheet_id) or {}
+        wrong_ids = [pid for pid in map(_strip_str, doc.get("wrong_problem_ids") or []) if pid]
         if not wrong_ids:
             show_warning(self, "채점", "오답노트 문항이 없습니다.")
             return
 
-        ws_repo = WorksheetRepository(self.db_connection)
-        base_ws = ws_repo.find_by_id(worksheet_id)
+        base_ws = self.ws_repo.find_by_id(worksheet_id)
         if not base_ws:
             show_warning(self, "채점", "학습지 정보를 찾을 수 없습니다.")
             return
@@ -840,13 +1102,7 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
 
         numbered = [{"no": i + 1, "problem_id": pid} for i, pid in enumerate(wrong_ids)]
         # 문제 로드(단원 통계)
-        probs_by_id: Dict[str, object] = {}
-        try:
-            pr = ProblemRepository(self.db_connection)
-            probs = pr.list_by_ids(list(wrong_ids))
-            probs_by_id = {str(p.id): p for p in probs if p and p.id}
-        except Exception:
-            probs_by_id = {}
+        probs_by_id = _problems_by_ids(self._problem_repo, self._problems_cache, wrong_ids)
 
         # 기존 오답노트 채점 결과(있으면 prefill)
         existing: Dict[int, bool] = {}
@@ -904,7 +1160,8 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
             return
 
         show_info(self, "채점 완료", f"{total_q}개 중 {correct}개 정답으로 저장했습니다.")
-        self.reload_from_db()
+        # 목록 재구성은 현재 이벤트(다이얼로그 닫힘 등) 처리가 끝난 뒤에
+        QTimer.singleShot(0, self.reload_from_db)
 
     def _on_wrongnote_download_requested(self, worksheet_id: str, kind: str) -> None:
         """
@@ -926,10 +1183,8 @@ class StudentWrongNoteListScreen(WorksheetListScreen):
             )
             return
 
-        ar = WorksheetAssignmentRepository(self.db_connection)
-        doc = ar.find_one(worksheet_id=worksheet_id, student_id=self.student_id) or {}
-        ws_repo = WorksheetRepository(self.db_connection)
-        ws = ws_repo.find_by_id(worksheet_id)
+        doc = _assignment_doc(self.assign_repo, self._assign_by_wid, self.student_id, worksheet_id) or {}
+        ws = self.ws_repo.find_by_id(worksheet_id)
         title = (doc.get("wrongnote_title") or "").strip()
         if ws:
             title = title or f"{(ws.title or '').strip()}-{self.student_name}-오답"
@@ -1033,41 +1288,14 @@ class WrongNoteRow(CompactStudySheetRow):
         self.btn_grade.setCursor(Qt.PointingHandCursor)
         self.btn_grade.setFixedSize(56, 26)
         self.btn_grade.setFont(_font(8, bold=True))
-        self.btn_grade.clicked.connect(lambda _=False: self.grade_requested.emit(self.item.id))
-        self.btn_grade.setStyleSheet(
-            """
-            QPushButton#GradeBtn {
-                padding: 0px;
-                margin: 0px;
-                background: #2563EB;
-                border: 1.5px solid #1D4ED8;
-                color: #FFFFFF;
-                font-weight: 800;
-                font-size: 9pt;
-                border-radius: 6px;
-            }
-            QPushButton#GradeBtn:hover {
-                background: #1D4ED8;
-                border-color: #1E40AF;
-            }
-            """
-        )
+        self.btn_grade.clicked.connect(self._emit_grade)
+        self.btn_grade.setStyleSheet(_GRADE_BTN_QSS)
 
         # 점수 배지(있으면 표시)
         self.score_badge = QLabel("")
         self.score_badge.setObjectName("ScoreBadge")
         self.score_badge.setFont(_font(8, bold=True))
-        self.score_badge.setStyleSheet(
-            """
-            QLabel#ScoreBadge {
-                background: #F1F5F9;
-                color: #0F172A;
-                border: 1px solid #E2E8F0;
-                border-radius: 6px;
-                padding: 2px 8px;
-            }
-            """
-        )
+        self.score_badge.setStyleSheet(_WRONGNOTE_SCORE_BADGE_QSS)
         summary = getattr(item, "graded_summary", "") or ""
         if summary:
             self.score_badge.setText(summary)
@@ -1088,6 +1316,9 @@ class WrongNoteRow(CompactStudySheetRow):
                 except Exception:
                     pass
 
+    def _emit_grade(self) -> None:
+        self.grade_requested.emit(self.item.id)
+
 
 # ----- 보고서 탭 -----
 
@@ -1507,7 +1738,8 @@ class ReportDetailModal(QDialog):
 
     def _on_pdf(self) -> None:
         """PDF 버튼 클릭 시 먼저 '저장/열기/취소' 모달을 띄운 뒤, 선택에 따라 저장 또는 열기."""
-        if not _HAS_QPRINTER:
+        QPrinter = _load_qprinter()
+        if QPrinter is None:
             show_warning(self, "PDF", "PDF 출력을 위해 PyQt5.QtPrintSupport가 필요합니다.")
             return
         choice = StandardActionDialog(
@@ -1881,7 +2113,7 @@ def _report_textbook_section(snapshot: dict, parent: Optional[QWidget] = None) -
     textbook_stats = list(snapshot.get("textbook_stats") or [])
     if not textbook_stats and snapshot.get("source_stats"):
         for item in snapshot.get("source_stats") or []:
-            if str(item.get("category") or "").strip() != "기출":
+            if _strip_str(item.get("category")) != "기출":
                 textbook_stats.append({
                     "name": item.get("name"),
                     "correct": item.get("correct"),
@@ -1952,7 +2184,7 @@ def _report_exam_section(snapshot: dict, parent: Optional[QWidget] = None) -> QW
     exam_stats = list(snapshot.get("exam_stats") or [])
     if not exam_stats and snapshot.get("source_stats"):
         for item in snapshot.get("source_stats") or []:
-            if str(item.get("category") or "").strip() == "기출":
+            if _strip_str(item.get("category")) == "기출":
                 exam_stats.append({
                     "name": item.get("name"),
                     "correct": item.get("correct"),
@@ -1999,7 +2231,8 @@ def _report_radar_widget(unit_stats: List[Dict], parent: Optional[QWidget] = Non
     wrap.setMinimumHeight(300)
     lay = QVBoxLayout(wrap)
     lay.setContentsMargins(30, 30, 30, 30)
-    if not _HAS_MATPLOTLIB or not unit_stats:
+    mpl = _load_matplotlib() if unit_stats else None
+    if mpl is None:
         lbl = QLabel("종합 학습 분석\n(데이터 없음)" if not unit_stats else "종합 학습 분석")
         lbl.setAlignment(Qt.AlignCenter)
         lbl.setStyleSheet("font-size: 12pt; color: #222222; border: none; background: transparent;")
@@ -2016,6 +2249,7 @@ def _report_radar_widget(unit_stats: List[Dict], parent: Optional[QWidget] = Non
     angles = [2 * math.pi * i / n - math.pi / 2 for i in range(n)]
     values_c = values + values[:1]
     angles_c = angles + angles[:1]
+    Figure, FigureCanvasQTAgg = mpl
     fig = Figure(figsize=(2.5, 2.5), facecolor="none")
     ax = fig.add_subplot(111, polar=True)
     ax.set_facecolor("none")
@@ -2518,8 +2752,40 @@ class StudentPage(QWidget):
         self.student_grade = (student_grade or "").strip()
 
         self._stack: Optional[QStackedWidget] = None
+        self._name_label: Optional[QLabel] = None
+        self._meta_label: Optional[QLabel] = None
         self._build_ui()
 
+    def update_student(self, *, student_id: str, student_name: str, student_grade: str) -> None:
+        """페이지를 다시 만들지 않고 표시 대상 학생만 교체합니다."""
+        self.student_id = (student_id or "").strip()
+        self.student_name = (student_name or "").strip()
+        self.student_grade = (student_grade or "").strip()
+        if self._name_label is not None:
+            self._name_label.setText(self.student_name or "학생")
+        if self._meta_label is not None:
+            self._meta_label.setText(self.student_grade)
+        for screen in (self._ws_screen, self._wrong_screen, self._report_screen):
+            screen.student_id = self.student_id
+            screen.student_name = self.student_name
+        self._ws_screen.student_grade = self.student_grade
+        self.reload()
+
+    def reload(self) -> None:
+        """현재 학생 기준으로 모든 탭을 다시 로드하고 학습지 탭으로 돌아갑니다."""
+        # 이전 학생의 검색어/선택 상태는 유지하지 않음
+        for screen in (self._ws_screen, self._wrong_screen):
+            screen.search_input.blockSignals(True)
+            screen.search_input.clear()
+            screen.search_input.blockSignals(False)
+            screen._selected_ids.clear()
+            screen._problems_cache.clear()
+            screen.reload_from_db()
+        self._report_screen._show_list()
+        self.btn_ws.setChecked(True)
+        if self._stack is not None:
+            self._stack.setCurrentIndex(0)
+
     def _build_ui(self) -> None:
         self.setObjectName("StudentPageRoot")
         self.setAutoFillBackground(True)
@@ -2582,11 +2848,13 @@ class StudentPage(QWidget):
         name.setObjectName("StudentName")
         name.setFont(_font(14, extra_bold=True))
         top.addWidget(name, alignment=Qt.AlignVCenter)
+        self._name_label = name
 
         meta = QLabel(self.student_grade)
         meta.setObjectName("StudentMeta")
         meta.setFont(_font(10, bold=True))
         top.addWidget(meta, alignment=Qt.AlignVCenter)
+        self._meta_label = meta
 
         top.addStretch(1)
         root.addLayout(top)
@@ -2622,8 +2890,9 @@ class StudentPage(QWidget):
             student_name=self.student_name,
             student_grade=self.student_grade,
         )
-        self._ws_screen.grading_saved.connect(self._on_grading_saved)
-        self._ws_screen.wrongnote_ready.connect(self._open_wrongnote_tab)
+        # 다른 탭 목록 재로드는 보낸 쪽 처리가 끝난 다음 이벤트 루프에서(중첩 재구성 방지)
+        self._ws_screen.grading_saved.connect(self._on_grading_saved, Qt.QueuedConnection)
+        self._ws_screen.wrongnote_ready.connect(self._open_wrongnote_tab, Qt.QueuedConnection)
         self._stack.addWidget(self._ws_screen)
 
         # 2) 오답노트 탭(생성된 오답노트만 표시)
@@ -3,7 +3,7 @@
 
 교재 메타데이터 관리 및 파싱 결과 조회 화면
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Dict, Any
 
 from PyQt5.QtWidgets import (
     QWidget,
@@ -39,6 +39,10 @@ from utils.hwp_restore import HWPRestore
 from processors.hwp.hwp_reader import HWPNotInstalledError, HWPInitializationError
 
 
+# 이 길이(글자 수) 이하의 미리보기는 셀에 다 보이므로 툴팁을 만들지 않음
+_PREVIEW_TOOLTIP_MIN = 60
+
+
 class TextbookDBScreen(QWidget):
     """교재DB 화면"""
     
@@ -226,6 +230,8 @@ class TextbookDBScreen(QWidget):
 
         # 셀 위젯(난이도 콤보) 선택 배경 동기화용
         self._problem_cell_widgets = {}
+        # 행 → 난이도 콤보(단축키 처리 시 cellWidget/findChild 탐색 생략)
+        self._problem_combos: Dict[int, QComboBox] = {}
         self.problem_table.selectionModel().selectionChanged.connect(self.on_problem_selection_changed)
         
         # Problem 행 더블클릭 시 상세 보기
@@ -451,6 +457,8 @@ class TextbookDBScreen(QWidget):
             filtered.append(tb)
 
         self.table.setRowCount(len(filtered))
+        # 행마다 QFont를 새로 만들지 않도록 1회만 생성해 공유
+        more_font = QFont("맑은 고딕", 14, QFont.Bold)
             
         for row, textbook in enumerate(filtered):
                 # 출처
@@ -520,7 +528,7 @@ class TextbookDBScreen(QWidget):
                 btn_more = QPushButton("⋯")
                 btn_more.setMinimumWidth(40)
                 btn_more.setMinimumHeight(28)
-                btn_more.setFont(QFont("맑은 고딕", 14, QFont.Bold))
+                btn_more.setFont(more_font)
                 btn_more.setStyleSheet("""
                     QPushButton {
                         background-color: transparent;
@@ -680,6 +688,8 @@ class TextbookDBScreen(QWidget):
             
             self.problem_table.setRowCount(len(problems))
             self._problem_cell_widgets = {}
+            self._problem_combos = {}
+            combo_font = QFont("맑은 고딕", 9)
             
             for row, problem in enumerate(problems):
                 # 문제 번호
@@ -692,16 +702,12 @@ class TextbookDBScreen(QWidget):
                 self.problem_table.setItem(row, 0, item)
                 
                 # 미리보기
-                preview = problem.get('content_text_preview', '')
-                if isinstance(preview, list):
-                    preview = ' '.join(str(x) for x in preview) if preview else ''
-                elif preview is None:
-                    preview = ''
-                preview_text = str(preview)
+                # get_problems_by_source가 항상 압축된 str로 돌려줌
+                preview_text = problem.get('content_text_preview') or ''
                 item = QTableWidgetItem(preview_text)
                 item.setTextAlignment(Qt.AlignLeft)
-                # 툴팁으로 전체 텍스트 확인 가능
-                if preview_text:
+                # 툴팁으로 전체 텍스트 확인 가능(셀에 다 보이는 짧은 미리보기는 생략)
+                if len(preview_text) > _PREVIEW_TOOLTIP_MIN:
                     item.setToolTip(preview_text)
                 self.problem_table.setItem(row, 1, item)
                 
@@ -710,7 +716,7 @@ class TextbookDBScreen(QWidget):
                 combo = QComboBox()
                 combo.setObjectName("DifficultyCombo")
                 combo.addItems(["미지정", "하", "중", "상", "킬"])
-                combo.setFont(QFont("맑은 고딕", 9))
+                combo.setFont(combo_font)
                 combo.setFixedWidth(50)
                 combo.setMinimumHeight(24)
                 try:
@@ -737,6 +743,7 @@ class TextbookDBScreen(QWidget):
                 wrapper.setLayout(w_layout)
                 self.problem_table.setCellWidget(row, 2, wrapper)
                 self._problem_cell_widgets[row] = {2: wrapper}
+                self._problem_combos[row] = combo
                 
                 # 원본
                 has_raw = problem.get('has_content_raw', False)
@@ -850,15 +857,7 @@ class TextbookDBScreen(QWidget):
                 selected = self.problem_table.selectionModel().selectedRows()
                 if selected:
                     row = selected[0].row()
-                    widget = self.problem_table.cellWidget(row, 2)
-                    combo: Optional[QComboBox] = None
-                    if isinstance(widget, QComboBox):
-                        combo = widget
-                    elif isinstance(widget, QWidget):
-                        try:
-                            combo = widget.findChild(QComboBox)
-                        except Exception:
-                            combo = None
+                    combo = self._problem_combos.get(row)
                     if combo is not None:
                         combo.setCurrentText(mapping[key])
                         # 다음 행 자동 이동(필터로 인해 행이 재정렬/삭제될 수 있으니, 단순히 +1만 시도)
@@ -12,6 +12,7 @@ from __future__ import annotations
 import os
 import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Set
 
 from PyQt5.QtCore import Qt, pyqtSignal
@@ -70,8 +71,9 @@ def _qta_pixmap(icon_name: str, color: str, size: int) -> Optional[QPixmap]:
         return None
 
 
+@lru_cache(maxsize=None)
 def _fallback_search_pixmap(color_hex: str = "#475569", size: int = 16) -> QPixmap:
-    """qtawesome 미설치 환경에서도 쓰는 돋보기 픽스맵."""
+    """qtawesome 미설치 환경에서도 쓰는 돋보기 픽스맵. (색, 크기)당 한 번만 그리고 재사용."""
     from PyQt5.QtGui import QPainter, QPen, QColor
 
     pm = QPixmap(size, size)